@@ -29,7 +29,9 @@ class LavalinkCacheFetchResult:
         if isinstance(self.last_updated, int):
             self.updated_on: datetime.datetime = datetime.datetime.fromtimestamp(self.last_updated)
 
+        self.data_size: int = 0
         if isinstance(self.query, str):
+            self.data_size = len(self.query)
             self.query = json.loads(self.query)
 
 
@@ -51,11 +53,15 @@ class PlaylistFetchResult:
     scope_id: int
     author_id: int
     playlist_url: Optional[str] = None
-    tracks: List[MutableMapping] = field(default_factory=lambda: [])
+    track_count: int = 0
+    # None when only the playlist's metadata was fetched
+    tracks: Optional[List[MutableMapping]] = None
 
     def __post_init__(self):
         if isinstance(self.tracks, str):
             self.tracks = json.loads(self.tracks)
+        if self.tracks is not None:
+            self.track_count = len(self.tracks)
 
 
 @dataclass
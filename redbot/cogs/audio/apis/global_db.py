@@ -1,6 +1,5 @@
 import asyncio
 import contextlib
-import json
 
 from copy import copy
 from pathlib import Path
@@ -16,6 +15,7 @@ from redbot.core.commands import Cog
 from redbot.core.i18n import Translator
 
 from ..audio_dataclasses import Query
+from .http_client import AudioHTTPClient
 
 if TYPE_CHECKING:
     from .. import Audio
@@ -27,12 +27,12 @@ log = getLogger("red.cogs.Audio.api.GlobalDB")
 
 class GlobalCacheWrapper:
     def __init__(
-        self, bot: Red, config: Config, session: aiohttp.ClientSession, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, http_client: AudioHTTPClient, cog: Union["Audio", Cog]
     ):
         # Place Holder for the Global Cache PR
         self.bot = bot
         self.config = config
-        self.session = session
+        self.http_client = http_client
         self.api_key = None
         self._handshake_token = ""
         self.has_api_key = None
@@ -68,19 +68,13 @@ class GlobalCacheWrapper:
             search_response = "error"
             query = query.lavalink_query
             with contextlib.suppress(aiohttp.ContentTypeError, asyncio.TimeoutError):
-                async with self.session.get(
+                search_response = await self.http_client.get_json(
+                    "audiodb",
                     api_url,
                     timeout=aiohttp.ClientTimeout(total=await self.config.global_db_get_timeout()),
                     headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
                     params={"query": query},
-                ) as r:
-                    search_response = await r.json(loads=json.loads)
-                    log.trace(
-                        "GET || Ping %s || Status code %s || %s",
-                        r.headers.get("x-process-time"),
-                        r.status,
-                        query,
-                    )
+                )
             if "tracks" not in search_response:
                 return {}
             return search_response
@@ -103,7 +97,9 @@ class GlobalCacheWrapper:
             if self.api_key is None:
                 return None
             api_url = f"{_API_URL}api/v2/queries"
-            async with self.session.post(
+            async with self.http_client.request(
+                "audiodb",
+                "POST",
                 api_url,
                 json=llresponse._raw,
                 headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
@@ -128,7 +124,9 @@ class GlobalCacheWrapper:
             return
         api_url = f"{_API_URL}api/v2/queries/es/id"
         with contextlib.suppress(Exception):
-            async with self.session.delete(
+            async with self.http_client.request(
+                "audiodb",
+                "DELETE",
                 api_url,
                 headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
                 params={"id": id},
@@ -143,15 +141,13 @@ class GlobalCacheWrapper:
         if (not is_enabled) or self.api_key is None:
             return global_api_user
         with contextlib.suppress(Exception):
-            async with aiohttp.ClientSession(json_serialize=json.dumps) as session:
-                async with session.get(
-                    f"{_API_URL}api/v2/users/me",
-                    headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
-                ) as resp:
-                    if resp.status == 200:
-                        search_response = await resp.json(loads=json.loads)
-                        global_api_user["fetched"] = True
-                        global_api_user["can_read"] = search_response.get("can_read", False)
-                        global_api_user["can_post"] = search_response.get("can_post", False)
-                        global_api_user["can_delete"] = search_response.get("can_delete", False)
+            search_response = await self.http_client.get_json(
+                "audiodb",
+                f"{_API_URL}api/v2/users/me",
+                headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
+            )
+            global_api_user["fetched"] = True
+            global_api_user["can_read"] = search_response.get("can_read", False)
+            global_api_user["can_post"] = search_response.get("can_post", False)
+            global_api_user["can_delete"] = search_response.get("can_delete", False)
         return global_api_user
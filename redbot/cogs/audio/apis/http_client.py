@@ -0,0 +1,177 @@
+import asyncio
+import contextlib
+import json
+import time
+from collections import defaultdict
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    Optional,
+    TypeVar,
+)
+
+import aiohttp
+from red_commons.logging import getLogger
+
+log = getLogger("red.cogs.Audio.api.HTTP")
+
+T = TypeVar("T")
+
+
+class EndpointStats:
+    """Latency statistics of the requests made to an endpoint."""
+
+    __slots__ = ("requests", "errors", "total_latency", "max_latency")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.requests if self.requests else 0.0
+
+    def record(self, latency: float) -> None:
+        self.requests += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+
+class _RateLimit:
+    """Holds back the requests to an API which told us to slow down."""
+
+    __slots__ = ("_blocked_until",)
+
+    def __init__(self):
+        self._blocked_until = 0.0
+
+    async def wait(self) -> None:
+        delay = self._blocked_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def block(self, seconds: float) -> None:
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+def _retry_after(response: aiohttp.ClientResponse) -> Optional[float]:
+    for header in ("Retry-After", "X-RateLimit-Reset-After"):
+        with contextlib.suppress(KeyError, ValueError):
+            return float(response.headers[header])
+    return None
+
+
+class AudioHTTPClient:
+    """The HTTP client shared by all of Audio's external API calls.
+
+    All requests go through the cog's single pooled session.
+    Concurrent identical lookups are coalesced into a single upstream request,
+    and an API responding with 429 has its requests held back for as long as it asks.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession):
+        self.session = session
+        #: Latency statistics per ``"<api> <METHOD> <endpoint>"``.
+        self.stats: Dict[str, EndpointStats] = defaultdict(EndpointStats)
+        self._rate_limits: Dict[str, _RateLimit] = defaultdict(_RateLimit)
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    @contextlib.asynccontextmanager
+    async def request(
+        self, api: str, method: str, url: str, *, endpoint: Optional[str] = None, **kwargs: Any
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Make a request to the given API, recording its latency.
+
+        Latency is recorded under ``endpoint``, the URL without its query string by default.
+        Other arguments are passed on to `aiohttp.ClientSession.request`.
+        """
+        rate_limit = self._rate_limits[api]
+        await rate_limit.wait()
+        if endpoint is None:
+            endpoint = url.split("?", 1)[0]
+        stats = self.stats[f"{api} {method} {endpoint}"]
+        start = time.perf_counter()
+        try:
+            async with self.session.request(method, url, **kwargs) as response:
+                latency = time.perf_counter() - start
+                stats.record(latency)
+                log.trace(
+                    "%s %s || Status code %s || %.3fs", method, url, response.status, latency
+                )
+                if response.status == 429:
+                    retry_after = _retry_after(response)
+                    if retry_after is not None:
+                        log.debug("%s is rate limited for %.2fs", api, retry_after)
+                        rate_limit.block(retry_after)
+                yield response
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            stats.errors += 1
+            raise
+
+    async def coalesce(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Await ``factory()``, sharing the result with concurrent calls made with the same key.
+
+        The result is shared by all callers, it must not be modified.
+        """
+        while True:
+            future = self._in_flight.get(key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # the call we were waiting on was cancelled, make our own
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        # callers which aren't waiting on it anymore don't need to hear about the exception
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._in_flight[key] = future
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
+
+    async def get_json(
+        self,
+        api: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """GET the given URL and decode its JSON response.
+
+        Concurrent requests for the same URL and params share a single upstream request,
+        and its result.
+
+        Raises
+        ------
+        aiohttp.ClientResponseError
+            The response has an error status.
+        """
+        key = ("GET", api, url, tuple(sorted(params.items())) if params else ())
+
+        async def get() -> Any:
+            async with self.request(api, "GET", url, params=params, **kwargs) as response:
+                response.raise_for_status()
+                return await response.json(loads=json.loads)
+
+        return await self.coalesce(key, get)
@@ -9,7 +9,6 @@ from collections import namedtuple
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, List, MutableMapping, Optional, Tuple, Union, cast
 
-import aiohttp
 import discord
 import lavalink
 from red_commons.logging import getLogger
@@ -20,13 +19,14 @@ from redbot.core.bot import Red
 from redbot.core.commands import Cog, Context
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.dbtools import APSWConnectionWrapper
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
 
 from ..audio_dataclasses import Query
 from ..errors import DatabaseError, TrackEnqueueError
 from ..utils import CacheLevel, Notifier
 from .api_utils import LavalinkCacheFetchForGlobalResult
 from .global_db import GlobalCacheWrapper
+from .http_client import AudioHTTPClient
 from .local_db import LocalCacheWrapper
 from .persist_queue_wrapper import QueueInterface
 from .playlist_interface import get_playlist
@@ -51,8 +51,8 @@ class AudioAPIInterface:
         self,
         bot: Red,
         config: Config,
-        session: aiohttp.ClientSession,
-        conn: APSWConnectionWrapper,
+        http_client: AudioHTTPClient,
+        conn: ThreadedAPSWConnection,
         cog: Union["Audio", Cog],
     ):
         self.bot = bot
@@ -60,9 +60,8 @@ class AudioAPIInterface:
         self.conn = conn
         self.cog = cog
         self.local_cache_api = LocalCacheWrapper(self.bot, self.config, self.conn, self.cog)
-        self.global_cache_api = GlobalCacheWrapper(self.bot, self.config, session, self.cog)
+        self.global_cache_api = GlobalCacheWrapper(self.bot, self.config, http_client, self.cog)
         self.persistent_queue_api = QueueInterface(self.bot, self.config, self.conn, self.cog)
-        self._session: aiohttp.ClientSession = session
         self._tasks: MutableMapping = {}
         self._lock: asyncio.Lock = asyncio.Lock()
 
@@ -70,10 +69,12 @@ class AudioAPIInterface:
         """Initialises the Local Cache connection."""
         await self.local_cache_api.lavalink.init()
         await self.persistent_queue_api.init()
+        self.local_cache_api.lavalink_writes.start()
 
-    def close(self) -> None:
+    async def close(self) -> None:
         """Closes the Local Cache connection."""
-        self.local_cache_api.lavalink.close()
+        await self.local_cache_api.lavalink_writes.close()
+        await self.local_cache_api.lavalink.close()
 
     async def get_random_track_from_db(self, tries=0) -> Optional[MutableMapping]:
         """Get a random track from the local database and return it."""
@@ -116,11 +117,11 @@ class AudioAPIInterface:
         if action_type == "insert" and isinstance(data, list):
             for table, d in data:
                 if table == "lavalink":
-                    await self.local_cache_api.lavalink.insert(d)
-        elif action_type == "update" and isinstance(data, dict):
+                    self.local_cache_api.lavalink_writes.upsert(d)
+        elif action_type == "update" and isinstance(data, list):
             for table, d in data:
                 if table == "lavalink":
-                    await self.local_cache_api.lavalink.update(data)
+                    self.local_cache_api.lavalink_writes.touch(d["query"])
         elif action_type == "global" and isinstance(data, list):
             await asyncio.gather(*[self.global_cache_api.update_global(**d) for d in data])
 
@@ -156,7 +157,7 @@ class AudioAPIInterface:
                 tasks: MutableMapping = {"update": [], "insert": [], "global": []}
                 async for k, task in AsyncIter(self._tasks.items()):
                     async for t, args in AsyncIter(task.items()):
-                        tasks[t].append(args)
+                        tasks[t].extend(args)
                 self._tasks = {}
                 coro_tasks = [self.route_tasks(a, tasks[a]) for a in tasks]
 
@@ -219,17 +220,34 @@ class AudioAPIInterface:
         if prefer_lyrics and query.is_youtube and query.is_search:
             query_string = f"{query} - lyrics"
         if cache_enabled and not forced and not query.is_local:
-            try:
-                (val, last_updated) = await self.local_cache_api.lavalink.fetch_one(
-                    {"query": query_string}
-                )
-            except Exception as exc:
-                log.verbose("Failed to fetch %r from Lavalink table", query_string, exc_info=exc)
+            max_age = await self.config.cache_age()
+            maxage = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(
+                days=max_age
+            )
+            maxage_int = int(time.mktime(maxage.timetuple()))
+            val = self.local_cache_api.lavalink_hot.get(query_string, maxage=maxage_int)
+            if val is None:
+                try:
+                    entry = await self.local_cache_api.lavalink.fetch_entry(
+                        {"query": query_string}
+                    )
+                except Exception as exc:
+                    log.verbose(
+                        "Failed to fetch %r from Lavalink table", query_string, exc_info=exc
+                    )
+                else:
+                    if entry is not None:
+                        val = entry.query
+                        self.local_cache_api.lavalink_hot.put(
+                            query_string,
+                            val,
+                            last_updated=entry.last_updated,
+                            size=entry.data_size,
+                        )
 
             if val and isinstance(val, dict):
                 log.trace("Updating Local Database with %r", query_string)
-                task = ("update", ("lavalink", {"query": query_string}))
-                self.append_task(ctx, *task)
+                self.local_cache_api.lavalink_writes.touch(query_string)
             else:
                 val = None
 
@@ -247,7 +265,8 @@ class AudioAPIInterface:
         ):
             valid_global_entry = False
             with contextlib.suppress(Exception):
-                global_entry = await self.global_cache_api.get_call(query=query)
+                # concurrent callers share the coalesced response, don't mutate it
+                global_entry = dict(await self.global_cache_api.get_call(query=query))
                 if global_entry.get("loadType") == "V2_COMPACT":
                     global_entry["loadType"] = "V2_COMPAT"
                 results = LoadResult(global_entry)
@@ -273,6 +292,7 @@ class AudioAPIInterface:
             results = LoadResult(data)
             called_api = False
             if results.has_error:
+                self.local_cache_api.lavalink_hot.discard(query_string)
                 # If cached value has an invalid entry make a new call so that it gets updated
                 results, called_api = await self.fetch_track(ctx, player, query, forced=True)
             valid_global_entry = False
@@ -311,21 +331,19 @@ class AudioAPIInterface:
                 time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
                 data = json.dumps(results._raw)
                 if all(k in data for k in ["loadType", "playlistInfo", "isSeekable", "isStream"]):
-                    task = (
-                        "insert",
-                        (
-                            "lavalink",
-                            [
-                                {
-                                    "query": query_string,
-                                    "data": data,
-                                    "last_updated": time_now,
-                                    "last_fetched": time_now,
-                                }
-                            ],
-                        ),
+                    self.local_cache_api.lavalink_hot.put(
+                        query_string, results._raw, last_updated=time_now, size=len(data)
+                    )
+                    self.local_cache_api.lavalink_writes.upsert(
+                        [
+                            {
+                                "query": query_string,
+                                "data": data,
+                                "last_updated": time_now,
+                                "last_fetched": time_now,
+                            }
+                        ]
                     )
-                    self.append_task(ctx, *task)
             except Exception as exc:
                 log.verbose(
                     "Failed to enqueue write task for %r to Lavalink table",
@@ -1,11 +1,12 @@
-import concurrent
+import asyncio
+import collections
 import contextlib
 import datetime
 import random
 import time
 from pathlib import Path
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, Callable, List, MutableMapping, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, MutableMapping, Optional, Tuple, Union
 
 from red_commons.logging import getLogger
 
@@ -14,7 +15,7 @@ from redbot.core.bot import Red
 from redbot.core.commands import Cog
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.dbtools import APSWConnectionWrapper
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
 
 from ..sql_statements import (
     LAVALINK_CREATE_INDEX,
@@ -40,12 +41,12 @@ if TYPE_CHECKING:
 
 log = getLogger("red.cogs.Audio.api.LocalDB")
 _ = Translator("Audio", Path(__file__))
-_SCHEMA_VERSION = 3
+_SCHEMA_VERSION = 4
 
 
 class BaseWrapper:
     def __init__(
-        self, bot: Red, config: Config, conn: APSWConnectionWrapper, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, conn: ThreadedAPSWConnection, cog: Union["Audio", Cog]
     ):
         self.bot = bot
         self.config = config
@@ -61,19 +62,15 @@ class BaseWrapper:
 
     async def init(self) -> None:
         """Initialize the local cache"""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, self.statement.pragma_temp_store)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_journal_mode)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_read_uncommitted)
-            executor.submit(self.maybe_migrate)
-            executor.submit(self.database.cursor().execute, LAVALINK_CREATE_TABLE)
-            executor.submit(self.database.cursor().execute, LAVALINK_CREATE_INDEX)
-            await self.clean_up_old_entries()
-
-    def close(self) -> None:
+        await self.maybe_migrate()
+        await self.database.execute(LAVALINK_CREATE_TABLE)
+        await self.database.execute(LAVALINK_CREATE_INDEX)
+        await self.clean_up_old_entries()
+
+    async def close(self) -> None:
         """Close the connection with the local cache"""
         with contextlib.suppress(Exception):
-            self.database.close()
+            await self.database.close()
 
     async def clean_up_old_entries(self) -> None:
         """Delete entries older than x in the local cache tables"""
@@ -81,48 +78,48 @@ class BaseWrapper:
         maxage = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=max_age)
         maxage_int = int(time.mktime(maxage.timetuple()))
         values = {"maxage": maxage_int}
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, LAVALINK_DELETE_OLD_ENTRIES, values)
+        try:
+            await self.database.execute(LAVALINK_DELETE_OLD_ENTRIES, values)
+        except Exception as exc:
+            log.verbose("Failed to clean up old entries of the local cache", exc_info=exc)
 
-    def maybe_migrate(self) -> None:
+    async def maybe_migrate(self) -> None:
         """Maybe migrate Database schema for the local cache"""
         current_version = 0
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_user_version)]
-            ):
-                try:
-                    row_result = future.result()
-                    current_version = row_result.fetchone()
-                    break
-                except Exception as exc:
-                    log.verbose("Failed to completed fetch from database", exc_info=exc)
-            if isinstance(current_version, tuple):
-                current_version = current_version[0]
-            if current_version == _SCHEMA_VERSION:
-                return
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.set_user_version,
-                {"version": _SCHEMA_VERSION},
-            )
+        try:
+            row = await self.database.fetchone(self.statement.get_user_version)
+        except Exception as exc:
+            log.verbose("Failed to completed fetch from database", exc_info=exc)
+        else:
+            if row:
+                current_version = row[0]
+        if current_version == _SCHEMA_VERSION:
+            return
+        await self.database.execute(
+            self.statement.set_user_version.format(version=_SCHEMA_VERSION)
+        )
 
     async def insert(self, values: List[MutableMapping]) -> None:
         """Insert an entry into the local cache"""
         try:
-            with self.database.transaction() as transaction:
-                transaction.executemany(self.statement.upsert, values)
+            await self.database.executemany(self.statement.upsert, values)
         except Exception as exc:
             log.trace("Error during table insert", exc_info=exc)
 
+    async def update_many(self, values: List[MutableMapping]) -> None:
+        """Update multiple entries of the local cache at once"""
+        try:
+            await self.database.executemany(self.statement.update, values)
+        except Exception as exc:
+            log.verbose("Error during table update", exc_info=exc)
+
     async def update(self, values: MutableMapping) -> None:
         """Update an entry of the local cache"""
 
         try:
             time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
             values["last_fetched"] = time_now
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                executor.submit(self.database.cursor().execute, self.statement.update, values)
+            await self.database.execute(self.statement.update, values)
         except Exception as exc:
             log.verbose("Error during table update", exc_info=exc)
 
@@ -133,15 +130,10 @@ class BaseWrapper:
         maxage_int = int(time.mktime(maxage.timetuple()))
         values.update({"maxage": maxage_int})
         row = None
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_one, values)]
-            ):
-                try:
-                    row_result = future.result()
-                    row = row_result.fetchone()
-                except Exception as exc:
-                    log.verbose("Failed to completed fetch from database", exc_info=exc)
+        try:
+            row = await self.database.fetchone(self.statement.get_one, values)
+        except Exception as exc:
+            log.verbose("Failed to completed fetch from database", exc_info=exc)
         if not row:
             return None
         if self.fetch_result is None:
@@ -154,14 +146,10 @@ class BaseWrapper:
         row_result = []
         if self.fetch_result is None:
             return []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_all, values)]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    log.verbose("Failed to completed fetch from database", exc_info=exc)
+        try:
+            row_result = await self.database.fetch(self.statement.get_all, values)
+        except Exception as exc:
+            log.verbose("Failed to completed fetch from database", exc_info=exc)
         async for row in AsyncIter(row_result):
             output.append(self.fetch_result(*row))
         return output
@@ -169,23 +157,12 @@ class BaseWrapper:
     async def _fetch_random(self, values: MutableMapping) -> Optional[LavalinkCacheFetchResult]:
         """Get a random entry from the local cache"""
         row = None
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [
-                    executor.submit(
-                        self.database.cursor().execute, self.statement.get_random, values
-                    )
-                ]
-            ):
-                try:
-                    row_result = future.result()
-                    rows = row_result.fetchall()
-                    if rows:
-                        row = random.choice(rows)
-                    else:
-                        row = None
-                except Exception as exc:
-                    log.verbose("Failed to completed random fetch from database", exc_info=exc)
+        try:
+            rows = await self.database.fetch(self.statement.get_random, values)
+            if rows:
+                row = random.choice(rows)
+        except Exception as exc:
+            log.verbose("Failed to completed random fetch from database", exc_info=exc)
         if not row:
             return None
         if self.fetch_result is None:
@@ -195,7 +172,7 @@ class BaseWrapper:
 
 class LavalinkTableWrapper(BaseWrapper):
     def __init__(
-        self, bot: Red, config: Config, conn: APSWConnectionWrapper, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, conn: ThreadedAPSWConnection, cog: Union["Audio", Cog]
     ):
         super().__init__(bot, config, conn, cog)
         self.statement.upsert = LAVALINK_UPSERT
@@ -211,11 +188,18 @@ class LavalinkTableWrapper(BaseWrapper):
         self, values: MutableMapping
     ) -> Tuple[Optional[MutableMapping], Optional[datetime.datetime]]:
         """Get an entry from the Lavalink table"""
-        result = await self._fetch_one(values)
-        if not result or not isinstance(result.query, dict):
+        result = await self.fetch_entry(values)
+        if result is None:
             return None, None
         return result.query, result.updated_on
 
+    async def fetch_entry(self, values: MutableMapping) -> Optional[LavalinkCacheFetchResult]:
+        """Get an entry from the Lavalink table, along with its metadata"""
+        result = await self._fetch_one(values)
+        if not result or not isinstance(result.query, dict):
+            return None
+        return result
+
     async def fetch_all(self, values: MutableMapping) -> List[LavalinkCacheFetchResult]:
         """Get all entries from the Lavalink table"""
         result = await self._fetch_all(values)
@@ -236,27 +220,202 @@ class LavalinkTableWrapper(BaseWrapper):
         row_result = []
         if self.fetch_for_global is None:
             return []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_all_global)]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    log.verbose("Failed to completed fetch from database", exc_info=exc)
+        try:
+            row_result = await self.database.fetch(self.statement.get_all_global)
+        except Exception as exc:
+            log.verbose("Failed to completed fetch from database", exc_info=exc)
         async for row in AsyncIter(row_result):
             output.append(self.fetch_for_global(*row))
         return output
 
 
+class LavalinkHotCache:
+    """A size-bounded, in-memory LRU of decoded Lavalink table entries.
+
+    Entries are keyed by the same query string as the table, and are treated as missing
+    once they are older than the max age the table would return them for.
+    Sizes are accounted by the length of each entry's JSON representation.
+    """
+
+    def __init__(self, max_size: int = 32 * 1024 * 1024):
+        self.max_size = max_size
+        # query -> (data, last_updated, size)
+        self._entries: "collections.OrderedDict[str, Tuple[MutableMapping, int, int]]" = (
+            collections.OrderedDict()
+        )
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, query: str, *, maxage: int) -> Optional[MutableMapping]:
+        """Get a copy of the entry for the query, if it's cached and newer than maxage"""
+        entry = self._entries.get(query)
+        if entry is not None and entry[1] <= maxage:
+            self.discard(query)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(query)
+        self.hits += 1
+        return self._copy(entry[0])
+
+    def put(self, query: str, data: MutableMapping, *, last_updated: int, size: int) -> None:
+        """Add or replace the entry for the query"""
+        self.discard(query)
+        if size > self.max_size:
+            return
+        self._entries[query] = (self._copy(data), last_updated, size)
+        self.size += size
+        while self.size > self.max_size:
+            __, (__, __, evicted_size) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+
+    def discard(self, query: str) -> None:
+        entry = self._entries.pop(query, None)
+        if entry is not None:
+            self.size -= entry[2]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    @staticmethod
+    def _copy(data: MutableMapping) -> MutableMapping:
+        # LoadResult and Track update the track dicts they are made from,
+        # so each user gets its own copy of those, which is still much cheaper than decoding
+        data = dict(data)
+        if isinstance(data.get("tracks"), list):
+            data["tracks"] = [
+                {**track, "info": dict(track["info"])} if "info" in track else dict(track)
+                for track in data["tracks"]
+            ]
+        return data
+
+
+class LavalinkWriteBuffer:
+    """Collects writes to the Lavalink table, and flushes them in the background.
+
+    Inserts and ``last_fetched`` updates are deduplicated by query
+    and flushed together, either periodically or once too many are pending,
+    so that neither a cache hit nor a cache miss has to wait for the database.
+    """
+
+    def __init__(
+        self, table: LavalinkTableWrapper, *, interval: float = 30.0, max_pending: int = 500
+    ):
+        self.table = table
+        self.interval = interval
+        self.max_pending = max_pending
+        self._upserts: Dict[str, MutableMapping] = {}
+        self._touches: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self.queued_upserts = 0
+        self.queued_touches = 0
+        self.flushed_rows = 0
+        self.flushes = 0
+        self.last_flush_latency = 0.0
+        self.total_flush_latency = 0.0
+
+    @property
+    def pending(self) -> int:
+        return len(self._upserts) + len(self._touches)
+
+    def upsert(self, values: List[MutableMapping]) -> None:
+        """Queue entries to be inserted or replaced in the Lavalink table"""
+        for entry in values:
+            self._upserts[entry["query"]] = entry
+            self._touches.pop(entry["query"], None)
+        self.queued_upserts += len(values)
+        self._maybe_flush()
+
+    def touch(self, query: str) -> None:
+        """Queue an update of the time an entry was last fetched at"""
+        time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+        if query in self._upserts:
+            self._upserts[query]["last_fetched"] = time_now
+        else:
+            self._touches[query] = time_now
+        self.queued_touches += 1
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if self.pending >= self.max_pending and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.create_task(self.flush())
+
+    async def flush(self) -> None:
+        """Write all pending entries to the Lavalink table"""
+        async with self._lock:
+            if not self.pending:
+                return
+            upserts, self._upserts = list(self._upserts.values()), {}
+            touches = [
+                {"query": query, "last_fetched": last_fetched}
+                for query, last_fetched in self._touches.items()
+            ]
+            self._touches = {}
+            start = time.perf_counter()
+            # both are queued at once, so they get committed in the same transaction
+            await asyncio.gather(
+                self.table.insert(upserts) if upserts else asyncio.sleep(0),
+                self.table.update_many(touches) if touches else asyncio.sleep(0),
+            )
+            self.last_flush_latency = time.perf_counter() - start
+            self.total_flush_latency += self.last_flush_latency
+            self.flushes += 1
+            self.flushed_rows += len(upserts) + len(touches)
+            log.trace(
+                "Flushed %s inserts and %s updates to the Lavalink table in %.3fs",
+                len(upserts),
+                len(touches),
+                self.last_flush_latency,
+            )
+
+    def start(self) -> None:
+        """Start flushing pending entries periodically"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception as exc:
+                log.verbose("Failed to flush writes to the Lavalink table", exc_info=exc)
+
+    async def close(self) -> None:
+        """Stop flushing periodically and write all pending entries"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+
 class LocalCacheWrapper:
     """Wraps all table apis into 1 object representing the local cache"""
 
     def __init__(
-        self, bot: Red, config: Config, conn: APSWConnectionWrapper, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, conn: ThreadedAPSWConnection, cog: Union["Audio", Cog]
     ):
         self.bot = bot
         self.config = config
         self.database = conn
         self.cog = cog
         self.lavalink: LavalinkTableWrapper = LavalinkTableWrapper(bot, config, conn, self.cog)
+        self.lavalink_writes: LavalinkWriteBuffer = LavalinkWriteBuffer(self.lavalink)
+        self.lavalink_hot: LavalinkHotCache = LavalinkHotCache()
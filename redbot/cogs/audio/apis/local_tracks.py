@@ -0,0 +1,241 @@
+import asyncio
+import json
+import os
+import stat
+import time
+from pathlib import Path
+from typing import Dict, List, MutableMapping, Optional, Set, Tuple
+
+from red_commons.logging import getLogger
+
+from redbot.core.i18n import Translator
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
+
+from ..audio_dataclasses import LocalPath, Query
+from ..sql_statements import (
+    LOCAL_TRACK_FOLDERS_CREATE_INDEX,
+    LOCAL_TRACK_FOLDERS_CREATE_TABLE,
+    LOCAL_TRACK_FOLDERS_DELETE,
+    LOCAL_TRACK_FOLDERS_FETCH_ALL,
+    LOCAL_TRACK_FOLDERS_FETCH_CHILDREN,
+    LOCAL_TRACK_FOLDERS_FETCH_TREE,
+    LOCAL_TRACK_FOLDERS_UPSERT,
+    LOCAL_TRACKS_CREATE_INDEX,
+    LOCAL_TRACKS_CREATE_TABLE,
+    LOCAL_TRACKS_DELETE_FOLDER,
+    LOCAL_TRACKS_FETCH_FOLDER,
+    LOCAL_TRACKS_FETCH_TREE,
+    LOCAL_TRACKS_INSERT,
+)
+
+log = getLogger("red.cogs.Audio.api.LocalTracks")
+_ = Translator("Audio", Path(__file__))
+
+# folder -> (mtime_ns, track paths, subfolder paths)
+_ScannedFolders = Dict[str, Tuple[int, List[str], List[str]]]
+
+
+def _scan_tree(
+    root: str, known: MutableMapping[str, Tuple[int, List[str]]]
+) -> Tuple[_ScannedFolders, Set[str]]:
+    """Walk the tree under root, only listing the folders which changed since they were indexed.
+
+    A folder's mtime changes whenever entries are added to, removed from or renamed in it,
+    so folders with an unchanged mtime are only descended into through their known subfolders.
+    """
+    changed: _ScannedFolders = {}
+    seen: Set[str] = set()
+    visited: Set[Tuple[int, int]] = set()
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            folder_stat = os.stat(folder)
+        except OSError:
+            continue
+        if not stat.S_ISDIR(folder_stat.st_mode):
+            continue
+        # guards against symlink loops
+        inode = (folder_stat.st_dev, folder_stat.st_ino)
+        if inode in visited:
+            continue
+        visited.add(inode)
+
+        indexed = known.get(folder)
+        if indexed is not None and indexed[0] == folder_stat.st_mtime_ns:
+            seen.add(folder)
+            stack.extend(indexed[1])
+            continue
+
+        tracks = []
+        subfolders = []
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    # consistent with glob, which doesn't match hidden files
+                    if entry.name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir():
+                            subfolders.append(entry.path)
+                        elif (
+                            os.path.splitext(entry.name)[1].lower() in LocalPath._all_music_ext
+                            and entry.is_file()
+                        ):
+                            tracks.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        seen.add(folder)
+        changed[folder] = (folder_stat.st_mtime_ns, tracks, subfolders)
+        stack.extend(subfolders)
+    return changed, seen
+
+
+def _prefix_range(path: str) -> MutableMapping[str, str]:
+    prefix = path.rstrip(os.sep) + os.sep
+    return {"prefix": prefix, "prefix_end": prefix[:-1] + chr(ord(os.sep) + 1)}
+
+
+class LocalTrackIndex:
+    """A persistent index of the local tracks folder.
+
+    The index is refreshed incrementally: on each refresh, only folders whose mtime changed
+    are listed again, the others cost a single stat call.
+    Listings are served from the database, already sorted.
+    """
+
+    def __init__(self, conn: ThreadedAPSWConnection, *, refresh_interval: float = 10.0):
+        self.database = conn
+        self.refresh_interval = refresh_interval
+        # folder -> (mtime_ns, subfolders), mirrors the local_track_folders table
+        self._folders: Optional[Dict[str, Tuple[int, List[str]]]] = None
+        self._root: Optional[str] = None
+        self._last_refresh = 0.0
+        self._lock = asyncio.Lock()
+
+    async def init(self) -> None:
+        """Initialize the local tracks tables."""
+        await self.database.execute(LOCAL_TRACKS_CREATE_TABLE)
+        await self.database.execute(LOCAL_TRACKS_CREATE_INDEX)
+        await self.database.execute(LOCAL_TRACK_FOLDERS_CREATE_TABLE)
+        await self.database.execute(LOCAL_TRACK_FOLDERS_CREATE_INDEX)
+
+    async def refresh(self, root: Path, *, force: bool = False) -> None:
+        """Bring the index of the given localtracks folder up to date.
+
+        Refreshes are skipped if the index was refreshed less than
+        ``refresh_interval`` seconds ago, unless ``force`` is set.
+        """
+        root = str(root.absolute())
+        async with self._lock:
+            if (
+                not force
+                and root == self._root
+                and time.monotonic() - self._last_refresh < self.refresh_interval
+            ):
+                return
+            if self._folders is None:
+                self._folders = {
+                    path: (mtime_ns, json.loads(subfolders))
+                    for path, mtime_ns, subfolders in await self.database.fetch(
+                        LOCAL_TRACK_FOLDERS_FETCH_ALL
+                    )
+                }
+            start = time.perf_counter()
+            loop = asyncio.get_running_loop()
+            changed, seen = await loop.run_in_executor(None, _scan_tree, root, dict(self._folders))
+            removed = [path for path in self._folders if path not in seen]
+            if changed or removed:
+                await self._apply(root, changed, removed)
+            for path in removed:
+                del self._folders[path]
+            for path, (mtime_ns, __, subfolders) in changed.items():
+                self._folders[path] = (mtime_ns, subfolders)
+            self._root = root
+            self._last_refresh = time.monotonic()
+            log.trace(
+                "Refreshed the local tracks index in %.3fs (%s folders changed, %s removed)",
+                time.perf_counter() - start,
+                len(changed),
+                len(removed),
+            )
+
+    async def _apply(self, root: str, changed: _ScannedFolders, removed: List[str]) -> None:
+        def sort_key(path: str) -> str:
+            return os.path.relpath(path, root).lower()
+
+        tracks = []
+        folders = []
+        for folder, (mtime_ns, folder_tracks, subfolders) in changed.items():
+            tracks.extend(
+                {"path": path, "folder": folder, "sort_key": sort_key(path)}
+                for path in folder_tracks
+            )
+            folders.append(
+                {
+                    "path": folder,
+                    "parent": os.path.dirname(folder) if folder != root else None,
+                    "mtime_ns": mtime_ns,
+                    "subfolders": json.dumps(subfolders),
+                    "sort_key": sort_key(folder),
+                }
+            )
+        await self.database.execute_batch(
+            [
+                (LOCAL_TRACKS_DELETE_FOLDER, [{"folder": f} for f in [*changed, *removed]]),
+                (LOCAL_TRACK_FOLDERS_DELETE, [{"path": f} for f in removed]),
+                (LOCAL_TRACKS_INSERT, tracks),
+                (LOCAL_TRACK_FOLDERS_UPSERT, folders),
+            ]
+        )
+
+    async def tracks_in_tree(self, local_path: LocalPath) -> List[Query]:
+        """Get the tracks in the given folder and all its subfolders, sorted by path."""
+        await self.refresh(local_path.localtrack_folder)
+        folder = str(local_path.path)
+        rows = await self.database.fetch(
+            LOCAL_TRACKS_FETCH_TREE, {"folder": folder, **_prefix_range(folder)}
+        )
+        return self._to_queries(local_path, rows)
+
+    async def tracks_in_folder(self, local_path: LocalPath) -> List[Query]:
+        """Get the tracks in the given folder, sorted by path."""
+        await self.refresh(local_path.localtrack_folder)
+        rows = await self.database.fetch(
+            LOCAL_TRACKS_FETCH_FOLDER, {"folder": str(local_path.path)}
+        )
+        return self._to_queries(local_path, rows)
+
+    async def subfolders_in_tree(self, local_path: LocalPath) -> List[LocalPath]:
+        """Get all subfolders of the given folder, sorted by path."""
+        await self.refresh(local_path.localtrack_folder)
+        folder = str(local_path.path)
+        rows = await self.database.fetch(LOCAL_TRACK_FOLDERS_FETCH_TREE, _prefix_range(folder))
+        return self._to_local_paths(local_path, rows)
+
+    async def subfolders(self, local_path: LocalPath) -> List[LocalPath]:
+        """Get the direct subfolders of the given folder, sorted by path."""
+        await self.refresh(local_path.localtrack_folder)
+        rows = await self.database.fetch(
+            LOCAL_TRACK_FOLDERS_FETCH_CHILDREN, {"parent": str(local_path.path)}
+        )
+        return self._to_local_paths(local_path, rows)
+
+    def _to_queries(self, local_path: LocalPath, rows: List[Tuple]) -> List[Query]:
+        # tracks directly in the localtracks folder aren't playable as local tracks
+        return [
+            Query.process_input(
+                LocalPath(path, local_path._localtrack_folder), local_path._localtrack_folder
+            )
+            for (path,) in rows
+            if os.path.dirname(path) != self._root
+        ]
+
+    def _to_local_paths(self, local_path: LocalPath, rows: List[Tuple]) -> List[LocalPath]:
+        return [
+            LocalPath(path, local_path._localtrack_folder)
+            for (path,) in rows
+            if path != self._root
+        ]
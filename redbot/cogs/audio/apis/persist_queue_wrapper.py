@@ -1,4 +1,3 @@
-import concurrent
 import json
 import time
 from pathlib import Path
@@ -6,6 +5,7 @@ from pathlib import Path
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, List, Union
 
+import apsw
 import lavalink
 from red_commons.logging import getLogger
 
@@ -14,7 +14,7 @@ from redbot.core.bot import Red
 from redbot.core.commands import Cog
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.dbtools import APSWConnectionWrapper
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
 
 from ..sql_statements import (
     PERSIST_QUEUE_BULK_PLAYED,
@@ -42,7 +42,7 @@ if TYPE_CHECKING:
 
 class QueueInterface:
     def __init__(
-        self, bot: Red, config: Config, conn: APSWConnectionWrapper, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, conn: ThreadedAPSWConnection, cog: Union["Audio", Cog]
     ):
         self.bot = bot
         self.database = conn
@@ -67,52 +67,41 @@ class QueueInterface:
 
     async def init(self) -> None:
         """Initialize the PersistQueue table"""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, self.statement.pragma_temp_store)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_journal_mode)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_read_uncommitted)
-            executor.submit(self.database.cursor().execute, self.statement.create_table)
-            executor.submit(self.database.cursor().execute, self.statement.create_index)
+        await self.database.execute(self.statement.create_table)
+        await self.database.execute(self.statement.create_index)
 
     async def fetch_all(self) -> List[QueueFetchResult]:
         """Fetch all playlists"""
         output = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [
-                    executor.submit(
-                        self.database.cursor().execute,
-                        self.statement.get_all,
-                    )
-                ]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    log.verbose("Failed to complete playlist fetch from database", exc_info=exc)
-                    return []
+        try:
+            row_result = await self.database.fetch(self.statement.get_all)
+        except Exception as exc:
+            log.verbose("Failed to complete playlist fetch from database", exc_info=exc)
+            return []
 
         async for index, row in AsyncIter(row_result).enumerate(start=1):
             output.append(QueueFetchResult(*row))
         return output
 
     async def played(self, guild_id: int, track_id: str) -> None:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                PERSIST_QUEUE_PLAYED,
-                {"guild_id": guild_id, "track_id": track_id},
+        try:
+            await self.database.execute(
+                PERSIST_QUEUE_PLAYED, {"guild_id": guild_id, "track_id": track_id}
             )
+        except apsw.Error as exc:
+            log.warning("Failed to mark track as played in persistent queue", exc_info=exc)
 
     async def delete_scheduled(self):
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, PERSIST_QUEUE_DELETE_SCHEDULED)
+        try:
+            await self.database.execute(PERSIST_QUEUE_DELETE_SCHEDULED)
+        except apsw.Error as exc:
+            log.warning("Failed to delete played tracks from persistent queue", exc_info=exc)
 
     async def drop(self, guild_id: int):
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute, PERSIST_QUEUE_BULK_PLAYED, ({"guild_id": guild_id})
-            )
+        try:
+            await self.database.execute(PERSIST_QUEUE_BULK_PLAYED, {"guild_id": guild_id})
+        except apsw.Error as exc:
+            log.warning("Failed to drop persistent queue for guild %s", guild_id, exc_info=exc)
 
     async def enqueued(self, guild_id: int, room_id: int, track: lavalink.Track):
         enqueue_time = track.extras.get("enqueue_time", 0)
@@ -120,9 +109,8 @@ class QueueInterface:
             track.extras["enqueue_time"] = int(time.time())
         track_identifier = track.track_identifier
         track = self.cog.track_to_json(track)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
+        try:
+            await self.database.execute(
                 PERSIST_QUEUE_UPSERT,
                 {
                     "guild_id": int(guild_id),
@@ -133,3 +121,5 @@ class QueueInterface:
                     "track_id": track_identifier,
                 },
             )
+        except apsw.Error as exc:
+            log.warning("Failed to add track to persistent queue", exc_info=exc)
@@ -34,6 +34,7 @@ class Playlist:
         playlist_url: Optional[str] = None,
         tracks: Optional[List[MutableMapping]] = None,
         guild: Union[discord.Guild, int, None] = None,
+        track_count: Optional[int] = None,
     ):
         self.bot = bot
         self.guild = guild
@@ -48,17 +49,87 @@ class Playlist:
         self.id = playlist_id
         self.name = name
         self.url = playlist_url
-        self.tracks = tracks or []
-        self.tracks_obj = [lavalink.Track(data=track) for track in self.tracks]
+        self._tracks: Optional[List[MutableMapping]] = None
+        self._tracks_obj: Optional[List[lavalink.Track]] = None
+        # a track count without tracks means only the playlist's metadata was fetched
+        self._track_count = track_count or 0
+        if tracks is not None or track_count is None:
+            self.tracks = tracks or []
         self.playlist_api = playlist_api
 
     def __repr__(self):
         return (
             f"Playlist(name={self.name}, id={self.id}, scope={self.scope}, "
             f"scope_id={self.scope_id}, author={self.author_id}, "
-            f"tracks={len(self.tracks)}, url={self.url})"
+            f"tracks={self.track_count}, url={self.url})"
+        )
+
+    @property
+    def tracks(self) -> List[MutableMapping]:
+        """The playlist's tracks.
+
+        Raises
+        ------
+        RuntimeError
+            The tracks haven't been loaded, see `load_tracks`.
+        """
+        if self._tracks is None:
+            raise RuntimeError("The tracks of this playlist haven't been loaded.")
+        return self._tracks
+
+    @tracks.setter
+    def tracks(self, tracks: List[MutableMapping]) -> None:
+        self._tracks = tracks
+        self._tracks_obj = None
+
+    @property
+    def tracks_obj(self) -> List[lavalink.Track]:
+        """The playlist's tracks, as `lavalink.Track` objects."""
+        if self._tracks_obj is None:
+            self._tracks_obj = [lavalink.Track(data=track) for track in self.tracks]
+        return self._tracks_obj
+
+    @property
+    def tracks_loaded(self) -> bool:
+        """Whether the playlist's tracks have been loaded."""
+        return self._tracks is not None
+
+    @property
+    def track_count(self) -> int:
+        """The amount of tracks in the playlist, available even if they weren't loaded."""
+        return len(self._tracks) if self._tracks is not None else self._track_count
+
+    async def load_tracks(self) -> List[MutableMapping]:
+        """Fetch the playlist's tracks, if they haven't been loaded yet."""
+        if self._tracks is None:
+            scope, scope_id = self.config_scope
+            self.tracks = await self.playlist_api.fetch_tracks(scope, int(self.id), scope_id)
+        return self._tracks
+
+    async def fetch_tracks(self, start: int, stop: int) -> List[MutableMapping]:
+        """Fetch the playlist's tracks from position ``start`` up to, excluding, ``stop``.
+
+        Only the requested tracks are read from the database if the tracks aren't loaded.
+        """
+        if self._tracks is not None:
+            return self._tracks[start:stop]
+        scope, scope_id = self.config_scope
+        return await self.playlist_api.fetch_tracks(
+            scope, int(self.id), scope_id, start=start, stop=stop
         )
 
+    async def append_tracks(self, tracks: List[MutableMapping]):
+        """Add tracks to the end of the playlist, without rewriting its existing tracks."""
+        if not tracks:
+            return
+        scope, scope_id = self.config_scope
+        await self.playlist_api.append_tracks(scope, int(self.id), scope_id, tracks)
+        if self._tracks is not None:
+            self._tracks.extend(tracks)
+            self._tracks_obj = None
+        else:
+            self._track_count += len(tracks)
+
     async def edit(self, data: MutableMapping):
         """
         Edits a Playlist.
@@ -73,11 +144,14 @@ class Playlist:
 
         for item in list(data.keys()):
             setattr(self, item, data[item])
-        await self.save()
+        await self.save(with_tracks="tracks" in data)
         return self
 
-    async def save(self):
-        """Saves a Playlist."""
+    async def save(self, *, with_tracks: bool = True):
+        """Saves a Playlist.
+
+        Its tracks are only rewritten if ``with_tracks`` is set and they have been loaded.
+        """
         scope, scope_id = self.config_scope
         await self.playlist_api.upsert(
             scope,
@@ -86,7 +160,7 @@ class Playlist:
             scope_id=scope_id,
             author_id=self.author_id,
             playlist_url=self.url,
-            tracks=self.tracks,
+            tracks=self._tracks if with_tracks else None,
         )
 
     def to_json(self) -> MutableMapping:
@@ -164,6 +238,7 @@ class Playlist:
             name=name,
             playlist_url=playlist_url,
             tracks=tracks,
+            track_count=data.track_count,
         )
 
 
@@ -351,6 +426,7 @@ async def get_playlist(
     playlist_api: PlaylistWrapper,
     guild: Union[discord.Guild, int] = None,
     author: Union[discord.abc.User, int] = None,
+    with_tracks: bool = True,
 ) -> Playlist:
     """
     Gets the playlist with the associated playlist number.
@@ -368,6 +444,8 @@ async def get_playlist(
         The ID of the user to get the playlist from if scope is USERPLAYLIST.
     bot: Red
         The bot's instance.
+    with_tracks: bool
+        Whether to load the playlist's tracks.
     Returns
     -------
     Playlist
@@ -384,7 +462,9 @@ async def get_playlist(
         Trying to access the User scope without an user id.
     """
     scope_standard, scope_id = prepare_config_scope(bot, scope, author, guild)
-    playlist_data = await playlist_api.fetch(scope_standard, playlist_number, scope_id)
+    playlist_data = await playlist_api.fetch(
+        scope_standard, playlist_number, scope_id, with_tracks=with_tracks
+    )
 
     if not (playlist_data and playlist_data.playlist_id):
         raise RuntimeError(f"That playlist does not exist for the following scope: {scope}")
@@ -426,7 +506,7 @@ async def get_all_playlist(
     Returns
     -------
     list
-        A list of all playlists for the specified scope
+        A list of all playlists for the specified scope, without their tracks loaded
     Raises
     ------
     `InvalidPlaylistScope`
@@ -487,7 +567,7 @@ async def get_all_playlist_converter(
     Returns
     -------
     list
-        A list of all playlists for the specified scope
+        A list of all playlists for the specified scope, without their tracks loaded
     Raises
     ------
     `InvalidPlaylistScope`
@@ -1,17 +1,17 @@
-import concurrent
 import json
 from pathlib import Path
 
 from types import SimpleNamespace
-from typing import List, MutableMapping, Optional
+from typing import AsyncIterator, List, MutableMapping, Optional
 
+import apsw
 from red_commons.logging import getLogger
 
 from redbot.core import Config
 from redbot.core.bot import Red
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.dbtools import APSWConnectionWrapper
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
 
 from ..sql_statements import (
     HANDLE_DISCORD_DATA_DELETION_QUERY,
@@ -24,6 +24,18 @@ from ..sql_statements import (
     PLAYLIST_FETCH_ALL,
     PLAYLIST_FETCH_ALL_CONVERTER,
     PLAYLIST_FETCH_ALL_WITH_FILTER,
+    PLAYLIST_TRACKS_APPEND,
+    PLAYLIST_TRACKS_CREATE_TABLE,
+    PLAYLIST_TRACKS_DELETE,
+    PLAYLIST_TRACKS_DELETE_SCHEDULED,
+    PLAYLIST_TRACKS_DELETE_SCOPE,
+    PLAYLIST_TRACKS_FETCH,
+    PLAYLIST_TRACKS_FETCH_RANGE,
+    PLAYLIST_TRACKS_INSERT,
+    PLAYLIST_TRACKS_MIGRATE,
+    PLAYLIST_TRACKS_MIGRATE_CLEAR,
+    PLAYLIST_TRACKS_MIGRATE_DELETE,
+    PLAYLIST_TRACKS_MIGRATE_PENDING,
     PLAYLIST_UPSERT,
     PRAGMA_FETCH_user_version,
     PRAGMA_SET_journal_mode,
@@ -39,7 +51,7 @@ _ = Translator("Audio", Path(__file__))
 
 
 class PlaylistWrapper:
-    def __init__(self, bot: Red, config: Config, conn: APSWConnectionWrapper):
+    def __init__(self, bot: Red, config: Config, conn: ThreadedAPSWConnection):
         self.bot = bot
         self.database = conn
         self.config = config
@@ -62,16 +74,40 @@ class PlaylistWrapper:
         self.statement.get_all_with_filter = PLAYLIST_FETCH_ALL_WITH_FILTER
         self.statement.get_all_converter = PLAYLIST_FETCH_ALL_CONVERTER
 
+        self.statement.create_tracks_table = PLAYLIST_TRACKS_CREATE_TABLE
+        self.statement.insert_tracks = PLAYLIST_TRACKS_INSERT
+        self.statement.append_tracks = PLAYLIST_TRACKS_APPEND
+        self.statement.delete_tracks = PLAYLIST_TRACKS_DELETE
+        self.statement.delete_tracks_scope = PLAYLIST_TRACKS_DELETE_SCOPE
+        self.statement.delete_tracks_scheduled = PLAYLIST_TRACKS_DELETE_SCHEDULED
+        self.statement.get_tracks = PLAYLIST_TRACKS_FETCH
+        self.statement.get_tracks_range = PLAYLIST_TRACKS_FETCH_RANGE
+
         self.statement.drop_user_playlists = HANDLE_DISCORD_DATA_DELETION_QUERY
 
     async def init(self) -> None:
-        """Initialize the Playlist table."""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, self.statement.pragma_temp_store)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_journal_mode)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_read_uncommitted)
-            executor.submit(self.database.cursor().execute, self.statement.create_table)
-            executor.submit(self.database.cursor().execute, self.statement.create_index)
+        """Initialize the Playlist tables."""
+        await self.database.execute(self.statement.create_table)
+        await self.database.execute(self.statement.create_index)
+        await self.database.execute(self.statement.create_tracks_table)
+        await self.maybe_migrate()
+
+    async def maybe_migrate(self) -> None:
+        """Move the tracks of playlists saved before schema version 4 to their own table.
+
+        The legacy ``tracks`` column is cleared once moved, so any playlist still having it set
+        is pending migration, independently of the database's ``user_version``.
+        """
+        row = await self.database.fetchone(PLAYLIST_TRACKS_MIGRATE_PENDING)
+        if not row or not row[0]:
+            return
+        await self.database.execute_batch(
+            [
+                (PLAYLIST_TRACKS_MIGRATE_DELETE, [{}]),
+                (PLAYLIST_TRACKS_MIGRATE, [{}]),
+                (PLAYLIST_TRACKS_MIGRATE_CLEAR, [{}]),
+            ]
+        )
 
     @staticmethod
     def get_scope_type(scope: str) -> int:
@@ -85,84 +121,80 @@ class PlaylistWrapper:
         return table
 
     async def fetch(
-        self, scope: str, playlist_id: int, scope_id: int
+        self, scope: str, playlist_id: int, scope_id: int, *, with_tracks: bool = True
     ) -> Optional[PlaylistFetchResult]:
-        """Fetch a single playlist."""
+        """Fetch a single playlist, and its tracks if ``with_tracks`` is set."""
         scope_type = self.get_scope_type(scope)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [
-                    executor.submit(
-                        self.database.cursor().execute,
-                        self.statement.get_one,
-                        (
-                            {
-                                "playlist_id": playlist_id,
-                                "scope_id": scope_id,
-                                "scope_type": scope_type,
-                            }
-                        ),
-                    )
-                ]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    log.verbose("Failed to complete playlist fetch from database", exc_info=exc)
-                    return None
-            row = row_result.fetchone()
-            if row:
-                row = PlaylistFetchResult(*row)
+        values = {"playlist_id": playlist_id, "scope_id": scope_id, "scope_type": scope_type}
+        try:
+            row = await self.database.fetchone(self.statement.get_one, values)
+            if row and with_tracks:
+                tracks = await self.database.fetch(self.statement.get_tracks, values)
+        except Exception as exc:
+            log.verbose("Failed to complete playlist fetch from database", exc_info=exc)
+            return None
+        if row:
+            row = PlaylistFetchResult(*row)
+            if with_tracks:
+                row.tracks = [json.loads(track) for (track,) in tracks]
         return row
 
+    async def fetch_tracks(
+        self,
+        scope: str,
+        playlist_id: int,
+        scope_id: int,
+        *,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> List[MutableMapping]:
+        """Fetch the tracks of a playlist from position ``start`` up to, excluding, ``stop``."""
+        values = {
+            "scope_type": self.get_scope_type(scope),
+            "playlist_id": playlist_id,
+            "scope_id": scope_id,
+        }
+        if start == 0 and stop is None:
+            rows = await self.database.fetch(self.statement.get_tracks, values)
+        else:
+            values.update(start=start, stop=stop if stop is not None else 2**63 - 1)
+            rows = await self.database.fetch(self.statement.get_tracks_range, values)
+        return [json.loads(track) for (track,) in rows]
+
+    async def iter_tracks(
+        self, scope: str, playlist_id: int, scope_id: int, *, page_size: int = 500
+    ) -> AsyncIterator[MutableMapping]:
+        """Iterate over the tracks of a playlist, fetching ``page_size`` tracks at a time."""
+        start = 0
+        while True:
+            page = await self.fetch_tracks(
+                scope, playlist_id, scope_id, start=start, stop=start + page_size
+            )
+            for track in page:
+                yield track
+            if len(page) < page_size:
+                return
+            start += page_size
+
     async def fetch_all(
         self, scope: str, scope_id: int, author_id=None
     ) -> List[PlaylistFetchResult]:
-        """Fetch all playlists."""
+        """Fetch all playlists, without their tracks."""
         scope_type = self.get_scope_type(scope)
         output = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        try:
             if author_id is not None:
-                for future in concurrent.futures.as_completed(
-                    [
-                        executor.submit(
-                            self.database.cursor().execute,
-                            self.statement.get_all_with_filter,
-                            (
-                                {
-                                    "scope_type": scope_type,
-                                    "scope_id": scope_id,
-                                    "author_id": author_id,
-                                }
-                            ),
-                        )
-                    ]
-                ):
-                    try:
-                        row_result = future.result()
-                    except Exception as exc:
-                        log.verbose(
-                            "Failed to complete playlist fetch from database", exc_info=exc
-                        )
-                        return []
+                row_result = await self.database.fetch(
+                    self.statement.get_all_with_filter,
+                    {"scope_type": scope_type, "scope_id": scope_id, "author_id": author_id},
+                )
             else:
-                for future in concurrent.futures.as_completed(
-                    [
-                        executor.submit(
-                            self.database.cursor().execute,
-                            self.statement.get_all,
-                            ({"scope_type": scope_type, "scope_id": scope_id}),
-                        )
-                    ]
-                ):
-                    try:
-                        row_result = future.result()
-                    except Exception as exc:
-                        log.verbose(
-                            "Failed to complete playlist fetch from database", exc_info=exc
-                        )
-                        return []
+                row_result = await self.database.fetch(
+                    self.statement.get_all, {"scope_type": scope_type, "scope_id": scope_id}
+                )
+        except Exception as exc:
+            log.verbose("Failed to complete playlist fetch from database", exc_info=exc)
+            return []
         async for row in AsyncIter(row_result):
             output.append(PlaylistFetchResult(*row))
         return output
@@ -170,7 +202,7 @@ class PlaylistWrapper:
     async def fetch_all_converter(
         self, scope: str, playlist_name, playlist_id
     ) -> List[PlaylistFetchResult]:
-        """Fetch all playlists with the specified filter."""
+        """Fetch all playlists with the specified filter, without their tracks."""
         scope_type = self.get_scope_type(scope)
         try:
             playlist_id = int(playlist_id)
@@ -179,61 +211,54 @@ class PlaylistWrapper:
             playlist_id = -1
 
         output = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [
-                    executor.submit(
-                        self.database.cursor().execute,
-                        self.statement.get_all_converter,
-                        (
-                            {
-                                "scope_type": scope_type,
-                                "playlist_name": playlist_name,
-                                "playlist_id": playlist_id,
-                            }
-                        ),
-                    )
-                ]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    log.verbose("Failed to complete fetch from database", exc_info=exc)
-                    return []
+        try:
+            row_result = await self.database.fetch(
+                self.statement.get_all_converter,
+                {
+                    "scope_type": scope_type,
+                    "playlist_name": playlist_name,
+                    "playlist_id": playlist_id,
+                },
+            )
+        except Exception as exc:
+            log.verbose("Failed to complete fetch from database", exc_info=exc)
+            return []
 
-            async for row in AsyncIter(row_result):
-                output.append(PlaylistFetchResult(*row))
+        async for row in AsyncIter(row_result):
+            output.append(PlaylistFetchResult(*row))
         return output
 
     async def delete(self, scope: str, playlist_id: int, scope_id: int):
         """Deletes a single playlists."""
         scope_type = self.get_scope_type(scope)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.delete,
-                ({"playlist_id": playlist_id, "scope_id": scope_id, "scope_type": scope_type}),
-            )
+        await self.database.execute(
+            self.statement.delete,
+            {"playlist_id": playlist_id, "scope_id": scope_id, "scope_type": scope_type},
+        )
 
     async def delete_scheduled(self):
         """Clean up database from all deleted playlists."""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, self.statement.delete_scheduled)
+        await self.database.execute_batch(
+            [
+                (self.statement.delete_tracks_scheduled, [{}]),
+                (self.statement.delete_scheduled, [{}]),
+            ]
+        )
 
     async def drop(self, scope: str):
         """Delete all playlists in a scope."""
-        scope_type = self.get_scope_type(scope)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.delete_scope,
-                ({"scope_type": scope_type}),
-            )
+        values = {"scope_type": self.get_scope_type(scope)}
+        await self.database.execute_batch(
+            [
+                (self.statement.delete_tracks_scope, [values]),
+                (self.statement.delete_scope, [values]),
+            ]
+        )
 
     async def create_table(self):
-        """Create the playlist table."""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, PLAYLIST_CREATE_TABLE)
+        """Create the playlist tables."""
+        await self.database.execute(PLAYLIST_CREATE_TABLE)
+        await self.database.execute(PLAYLIST_TRACKS_CREATE_TABLE)
 
     async def upsert(
         self,
@@ -243,29 +268,63 @@ class PlaylistWrapper:
         scope_id: int,
         author_id: int,
         playlist_url: Optional[str],
-        tracks: List[MutableMapping],
+        tracks: Optional[List[MutableMapping]],
     ):
-        """Insert or update a playlist into the database."""
+        """Insert or update a playlist into the database.
+
+        The playlist's tracks are replaced by ``tracks``, unless it is ``None``.
+        """
         scope_type = self.get_scope_type(scope)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
+        key = {
+            "scope_type": scope_type,
+            "playlist_id": int(playlist_id),
+            "scope_id": int(scope_id),
+        }
+        operations = [
+            (
                 self.statement.upsert,
-                {
-                    "scope_type": str(scope_type),
-                    "playlist_id": int(playlist_id),
-                    "playlist_name": str(playlist_name),
-                    "scope_id": int(scope_id),
-                    "author_id": int(author_id),
-                    "playlist_url": playlist_url,
-                    "tracks": json.dumps(tracks),
-                },
+                [
+                    {
+                        **key,
+                        "playlist_name": str(playlist_name),
+                        "author_id": int(author_id),
+                        "playlist_url": playlist_url,
+                    }
+                ],
+            )
+        ]
+        if tracks is not None:
+            operations.append((self.statement.delete_tracks, [key]))
+            operations.append(
+                (
+                    self.statement.insert_tracks,
+                    [
+                        {**key, "position": position, "track": json.dumps(track)}
+                        for position, track in enumerate(tracks)
+                    ],
+                )
+            )
+        try:
+            await self.database.execute_batch(operations)
+        except apsw.Error as exc:
+            log.warning("Failed to save playlist %s", playlist_id, exc_info=exc)
+
+    async def append_tracks(
+        self, scope: str, playlist_id: int, scope_id: int, tracks: List[MutableMapping]
+    ):
+        """Add tracks to the end of a playlist, without reading or rewriting its other tracks."""
+        key = {
+            "scope_type": self.get_scope_type(scope),
+            "playlist_id": int(playlist_id),
+            "scope_id": int(scope_id),
+        }
+        try:
+            await self.database.executemany(
+                self.statement.append_tracks,
+                [{**key, "track": json.dumps(track)} for track in tracks],
             )
+        except apsw.Error as exc:
+            log.warning("Failed to add tracks to playlist %s", playlist_id, exc_info=exc)
 
     async def handle_playlist_user_id_deletion(self, user_id: int):
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.drop_user_playlists,
-                {"user_id": user_id},
-            )
+        await self.database.execute(self.statement.drop_user_playlists, {"user_id": user_id})
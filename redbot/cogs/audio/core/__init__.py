@@ -16,6 +16,9 @@ from redbot.core.data_manager import cog_data_path
 from redbot.core.i18n import Translator, cog_i18n
 from redbot.core.utils.antispam import AntiSpam
 
+from ..apis.http_client import AudioHTTPClient
+from ..guild_settings import GuildSettingsCache
+from ..idle_timers import IdleTimers
 from ..utils import (
     CacheLevel,
     PlaylistScope,
@@ -53,6 +56,7 @@ class Audio(
         self.playlist_api = None
         self.local_folder_current_path = None
         self.db_conn = None
+        self.local_track_index = None
 
         self._error_counter = Counter()
         self._error_timer = {}
@@ -62,6 +66,9 @@ class Audio(
         self._persist_queue_cache = {}
         self._dj_status_cache = {}
         self._dj_role_cache = {}
+        self._idle_since = {}
+        self.idle_timers = IdleTimers(self._on_idle_timeout)
+        self.guild_settings = GuildSettingsCache(self.config)
         self.skip_votes = {}
         self.play_lock = {}
         self.antispam: Dict[int, Dict[str, AntiSpam]] = defaultdict(lambda: defaultdict(AntiSpam))
@@ -79,6 +86,7 @@ class Audio(
         )
 
         self.session = aiohttp.ClientSession(json_serialize=json.dumps)
+        self.http_client = AudioHTTPClient(self.session)
         self.cog_ready_event = asyncio.Event()
         self._ws_resume = defaultdict(asyncio.Event)
         self._ws_op_codes = defaultdict(asyncio.LifoQueue)
@@ -27,14 +27,18 @@ from redbot.core import Config, commands
 from redbot.core.bot import Red
 from redbot.core.commands import Context
 from redbot.core.utils.antispam import AntiSpam
-from redbot.core.utils.dbtools import APSWConnectionWrapper
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
 
 if TYPE_CHECKING:
+    from ..apis.http_client import AudioHTTPClient
     from ..apis.interface import AudioAPIInterface
+    from ..apis.local_tracks import LocalTrackIndex
     from ..apis.playlist_interface import Playlist
     from ..apis.playlist_wrapper import PlaylistWrapper
     from ..audio_dataclasses import LocalPath, Query
     from ..equalizer import Equalizer
+    from ..guild_settings import GuildSettings, GuildSettingsCache
+    from ..idle_timers import IdleTimers
     from ..manager import ServerManager
 
 
@@ -50,8 +54,10 @@ class MixinMeta(ABC):
     managed_node_controller: Optional["ServerManager"]
     playlist_api: Optional["PlaylistWrapper"]
     local_folder_current_path: Optional[Path]
-    db_conn: Optional[APSWConnectionWrapper]
+    db_conn: Optional[ThreadedAPSWConnection]
+    local_track_index: Optional["LocalTrackIndex"]
     session: aiohttp.ClientSession
+    http_client: "AudioHTTPClient"
     antispam: Dict[int, Dict[str, AntiSpam]]
     llset_captcha_intervals: List[Tuple[datetime.timedelta, int]]
 
@@ -62,6 +68,9 @@ class MixinMeta(ABC):
     _persist_queue_cache: MutableMapping[int, bool]
     _dj_status_cache: MutableMapping[int, Optional[bool]]
     _dj_role_cache: MutableMapping[int, Optional[int]]
+    _idle_since: MutableMapping[int, float]
+    idle_timers: "IdleTimers"
+    guild_settings: "GuildSettingsCache"
     _error_timer: MutableMapping[int, float]
     _disconnected_players: MutableMapping[int, bool]
     global_api_user: MutableMapping[str, Any]
@@ -141,6 +150,14 @@ class MixinMeta(ABC):
     async def player_automated_timer(self) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def update_idle_timers(self, guild: discord.Guild) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def _on_idle_timeout(self, guild_id: int, kind: str) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     async def lavalink_event_handler(
         self, player: lavalink.Player, event_type: lavalink.LavalinkEvents, extra
@@ -308,6 +325,7 @@ class MixinMeta(ABC):
         author: discord.User,
         guild: discord.Guild,
         specified_user: bool = False,
+        load_tracks: bool = True,
     ) -> Tuple[Optional["Playlist"], str, str]:
         raise NotImplementedError()
 
@@ -463,6 +481,8 @@ class MixinMeta(ABC):
         queue: list,
         player: lavalink.player.Player,
         page_num: int,
+        guild_data: Optional["GuildSettings"] = None,
+        queue_dur: Optional[int] = None,
     ) -> discord.Embed:
         raise NotImplementedError()
 
@@ -498,6 +518,12 @@ class MixinMeta(ABC):
     ) -> discord.Embed:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def _build_playlist_info_page(
+        self, ctx: commands.Context, playlist: "Playlist", page_num: int, title: str
+    ) -> discord.Embed:
+        raise NotImplementedError()
+
     @abstractmethod
     def match_yt_playlist(self, url: str) -> bool:
         raise NotImplementedError()
@@ -553,6 +579,10 @@ class MixinMeta(ABC):
     async def icyparser(self, url: str) -> Optional[str]:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def _icyparser(self, url: str) -> Optional[str]:
+        raise NotImplementedError()
+
     @abstractmethod
     async def self_deafen(self, player: lavalink.Player) -> None:
         raise NotImplementedError()
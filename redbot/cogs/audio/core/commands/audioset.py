@@ -251,7 +251,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         if not keyword:
             return await ctx.send_help()
         exists = False
-        async with self.config.guild(ctx.guild).url_keyword_whitelist() as whitelist:
+        async with self.guild_settings.edit(ctx.guild, "url_keyword_whitelist") as whitelist:
             if keyword in whitelist:
                 exists = True
             else:
@@ -300,7 +300,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         whitelist = await self.config.guild(ctx.guild).url_keyword_whitelist()
         if not whitelist:
             return await self.send_embed_msg(ctx, title=_("Nothing in the whitelist."))
-        await self.config.guild(ctx.guild).url_keyword_whitelist.clear()
+        await self.guild_settings.clear(ctx.guild, "url_keyword_whitelist")
         return await self.send_embed_msg(
             ctx,
             title=_("Whitelist Modified"),
@@ -316,7 +316,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         if not keyword:
             return await ctx.send_help()
         exists = True
-        async with self.config.guild(ctx.guild).url_keyword_whitelist() as whitelist:
+        async with self.guild_settings.edit(ctx.guild, "url_keyword_whitelist") as whitelist:
             if keyword not in whitelist:
                 exists = False
             else:
@@ -344,7 +344,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         if not keyword:
             return await ctx.send_help()
         exists = False
-        async with self.config.guild(ctx.guild).url_keyword_blacklist() as blacklist:
+        async with self.guild_settings.edit(ctx.guild, "url_keyword_blacklist") as blacklist:
             if keyword in blacklist:
                 exists = True
             else:
@@ -393,7 +393,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         blacklist = await self.config.guild(ctx.guild).url_keyword_blacklist()
         if not blacklist:
             return await self.send_embed_msg(ctx, title=_("Nothing in the blacklist."))
-        await self.config.guild(ctx.guild).url_keyword_blacklist.clear()
+        await self.guild_settings.clear(ctx.guild, "url_keyword_blacklist")
         return await self.send_embed_msg(
             ctx,
             title=_("Blacklist Modified"),
@@ -409,7 +409,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         if not keyword:
             return await ctx.send_help()
         exists = True
-        async with self.config.guild(ctx.guild).url_keyword_blacklist() as blacklist:
+        async with self.guild_settings.edit(ctx.guild, "url_keyword_blacklist") as blacklist:
             if keyword not in blacklist:
                 exists = False
             else:
@@ -440,13 +440,13 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         msg = _("Auto-play when queue ends: {true_or_false}.").format(
             true_or_false=_("Enabled") if not autoplay else _("Disabled")
         )
-        await self.config.guild(ctx.guild).auto_play.set(not autoplay)
+        await self.guild_settings.set(ctx.guild, auto_play=not autoplay)
         if autoplay is not True and repeat is True:
             msg += _("\nRepeat has been disabled.")
-            await self.config.guild(ctx.guild).repeat.set(False)
+            await self.guild_settings.set(ctx.guild, repeat=False)
         if autoplay is not True and disconnect is True:
             msg += _("\nAuto-disconnecting at queue end has been disabled.")
-            await self.config.guild(ctx.guild).disconnect.set(False)
+            await self.guild_settings.set(ctx.guild, disconnect=False)
 
         await self.send_embed_msg(ctx, title=_("Setting Changed"), description=msg)
         if self._player_check(ctx):
@@ -523,7 +523,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                     description=_("Playlist {name} has no tracks.").format(name=playlist.name),
                 )
             playlist_data = dict(enabled=True, id=playlist.id, name=playlist.name, scope=scope)
-            await self.config.guild(ctx.guild).autoplaylist.set(playlist_data)
+            await self.guild_settings.set(ctx.guild, autoplaylist=playlist_data)
         except RuntimeError:
             return await self.send_embed_msg(
                 ctx,
@@ -563,7 +563,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
             scope=PlaylistScope.GLOBAL.value,
         )
 
-        await self.config.guild(ctx.guild).autoplaylist.set(playlist_data)
+        await self.guild_settings.set(ctx.guild, autoplaylist=playlist_data)
         return await self.send_embed_msg(
             ctx,
             title=_("Setting Changed"),
@@ -601,7 +601,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         daily_playlists = self._daily_playlist_cache.setdefault(
             ctx.guild.id, await self.config.guild(ctx.guild).daily_playlists()
         )
-        await self.config.guild(ctx.guild).daily_playlists.set(not daily_playlists)
+        await self.guild_settings.set(ctx.guild, daily_playlists=not daily_playlists)
         self._daily_playlist_cache[ctx.guild.id] = not daily_playlists
         await self.send_embed_msg(
             ctx,
@@ -628,9 +628,9 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         )
         if disconnect is not True and autoplay is True:
             msg += _("\nAuto-play has been disabled.")
-            await self.config.guild(ctx.guild).auto_play.set(False)
+            await self.guild_settings.set(ctx.guild, auto_play=False)
 
-        await self.config.guild(ctx.guild).disconnect.set(not disconnect)
+        await self.guild_settings.set(ctx.guild, disconnect=not disconnect)
 
         await self.send_embed_msg(ctx, title=_("Setting Changed"), description=msg)
 
@@ -666,7 +666,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         dj_enabled = self._dj_status_cache.setdefault(
             ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
         )
-        await self.config.guild(ctx.guild).dj_enabled.set(not dj_enabled)
+        await self.guild_settings.set(ctx.guild, dj_enabled=not dj_enabled)
         self._dj_status_cache[ctx.guild.id] = not dj_enabled
         await self.send_embed_msg(
             ctx,
@@ -705,8 +705,8 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 ),
             )
 
-        await self.config.guild(ctx.guild).emptydc_timer.set(seconds)
-        await self.config.guild(ctx.guild).emptydc_enabled.set(enabled)
+        await self.guild_settings.set(ctx.guild, emptydc_timer=seconds, emptydc_enabled=enabled)
+        await self.update_idle_timers(ctx.guild)
 
     @command_audioset.command(name="emptypause")
     @commands.guild_only()
@@ -733,8 +733,10 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                     num_seconds=self.get_time_string(seconds)
                 ),
             )
-        await self.config.guild(ctx.guild).emptypause_timer.set(seconds)
-        await self.config.guild(ctx.guild).emptypause_enabled.set(enabled)
+        await self.guild_settings.set(
+            ctx.guild, emptypause_timer=seconds, emptypause_enabled=enabled
+        )
+        await self.update_idle_timers(ctx.guild)
 
     @command_audioset.command(name="lyrics")
     @commands.guild_only()
@@ -742,7 +744,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_audioset_lyrics(self, ctx: commands.Context):
         """Prioritise tracks with lyrics."""
         prefer_lyrics = await self.config.guild(ctx.guild).prefer_lyrics()
-        await self.config.guild(ctx.guild).prefer_lyrics.set(not prefer_lyrics)
+        await self.guild_settings.set(ctx.guild, prefer_lyrics=not prefer_lyrics)
         await self.send_embed_msg(
             ctx,
             title=_("Setting Changed"),
@@ -775,8 +777,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 ),
             )
 
-        await self.config.guild(ctx.guild).jukebox_price.set(price)
-        await self.config.guild(ctx.guild).jukebox.set(jukebox)
+        await self.guild_settings.set(ctx.guild, jukebox_price=price, jukebox=jukebox)
 
     @command_audioset.command(name="localpath")
     @commands.is_owner()
@@ -882,7 +883,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                     seconds=self.get_time_string(seconds)
                 ),
             )
-        await self.config.guild(ctx.guild).maxlength.set(seconds)
+        await self.guild_settings.set(ctx.guild, maxlength=seconds)
 
     @command_audioset.command(name="notify")
     @commands.guild_only()
@@ -890,7 +891,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_audioset_notify(self, ctx: commands.Context):
         """Toggle track announcement and other bot messages."""
         notify = await self.config.guild(ctx.guild).notify()
-        await self.config.guild(ctx.guild).notify.set(not notify)
+        await self.guild_settings.set(ctx.guild, notify=not notify)
         await self.send_embed_msg(
             ctx,
             title=_("Setting Changed"),
@@ -905,7 +906,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_audioset_auto_deafen(self, ctx: commands.Context):
         """Toggle whether the bot will be auto deafened upon joining the voice channel."""
         auto_deafen = await self.config.guild(ctx.guild).auto_deafen()
-        await self.config.guild(ctx.guild).auto_deafen.set(not auto_deafen)
+        await self.guild_settings.set(ctx.guild, auto_deafen=not auto_deafen)
         await self.send_embed_msg(
             ctx,
             title=_("Setting Changed"),
@@ -939,7 +940,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
     @commands.admin_or_permissions(manage_roles=True)
     async def command_audioset_role(self, ctx: commands.Context, *, role_name: discord.Role):
         """Set the role to use for DJ mode."""
-        await self.config.guild(ctx.guild).dj_role.set(role_name.id)
+        await self.guild_settings.set(ctx.guild, dj_role=role_name.id)
         self._dj_role_cache[ctx.guild.id] = role_name.id
         dj_role = self._dj_role_cache.setdefault(
             ctx.guild.id, await self.config.guild(ctx.guild).dj_role()
@@ -1191,7 +1192,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_audioset_thumbnail(self, ctx: commands.Context):
         """Toggle displaying a thumbnail on audio messages."""
         thumbnail = await self.config.guild(ctx.guild).thumbnail()
-        await self.config.guild(ctx.guild).thumbnail.set(not thumbnail)
+        await self.guild_settings.set(ctx.guild, thumbnail=not thumbnail)
         await self.send_embed_msg(
             ctx,
             title=_("Setting Changed"),
@@ -1226,8 +1227,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 description=_("Vote percentage set to {percent}%.").format(percent=percent),
             )
 
-        await self.config.guild(ctx.guild).vote_percent.set(percent)
-        await self.config.guild(ctx.guild).vote_enabled.set(enabled)
+        await self.guild_settings.set(ctx.guild, vote_percent=percent, vote_enabled=enabled)
 
     @command_audioset.command(name="cache")
     @commands.is_owner()
@@ -1253,6 +1253,28 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 max_age=str(await self.config.cache_age()) + " " + _("days"),
                 lavalink_status=_("Enabled") if has_lavalink_cache else _("Disabled"),
             )
+            if self.api_interface is not None:
+                hot = self.api_interface.local_cache_api.lavalink_hot
+                writes = self.api_interface.local_cache_api.lavalink_writes
+                msg += (
+                    _("Memory cache:     [{entries} entries, {size:.1f} MiB]\n")
+                    + _("Memory hit ratio: [{hit_ratio:.1%} of {lookups} lookups]\n")
+                ).format(
+                    entries=len(hot),
+                    size=hot.size / 1048576,
+                    hit_ratio=hot.hit_ratio,
+                    lookups=hot.hits + hot.misses,
+                )
+                msg += (
+                    _("Pending writes:   [{pending}]\n")
+                    + _("Flushed writes:   [{flushed} in {flushes} flushes]\n")
+                    + _("Last flush:       [{latency:.1f} ms]\n")
+                ).format(
+                    pending=writes.pending,
+                    flushed=writes.flushed_rows,
+                    flushes=writes.flushes,
+                    latency=writes.last_flush_latency * 1000,
+                )
             await self.send_embed_msg(
                 ctx, title=_("Cache Settings"), description=box(msg, lang="ini")
             )
@@ -1285,6 +1307,8 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         await self.send_embed_msg(ctx, title=_("Cache Settings"), description=box(msg, lang="ini"))
 
         await self.config.cache_level.set(newcache.value)
+        if not has_lavalink_cache and self.api_interface is not None:
+            self.api_interface.local_cache_api.lavalink_hot.clear()
 
     @command_audioset.command(name="cacheage")
     @commands.is_owner()
@@ -1315,7 +1339,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         persist_cache = self._persist_queue_cache.setdefault(
             ctx.guild.id, await self.config.guild(ctx.guild).persist_queue()
         )
-        await self.config.guild(ctx.guild).persist_queue.set(not persist_cache)
+        await self.guild_settings.set(ctx.guild, persist_queue=not persist_cache)
         self._persist_queue_cache[ctx.guild.id] = not persist_cache
         await self.send_embed_msg(
             ctx,
@@ -1380,10 +1404,10 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
             )
         current_volume = await self.config.guild(ctx.guild).volume()
         if current_volume > max_volume:
-            await self.config.guild(ctx.guild).volume.set(max_volume)
+            await self.guild_settings.set(ctx.guild, volume=max_volume)
             if self._player_check(ctx):
                 player = lavalink.get_player(ctx.guild.id)
                 await player.set_volume(max_volume)
                 player.store("notify_channel", ctx.channel.id)
 
-        await self.config.guild(ctx.guild).max_volume.set(max_volume)
+        await self.guild_settings.set(ctx.guild, max_volume=max_volume)
@@ -33,10 +33,9 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
         if not self._player_check(ctx):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
         else:
-            dj_enabled = self._dj_status_cache.setdefault(
-                ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-            )
-            vote_enabled = await self.config.guild(ctx.guild).vote_enabled()
+            guild_data = await self.guild_settings.get(ctx.guild)
+            dj_enabled = self._dj_status_cache.setdefault(ctx.guild.id, guild_data.dj_enabled)
+            vote_enabled = guild_data.vote_enabled
             player = lavalink.get_player(ctx.guild.id)
             can_skip = await self._can_instaskip(ctx, ctx.author)
             if (
@@ -117,13 +116,13 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
             with contextlib.suppress(discord.HTTPException):
                 await player.fetch("np_message").delete()
         embed = discord.Embed(title=_("Now Playing"), description=song)
-        guild_data = await self.config.guild(ctx.guild).all()
+        guild_data = await self.guild_settings.get(ctx.guild)
 
-        if guild_data["thumbnail"] and player.current and player.current.thumbnail:
+        if guild_data.thumbnail and player.current and player.current.thumbnail:
             embed.set_thumbnail(url=player.current.thumbnail)
-        shuffle = guild_data["shuffle"]
-        repeat = guild_data["repeat"]
-        autoplay = guild_data["auto_play"]
+        shuffle = guild_data.shuffle
+        repeat = guild_data.repeat
+        autoplay = guild_data.auto_play
         text = ""
         text += (
             _("Auto-Play")
@@ -147,10 +146,8 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
 
         player.store("np_message", message)
 
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
-        vote_enabled = await self.config.guild(ctx.guild).vote_enabled()
+        dj_enabled = self._dj_status_cache.setdefault(ctx.guild.id, guild_data.dj_enabled)
+        vote_enabled = guild_data.vote_enabled
         if (
             (dj_enabled or vote_enabled)
             and not await self._can_instaskip(ctx, ctx.author)
@@ -200,7 +197,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_pause(self, ctx: commands.Context):
         """Pause or resume a playing track."""
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
         if not self._player_check(ctx):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
@@ -243,10 +240,9 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
         """Skip to the start of the previously played track."""
         if not self._player_check(ctx):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
-        vote_enabled = await self.config.guild(ctx.guild).vote_enabled()
+        guild_data = await self.guild_settings.get(ctx.guild)
+        dj_enabled = self._dj_status_cache.setdefault(ctx.guild.id, guild_data.dj_enabled)
+        vote_enabled = guild_data.vote_enabled
         is_alone = await self.is_requester_alone(ctx)
         is_requester = await self.is_requester(ctx, ctx.author)
         can_skip = await self._can_instaskip(ctx, ctx.author)
@@ -307,10 +303,9 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
 
         Accepts seconds or a value formatted like 00:00:00 (`hh:mm:ss`) or 00:00 (`mm:ss`).
         """
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
-        vote_enabled = await self.config.guild(ctx.guild).vote_enabled()
+        guild_data = await self.guild_settings.get(ctx.guild)
+        dj_enabled = self._dj_status_cache.setdefault(ctx.guild.id, guild_data.dj_enabled)
+        vote_enabled = guild_data.vote_enabled
         is_alone = await self.is_requester_alone(ctx)
         is_requester = await self.is_requester(ctx, ctx.author)
         can_skip = await self._can_instaskip(ctx, ctx.author)
@@ -391,7 +386,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
         """Toggle shuffle."""
         if ctx.invoked_subcommand is None:
             dj_enabled = self._dj_status_cache.setdefault(
-                ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+                ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
             )
             can_skip = await self._can_instaskip(ctx, ctx.author)
             if dj_enabled and not can_skip:
@@ -413,8 +408,8 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
                     )
                 player.store("notify_channel", ctx.channel.id)
 
-            shuffle = await self.config.guild(ctx.guild).shuffle()
-            await self.config.guild(ctx.guild).shuffle.set(not shuffle)
+            shuffle = (await self.guild_settings.get(ctx.guild)).shuffle
+            await self.guild_settings.set(ctx.guild, shuffle=not shuffle)
             await self.send_embed_msg(
                 ctx,
                 title=_("Setting Changed"),
@@ -435,7 +430,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
         over `[p]shuffle`.
         """
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
         can_skip = await self._can_instaskip(ctx, ctx.author)
         if dj_enabled and not can_skip:
@@ -457,8 +452,8 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
                 )
             player.store("notify_channel", ctx.channel.id)
 
-        bumped = await self.config.guild(ctx.guild).shuffle_bumped()
-        await self.config.guild(ctx.guild).shuffle_bumped.set(not bumped)
+        bumped = (await self.guild_settings.get(ctx.guild)).shuffle_bumped
+        await self.guild_settings.set(ctx.guild, shuffle_bumped=not bumped)
         await self.send_embed_msg(
             ctx,
             title=_("Setting Changed"),
@@ -486,10 +481,9 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
             )
         if not player.current:
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
-        vote_enabled = await self.config.guild(ctx.guild).vote_enabled()
+        guild_data = await self.guild_settings.get(ctx.guild)
+        dj_enabled = self._dj_status_cache.setdefault(ctx.guild.id, guild_data.dj_enabled)
+        vote_enabled = guild_data.vote_enabled
         is_alone = await self.is_requester_alone(ctx)
         is_requester = await self.is_requester(ctx, ctx.author)
         if dj_enabled and not vote_enabled:
@@ -538,7 +532,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
                         vote_mods.append(member)
                 num_members = len(player.channel.members) - len(vote_mods)
                 vote = int(100 * num_votes / num_members)
-                percent = await self.config.guild(ctx.guild).vote_percent()
+                percent = (await self.guild_settings.get(ctx.guild)).vote_percent
                 if vote >= percent:
                     self.skip_votes[ctx.guild.id] = set()
                     await self.send_embed_msg(ctx, title=_("Vote threshold met."))
@@ -564,10 +558,9 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
     @commands.bot_has_permissions(embed_links=True)
     async def command_stop(self, ctx: commands.Context):
         """Stop playback and clear the queue."""
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
-        vote_enabled = await self.config.guild(ctx.guild).vote_enabled()
+        guild_data = await self.guild_settings.get(ctx.guild)
+        dj_enabled = self._dj_status_cache.setdefault(ctx.guild.id, guild_data.dj_enabled)
+        vote_enabled = guild_data.vote_enabled
         if not self._player_check(ctx):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
         player = lavalink.get_player(ctx.guild.id)
@@ -620,10 +613,9 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
     @commands.bot_has_permissions(embed_links=True)
     async def command_summon(self, ctx: commands.Context):
         """Summon the bot to a voice channel."""
-        dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
-        )
-        vote_enabled = await self.config.guild(ctx.guild).vote_enabled()
+        guild_data = await self.guild_settings.get(ctx.guild)
+        dj_enabled = self._dj_status_cache.setdefault(ctx.guild.id, guild_data.dj_enabled)
+        vote_enabled = guild_data.vote_enabled
         is_alone = await self.is_requester_alone(ctx)
         is_requester = await self.is_requester(ctx, ctx.author)
         can_skip = await self._can_instaskip(ctx, ctx.author)
@@ -657,7 +649,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
             if not self._player_check(ctx):
                 player = await lavalink.connect(
                     ctx.author.voice.channel,
-                    self_deaf=await self.config.guild_from_id(ctx.guild.id).auto_deafen(),
+                    self_deaf=(await self.guild_settings.get(ctx.guild.id)).auto_deafen,
                 )
                 player.store("notify_channel", ctx.channel.id)
             else:
@@ -675,7 +667,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
                     )
                 await player.move_to(
                     ctx.author.voice.channel,
-                    self_deaf=await self.config.guild_from_id(ctx.guild.id).auto_deafen(),
+                    self_deaf=(await self.guild_settings.get(ctx.guild.id)).auto_deafen,
                 )
             await ctx.tick()
         except AttributeError:
@@ -699,13 +691,13 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_volume(self, ctx: commands.Context, vol: int = None):
         """Set the volume, 1% - 150%."""
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
         can_skip = await self._can_instaskip(ctx, ctx.author)
-        max_volume = await self.config.guild(ctx.guild).max_volume()
+        max_volume = (await self.guild_settings.get(ctx.guild)).max_volume
 
         if not vol:
-            vol = await self.config.guild(ctx.guild).volume()
+            vol = (await self.guild_settings.get(ctx.guild)).volume
             embed = discord.Embed(title=_("Current Volume:"), description=f"{vol}%")
             if not self._player_check(ctx):
                 embed.set_footer(text=_("Nothing playing."))
@@ -729,7 +721,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
             )
 
         vol = max(0, min(vol, max_volume))
-        await self.config.guild(ctx.guild).volume.set(vol)
+        await self.guild_settings.set(ctx.guild, volume=vol)
         if self._player_check(ctx):
             player = lavalink.get_player(ctx.guild.id)
             await player.set_volume(vol)
@@ -746,7 +738,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_repeat(self, ctx: commands.Context):
         """Toggle repeat."""
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
         can_skip = await self._can_instaskip(ctx, ctx.author)
         if dj_enabled and not can_skip and not await self._has_dj_role(ctx, ctx.author):
@@ -768,16 +760,17 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
                 )
             player.store("notify_channel", ctx.channel.id)
 
-        autoplay = await self.config.guild(ctx.guild).auto_play()
-        repeat = await self.config.guild(ctx.guild).repeat()
+        guild_data = await self.guild_settings.get(ctx.guild)
+        autoplay = guild_data.auto_play
+        repeat = guild_data.repeat
         msg = ""
         msg += _("Repeat tracks: {true_or_false}.").format(
             true_or_false=_("Enabled") if not repeat else _("Disabled")
         )
-        await self.config.guild(ctx.guild).repeat.set(not repeat)
+        await self.guild_settings.set(ctx.guild, repeat=not repeat)
         if repeat is not True and autoplay is True:
             msg += _("\nAuto-play has been disabled.")
-            await self.config.guild(ctx.guild).auto_play.set(False)
+            await self.guild_settings.set(ctx.guild, auto_play=False)
 
         embed = discord.Embed(title=_("Setting Changed"), description=msg)
         await self.send_embed_msg(ctx, embed=embed)
@@ -790,7 +783,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_remove(self, ctx: commands.Context, index_or_url: Union[int, str]):
         """Remove a specific track number from the queue."""
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
         if not self._player_check(ctx):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
@@ -867,7 +860,7 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_bump(self, ctx: commands.Context, index: int):
         """Bump a track number to the top of the queue."""
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
         if not self._player_check(ctx):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
@@ -39,7 +39,7 @@ class EqualizerCommands(MixinMeta, metaclass=CompositeMetaClass):
             ctx.command.reset_cooldown(ctx)
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
         player = lavalink.get_player(ctx.guild.id)
         eq = player.fetch("eq", Equalizer())
@@ -165,7 +165,7 @@ class EqualizerCommands(MixinMeta, metaclass=CompositeMetaClass):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
 
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
         player = lavalink.get_player(ctx.guild.id)
         if dj_enabled and not await self._can_instaskip(ctx, ctx.author):
@@ -194,7 +194,7 @@ class EqualizerCommands(MixinMeta, metaclass=CompositeMetaClass):
         if not self._player_check(ctx):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
         if dj_enabled and not await self._can_instaskip(ctx, ctx.author):
             return await self.send_embed_msg(
@@ -228,7 +228,7 @@ class EqualizerCommands(MixinMeta, metaclass=CompositeMetaClass):
         if not self._player_check(ctx):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
         if dj_enabled and not await self._can_instaskip(ctx, ctx.author):
             ctx.command.reset_cooldown(ctx)
@@ -318,7 +318,7 @@ class EqualizerCommands(MixinMeta, metaclass=CompositeMetaClass):
             return await self.send_embed_msg(ctx, title=_("Nothing playing."))
 
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
         if dj_enabled and not await self._can_instaskip(ctx, ctx.author):
             return await self.send_embed_msg(
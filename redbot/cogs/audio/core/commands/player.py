@@ -37,7 +37,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_play(self, ctx: commands.Context, *, query: str):
         """Play the specified track or search for a close match."""
         query = Query.process_input(query, self.local_folder_current_path)
-        guild_data = await self.config.guild(ctx.guild).all()
+        guild_data = await self.guild_settings.get(ctx.guild)
         restrict = await self.config.restrict()
         if restrict and self.match_url(str(query)):
             valid_url = self.is_url_allowed(str(query))
@@ -52,7 +52,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                 ctx, title=_("Unable To Play Tracks"), description=_("That track is not allowed.")
             )
         can_skip = await self._can_instaskip(ctx, ctx.author)
-        if guild_data["dj_enabled"] and not can_skip:
+        if guild_data.dj_enabled and not can_skip:
             return await self.send_embed_msg(
                 ctx,
                 title=_("Unable To Play Tracks"),
@@ -80,7 +80,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                     )
                 await lavalink.connect(
                     ctx.author.voice.channel,
-                    self_deaf=await self.config.guild_from_id(ctx.guild.id).auto_deafen(),
+                    self_deaf=(await self.guild_settings.get(ctx.guild.id)).auto_deafen,
                 )
             except AttributeError:
                 return await self.send_embed_msg(
@@ -117,7 +117,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                 ctx, title=_("Unable To Play Tracks"), description=_("Queue size limit reached.")
             )
 
-        if not await self.maybe_charge_requester(ctx, guild_data["jukebox_price"]):
+        if not await self.maybe_charge_requester(ctx, guild_data.jukebox_price):
             return
         try:
             await self._enqueue_tracks(ctx, query)
@@ -143,7 +143,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                 title=_("Unable To Bump Track"),
                 description=_("Only single tracks work with bump play."),
             )
-        guild_data = await self.config.guild(ctx.guild).all()
+        guild_data = await self.guild_settings.get(ctx.guild)
         restrict = await self.config.restrict()
         if restrict and self.match_url(str(query)):
             valid_url = self.is_url_allowed(str(query))
@@ -158,7 +158,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                 ctx, title=_("Unable To Play Tracks"), description=_("That track is not allowed.")
             )
         can_skip = await self._can_instaskip(ctx, ctx.author)
-        if guild_data["dj_enabled"] and not can_skip:
+        if guild_data.dj_enabled and not can_skip:
             return await self.send_embed_msg(
                 ctx,
                 title=_("Unable To Play Tracks"),
@@ -186,7 +186,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                     )
                 await lavalink.connect(
                     ctx.author.voice.channel,
-                    self_deaf=await self.config.guild_from_id(ctx.guild.id).auto_deafen(),
+                    self_deaf=(await self.guild_settings.get(ctx.guild.id)).auto_deafen,
                 )
             except AttributeError:
                 return await self.send_embed_msg(
@@ -223,7 +223,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                 ctx, title=_("Unable To Play Tracks"), description=_("Queue size limit reached.")
             )
 
-        if not await self.maybe_charge_requester(ctx, guild_data["jukebox_price"]):
+        if not await self.maybe_charge_requester(ctx, guild_data.jukebox_price):
             return
 
         try:
@@ -284,8 +284,8 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                 title=_("Unable To Play Tracks"),
                 description=_("This track is not allowed in this server."),
             )
-        elif guild_data["maxlength"] > 0:
-            if self.is_track_length_allowed(single_track, guild_data["maxlength"]):
+        elif guild_data.maxlength > 0:
+            if self.is_track_length_allowed(single_track, guild_data.maxlength):
                 single_track.requester = ctx.author
                 single_track.extras.update(
                     {
@@ -324,7 +324,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
             single_track, self.local_folder_current_path
         )
         footer = None
-        if not play_now and not guild_data["shuffle"] and queue_dur > 0:
+        if not play_now and not guild_data.shuffle and queue_dur > 0:
             footer = _("{time} until track playback: #1 in queue").format(
                 time=self.format_time(queue_dur)
             )
@@ -345,8 +345,8 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
     @commands.mod_or_permissions(manage_guild=True)
     async def command_autoplay(self, ctx: commands.Context):
         """Starts auto play."""
-        guild_data = await self.config.guild(ctx.guild).all()
-        if guild_data["dj_enabled"] and not await self._can_instaskip(ctx, ctx.author):
+        guild_data = await self.guild_settings.get(ctx.guild)
+        if guild_data.dj_enabled and not await self._can_instaskip(ctx, ctx.author):
             return await self.send_embed_msg(
                 ctx,
                 title=_("Unable To Play Tracks"),
@@ -374,7 +374,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                     )
                 await lavalink.connect(
                     ctx.author.voice.channel,
-                    self_deaf=await self.config.guild_from_id(ctx.guild.id).auto_deafen(),
+                    self_deaf=(await self.guild_settings.get(ctx.guild.id)).auto_deafen,
                 )
             except AttributeError:
                 return await self.send_embed_msg(
@@ -404,7 +404,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
             return await self.send_embed_msg(
                 ctx, title=_("Unable To Play Tracks"), description=_("Queue size limit reached.")
             )
-        if not await self.maybe_charge_requester(ctx, guild_data["jukebox_price"]):
+        if not await self.maybe_charge_requester(ctx, guild_data.jukebox_price):
             return
         try:
             await self.api_interface.autoplay(player, self.playlist_api)
@@ -428,9 +428,9 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
             self.update_player_lock(ctx, False)
             raise e
 
-        if not guild_data["auto_play"]:
+        if not guild_data.auto_play:
             await ctx.invoke(self.command_audioset_autoplay_toggle)
-        if not guild_data["notify"] and not player.fetch("autoplay_notified", False):
+        if not guild_data.notify and not player.fetch("autoplay_notified", False):
             pass
         elif player.current:
             await self.send_embed_msg(ctx, title=_("Adding a track to queue."))
@@ -499,7 +499,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                     )
                 await lavalink.connect(
                     ctx.author.voice.channel,
-                    self_deaf=await self.config.guild_from_id(ctx.guild.id).auto_deafen(),
+                    self_deaf=(await self.guild_settings.get(ctx.guild.id)).auto_deafen,
                 )
             except AttributeError:
                 return await self.send_embed_msg(
@@ -514,7 +514,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                     description=_("Connection to Lavalink node has not yet been established."),
                 )
         player = lavalink.get_player(ctx.guild.id)
-        guild_data = await self.config.guild(ctx.guild).all()
+        guild_data = await self.guild_settings.get(ctx.guild)
         player.store("notify_channel", ctx.channel.id)
         can_skip = await self._can_instaskip(ctx, ctx.author)
         if (not ctx.author.voice or ctx.author.voice.channel != player.channel) and not can_skip:
@@ -601,7 +601,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                     return await self.send_embed_msg(ctx, embed=embed)
                 queue_dur = await self.queue_duration(ctx)
                 queue_total_duration = self.format_time(queue_dur)
-                if guild_data["dj_enabled"] and not can_skip:
+                if guild_data.dj_enabled and not can_skip:
                     return await self.send_embed_msg(
                         ctx,
                         title=_("Unable To Play Tracks"),
@@ -621,8 +621,8 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                     ):
                         log.debug("Query is not allowed in %r (%s)", ctx.guild.name, ctx.guild.id)
                         continue
-                    elif guild_data["maxlength"] > 0:
-                        if self.is_track_length_allowed(track, guild_data["maxlength"]):
+                    elif guild_data.maxlength > 0:
+                        if self.is_track_length_allowed(track, guild_data.maxlength):
                             track_len += 1
                             track.extras.update(
                                 {
@@ -662,7 +662,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
                         num=track_len, maxlength_msg=maxlength_msg
                     )
                 )
-                if not guild_data["shuffle"] and queue_dur > 0:
+                if not guild_data.shuffle and queue_dur > 0:
                     if query.is_local and query.is_album:
                         footer = _("folder")
                     else:
@@ -722,7 +722,7 @@ class PlayerCommands(MixinMeta, metaclass=CompositeMetaClass):
             tracks = query
 
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
 
         len_search_pages = math.ceil(len(tracks) / 5)
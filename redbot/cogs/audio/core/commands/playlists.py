@@ -7,7 +7,7 @@ import time
 
 from io import BytesIO
 from pathlib import Path
-from typing import cast
+from typing import MutableMapping, cast
 
 import discord
 import lavalink
@@ -18,8 +18,8 @@ from redbot.core.commands import UserInputOptional
 from redbot.core.data_manager import cog_data_path
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.chat_formatting import bold, pagify
-from redbot.core.utils.menus import menu
+from redbot.core.utils.chat_formatting import bold
+from redbot.core.utils.menus import close_menu, menu
 from redbot.core.utils.predicates import MessagePredicate
 
 from ...apis.api_utils import FakePlaylist
@@ -139,8 +139,7 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                 return await self.send_embed_msg(
                     ctx, title=_("Could not find a track matching your query.")
                 )
-            track_list = playlist.tracks
-            current_count = len(track_list)
+            current_count = playlist.track_count
             to_append_count = len(to_append)
             tracks_obj_list = playlist.tracks_obj
             not_added = 0
@@ -182,9 +181,8 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                         to_append_temp.append(t)
                 to_append = to_append_temp
             if appended > 0:
-                track_list.extend(to_append)
-                update = {"tracks": track_list, "url": None}
-                await playlist.edit(update)
+                await playlist.append_tracks(to_append)
+                await playlist.edit({"url": None})
 
             if to_append_count == 1 and appended == 1:
                 track_title = to_append[0]["info"]["title"]
@@ -476,7 +474,7 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
         async with ctx.typing():
             try:
                 playlist, playlist_arg, scope = await self.get_playlist_match(
-                    ctx, playlist_matches, scope, author, guild, specified_user
+                    ctx, playlist_matches, scope, author, guild, specified_user, load_tracks=False
                 )
             except TooManyMatches as e:
                 return await self.send_embed_msg(ctx, title=str(e))
@@ -828,7 +826,7 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
         async with ctx.typing():
             try:
                 playlist, playlist_arg, scope = await self.get_playlist_match(
-                    ctx, playlist_matches, scope, author, guild, specified_user
+                    ctx, playlist_matches, scope, author, guild, specified_user, load_tracks=False
                 )
             except TooManyMatches as e:
                 ctx.command.reset_cooldown(ctx)
@@ -846,34 +844,6 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                         arg=playlist_arg
                     ),
                 )
-            track_len = len(playlist.tracks)
-
-            msg = "​"
-            if track_len > 0:
-                spaces = "\N{EN SPACE}" * (len(str(len(playlist.tracks))) + 2)
-                async for track_idx, track in AsyncIter(playlist.tracks).enumerate(start=1):
-                    query = Query.process_input(
-                        track["info"]["uri"], self.local_folder_current_path
-                    )
-                    if query.is_local:
-                        if track["info"]["title"] != "Unknown title":
-                            msg += "`{}.` **{} - {}**\n{}{}\n".format(
-                                track_idx,
-                                track["info"]["author"],
-                                track["info"]["title"],
-                                spaces,
-                                query.to_string_user(),
-                            )
-                        else:
-                            msg += "`{}.` {}\n".format(track_idx, query.to_string_user())
-                    else:
-                        msg += "`{}.` **[{}]({})**\n".format(
-                            track_idx, track["info"]["title"], track["info"]["uri"]
-                        )
-
-            else:
-                msg = "No tracks."
-
             if not playlist.url:
                 embed_title = _(
                     "Playlist info for {playlist_name} (`{id}`) [**{scope}**]:\n"
@@ -885,21 +855,36 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                     playlist_name=playlist.name, url=playlist.url, id=playlist.id, scope=scope_name
                 )
 
-            page_list = []
-            pages = list(pagify(msg, delims=["\n"], page_length=2000))
-            total_pages = len(pages)
-            async for numb, page in AsyncIter(pages).enumerate(start=1):
-                embed = discord.Embed(
-                    colour=await ctx.embed_colour(), title=embed_title, description=page
+            # only the tracks of the pages that are shown get read from the database
+            total_pages = max(math.ceil(playlist.track_count / 10), 1)
+            page_list = [discord.Embed() for __ in range(total_pages)]
+            page_list[0] = await self._build_playlist_info_page(ctx, playlist, 1, embed_title)
+            loaded_pages = {0}
+
+        async def _change_page(
+            ctx: commands.Context,
+            pages: list,
+            controls: MutableMapping,
+            message: discord.Message,
+            page: int,
+            timeout: float,
+            emoji: str,
+        ):
+            page = (page + (-1 if emoji == prev_emoji else 1)) % len(pages)
+            if page not in loaded_pages:
+                pages[page] = await self._build_playlist_info_page(
+                    ctx, playlist, page + 1, embed_title
                 )
-                author_obj = self.bot.get_user(playlist.author) or playlist.author or _("Unknown")
-                embed.set_footer(
-                    text=_("Page {page}/{pages} | Author: {author_name} | {num} track(s)").format(
-                        author_name=author_obj, num=track_len, pages=total_pages, page=numb
-                    )
-                )
-                page_list.append(embed)
-        await menu(ctx, page_list)
+                loaded_pages.add(page)
+            return await menu(ctx, pages, controls, message=message, page=page, timeout=timeout)
+
+        prev_emoji = "\N{LEFTWARDS BLACK ARROW}\N{VARIATION SELECTOR-16}"
+        info_controls = {
+            prev_emoji: _change_page,
+            "\N{CROSS MARK}": close_menu,
+            "\N{BLACK RIGHTWARDS ARROW}\N{VARIATION SELECTOR-16}": _change_page,
+        }
+        await menu(ctx, page_list, info_controls if total_pages > 1 else None)
 
     @commands.cooldown(1, 15, commands.BucketType.guild)
     @command_playlist.command(name="list", usage="[args]", cooldown_after_parsing=True)
@@ -1033,7 +1018,7 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                         (
                             bold(playlist.name),
                             _("ID: {id}").format(id=playlist.id),
-                            _("Tracks: {num}").format(num=len(playlist.tracks)),
+                            _("Tracks: {num}").format(num=playlist.track_count),
                             _("Author: {name}").format(
                                 name=self.bot.get_user(playlist.author)
                                 or playlist.author
@@ -1448,7 +1433,7 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
             scope_data = [None, ctx.author, ctx.guild, False]
         scope, author, guild, specified_user = scope_data
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
         if dj_enabled and not await self._can_instaskip(ctx, ctx.author):
             ctx.command.reset_cooldown(ctx)
@@ -1479,11 +1464,11 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
             if not await self._playlist_check(ctx):
                 ctx.command.reset_cooldown(ctx)
                 return
-            jukebox_price = await self.config.guild(ctx.guild).jukebox_price()
+            jukebox_price = (await self.guild_settings.get(ctx.guild)).jukebox_price
             if not await self.maybe_charge_requester(ctx, jukebox_price):
                 ctx.command.reset_cooldown(ctx)
                 return
-            maxlength = await self.config.guild(ctx.guild).maxlength()
+            maxlength = (await self.guild_settings.get(ctx.guild)).maxlength
             author_obj = self.bot.get_user(ctx.author.id)
             track_len = 0
             try:
@@ -1829,7 +1814,9 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                     ctx, title=_("Only Red playlist files can be uploaded.")
                 )
             try:
-                async with self.session.request("GET", file_url) as r:
+                async with self.http_client.request(
+                    "discord", "GET", file_url, endpoint="attachments"
+                ) as r:
                     uploaded_playlist = await r.json(
                         content_type="text/plain", encoding="utf-8", loads=json.loads
                     )
@@ -1970,7 +1957,7 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                 )
             try:
                 playlist, playlist_arg, scope = await self.get_playlist_match(
-                    ctx, playlist_matches, scope, author, guild, specified_user
+                    ctx, playlist_matches, scope, author, guild, specified_user, load_tracks=False
                 )
             except TooManyMatches as e:
                 ctx.command.reset_cooldown(ctx)
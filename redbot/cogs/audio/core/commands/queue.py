@@ -22,6 +22,7 @@ from redbot.core.utils.menus import (
 )
 from redbot.core.utils.predicates import ReactionPredicate
 
+from ...queue_stats import get_queue_stats
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass
 
@@ -81,13 +82,13 @@ class QueueCommands(MixinMeta, metaclass=CompositeMetaClass):
             song += _("\n Requested by: **{track.requester}**").format(track=player.current)
             song += f"\n\n{arrow}`{pos}`/`{dur}`"
             embed = discord.Embed(title=_("Now Playing"), description=song)
-            guild_data = await self.config.guild(ctx.guild).all()
-            if guild_data["thumbnail"] and player.current and player.current.thumbnail:
+            guild_data = await self.guild_settings.get(ctx.guild)
+            if guild_data.thumbnail and player.current and player.current.thumbnail:
                 embed.set_thumbnail(url=player.current.thumbnail)
 
-            shuffle = guild_data["shuffle"]
-            repeat = guild_data["repeat"]
-            autoplay = guild_data["auto_play"]
+            shuffle = guild_data.shuffle
+            repeat = guild_data.repeat
+            autoplay = guild_data.auto_play
             text = ""
             text += (
                 _("Auto-Play")
@@ -108,8 +109,8 @@ class QueueCommands(MixinMeta, metaclass=CompositeMetaClass):
             )
             embed.set_footer(text=text)
             message = await self.send_embed_msg(ctx, embed=embed)
-            dj_enabled = self._dj_status_cache.setdefault(ctx.guild.id, guild_data["dj_enabled"])
-            vote_enabled = guild_data["vote_enabled"]
+            dj_enabled = self._dj_status_cache.setdefault(ctx.guild.id, guild_data.dj_enabled)
+            vote_enabled = guild_data.vote_enabled
             if (
                 (dj_enabled or vote_enabled)
                 and not await self._can_instaskip(ctx, ctx.author)
@@ -167,8 +168,12 @@ class QueueCommands(MixinMeta, metaclass=CompositeMetaClass):
             limited_queue = player.queue[:500]  # TODO: Improve when Toby menu's are merged
             len_queue_pages = math.ceil(len(limited_queue) / 10)
             queue_page_list = []
+            guild_data = await self.guild_settings.get(ctx.guild)
+            queue_dur = await self.queue_duration(ctx)
             async for page_num in AsyncIter(range(1, len_queue_pages + 1)):
-                embed = await self._build_queue_page(ctx, limited_queue, player, page_num)
+                embed = await self._build_queue_page(
+                    ctx, limited_queue, player, page_num, guild_data, queue_dur
+                )
                 queue_page_list.append(embed)
             if page > len_queue_pages:
                 page = len_queue_pages
@@ -182,7 +187,7 @@ class QueueCommands(MixinMeta, metaclass=CompositeMetaClass):
         except (NodeNotFound, PlayerNotFound):
             return await self.send_embed_msg(ctx, title=_("There's nothing in the queue."))
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
         if not self._player_check(ctx) or not player.queue:
             return await self.send_embed_msg(ctx, title=_("There's nothing in the queue."))
@@ -213,7 +218,7 @@ class QueueCommands(MixinMeta, metaclass=CompositeMetaClass):
         except (NodeNotFound, PlayerNotFound):
             return await self.send_embed_msg(ctx, title=_("There's nothing in the queue."))
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
         if not self._player_check(ctx) or not player.queue:
             return await self.send_embed_msg(ctx, title=_("There's nothing in the queue."))
@@ -261,6 +266,8 @@ class QueueCommands(MixinMeta, metaclass=CompositeMetaClass):
             return await self.send_embed_msg(ctx, title=_("There's nothing in the queue."))
         if not self._player_check(ctx) or not player.queue:
             return await self.send_embed_msg(ctx, title=_("There's nothing in the queue."))
+        if not get_queue_stats(player).requesters[ctx.author.id]:
+            return await self.send_embed_msg(ctx, title=_("Removed 0 tracks."))
 
         clean_tracks = []
         removed_tracks = 0
@@ -310,7 +317,7 @@ class QueueCommands(MixinMeta, metaclass=CompositeMetaClass):
     async def command_queue_shuffle(self, ctx: commands.Context):
         """Shuffles the queue."""
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
         if (
             dj_enabled
@@ -344,7 +351,7 @@ class QueueCommands(MixinMeta, metaclass=CompositeMetaClass):
                 )
             player = await lavalink.connect(
                 ctx.author.voice.channel,
-                self_deaf=await self.config.guild_from_id(ctx.guild.id).auto_deafen(),
+                self_deaf=(await self.guild_settings.get(ctx.guild.id)).auto_deafen,
             )
             player.store("notify_channel", ctx.channel.id)
         except AttributeError:
@@ -40,7 +40,7 @@ class AudioEvents(MixinMeta, metaclass=CompositeMetaClass):
         track_identifier = track.track_identifier
         if self.playlist_api is not None:
             daily_cache = self._daily_playlist_cache.setdefault(
-                guild.id, await self.config.guild(guild).daily_playlists()
+                guild.id, (await self.guild_settings.get(guild)).daily_playlists
             )
             global_daily_playlists = self._daily_global_playlist_cache.setdefault(
                 self.bot.user.id, await self.config.daily_playlists()
@@ -60,14 +60,13 @@ class AudioEvents(MixinMeta, metaclass=CompositeMetaClass):
                         bot=self.bot,
                         guild=guild,
                         author=self.bot.user,
+                        with_tracks=False,
                     )
                 except RuntimeError:
                     playlist = None
 
                 if playlist:
-                    tracks = playlist.tracks
-                    tracks.append(track)
-                    await playlist.edit({"tracks": tracks})
+                    await playlist.append_tracks([track])
                 else:
                     playlist = Playlist(
                         bot=self.bot,
@@ -91,13 +90,12 @@ class AudioEvents(MixinMeta, metaclass=CompositeMetaClass):
                         guild=guild,
                         author=self.bot.user,
                         playlist_api=self.playlist_api,
+                        with_tracks=False,
                     )
                 except RuntimeError:
                     playlist = None
                 if playlist:
-                    tracks = playlist.tracks
-                    tracks.append(track)
-                    await playlist.edit({"tracks": tracks})
+                    await playlist.append_tracks([track])
                 else:
                     playlist = Playlist(
                         bot=self.bot,
@@ -138,7 +136,7 @@ class AudioEvents(MixinMeta, metaclass=CompositeMetaClass):
                     "Failed to delete global daily playlist ID: %s", too_old_id, exc_info=exc
                 )
         persist_cache = self._persist_queue_cache.setdefault(
-            guild.id, await self.config.guild(guild).persist_queue()
+            guild.id, (await self.guild_settings.get(guild)).persist_queue
         )
         if persist_cache:
             await self.api_interface.persistent_queue_api.played(
@@ -164,7 +162,7 @@ class AudioEvents(MixinMeta, metaclass=CompositeMetaClass):
         if not (track and guild):
             return
         persist_cache = self._persist_queue_cache.setdefault(
-            guild.id, await self.config.guild(guild).persist_queue()
+            guild.id, (await self.guild_settings.get(guild)).persist_queue
         )
         if persist_cache:
             await self.api_interface.persistent_queue_api.enqueued(
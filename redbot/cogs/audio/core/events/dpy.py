@@ -249,9 +249,9 @@ class DpyEvents(MixinMeta, metaclass=CompositeMetaClass):
             if not notify_channel:
                 player.store("notify_channel", ctx.channel.id)
 
-        self._daily_global_playlist_cache.setdefault(
-            self.bot.user.id, await self.config.daily_playlists()
-        )
+        if self.bot.user.id not in self._daily_global_playlist_cache:
+            daily_playlists = await self.config.daily_playlists()
+            self._daily_global_playlist_cache[self.bot.user.id] = daily_playlists
         if self.local_folder_current_path is None:
             self.local_folder_current_path = Path(await self.config.localpath())
 
@@ -301,17 +301,15 @@ class DpyEvents(MixinMeta, metaclass=CompositeMetaClass):
 
         if not guild:
             return
-        guild_data = await self.config.guild(ctx.guild).all()
-        dj_enabled = self._dj_status_cache.setdefault(ctx.guild.id, guild_data["dj_enabled"])
-        self._daily_playlist_cache.setdefault(ctx.guild.id, guild_data["daily_playlists"])
-        self._persist_queue_cache.setdefault(ctx.guild.id, guild_data["persist_queue"])
+        guild_data = await self.guild_settings.get(ctx.guild)
+        dj_enabled = self._dj_status_cache.setdefault(ctx.guild.id, guild_data.dj_enabled)
+        self._daily_playlist_cache.setdefault(ctx.guild.id, guild_data.daily_playlists)
+        self._persist_queue_cache.setdefault(ctx.guild.id, guild_data.persist_queue)
         if dj_enabled:
-            dj_role = self._dj_role_cache.setdefault(ctx.guild.id, guild_data["dj_role"])
+            dj_role = self._dj_role_cache.setdefault(ctx.guild.id, guild_data.dj_role)
             dj_role_obj = ctx.guild.get_role(dj_role)
             if not dj_role_obj:
-                async with self.config.guild(ctx.guild).all() as write_guild_data:
-                    write_guild_data["dj_enabled"] = None
-                    write_guild_data["dj_role"] = None
+                await self.guild_settings.set(ctx.guild, dj_enabled=None, dj_role=None)
                 self._dj_status_cache[ctx.guild.id] = None
                 self._dj_role_cache[ctx.guild.id] = None
                 await self.send_embed_msg(ctx, title=_("No DJ role found. Disabling DJ mode."))
@@ -453,13 +451,14 @@ class DpyEvents(MixinMeta, metaclass=CompositeMetaClass):
                 self.skip_votes[before.channel.guild.id].discard(member.id)
             except (ValueError, KeyError, AttributeError):
                 pass
+            await self.update_idle_timers(member.guild)
 
         channel = self.rgetattr(member, "voice.channel", None)
         bot_voice_state = self.rgetattr(member, "guild.me.voice.self_deaf", None)
         if (
             channel
             and bot_voice_state is False
-            and await self.config.guild(member.guild).auto_deafen()
+            and (await self.guild_settings.get(member.guild)).auto_deafen
         ):
             try:
                 player = lavalink.get_player(channel.guild.id)
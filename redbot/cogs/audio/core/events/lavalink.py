@@ -51,14 +51,14 @@ class LavalinkEvents(MixinMeta, metaclass=CompositeMetaClass):
             return
         # This event is rather spammy during playback - specially if there's multiple player
         #  Lets move it to Verbose that way it still there if needed alongside the other more verbose content.
-        guild_data = await self.config.guild(guild).all()
-        disconnect = guild_data["disconnect"]
+        guild_data = await self.guild_settings.get(guild)
+        disconnect = guild_data.disconnect
         if event_type == lavalink.LavalinkEvents.FORCED_DISCONNECT:
             self.bot.dispatch("red_audio_audio_disconnect", guild)
             self._ll_guild_updates.discard(guild.id)
             return
         if event_type == lavalink.LavalinkEvents.WEBSOCKET_CLOSED:
-            deafen = guild_data["auto_deafen"]
+            deafen = guild_data.auto_deafen
             event_channel_id = extra.get("channelID")
             _error_code = extra.get("code")
             if _error_code in [1000] or not guild:
@@ -117,9 +117,9 @@ class LavalinkEvents(MixinMeta, metaclass=CompositeMetaClass):
         current_thumbnail = self.rgetattr(current_track, "thumbnail", None)
         current_id = self.rgetattr(current_track, "_info", {}).get("identifier")
 
-        repeat = guild_data["repeat"]
-        notify = guild_data["notify"]
-        autoplay = guild_data["auto_play"]
+        repeat = guild_data.repeat
+        notify = guild_data.notify
+        autoplay = guild_data.auto_play
         description = await self.get_track_description(
             current_track, self.local_folder_current_path
         )
@@ -135,6 +135,7 @@ class LavalinkEvents(MixinMeta, metaclass=CompositeMetaClass):
             player.store("prev_requester", requester)
             player.store("playing_song", current_track)
             player.store("requester", current_requester)
+            await self.update_idle_timers(guild)
             self.bot.dispatch("red_audio_track_start", guild, current_track, current_requester)
             if guild_id and current_track:
                 await self.api_interface.persistent_queue_api.played(
@@ -202,7 +203,7 @@ class LavalinkEvents(MixinMeta, metaclass=CompositeMetaClass):
                     dur = self.format_time(current_length)
 
                 thumb = None
-                if await self.config.guild(guild).thumbnail() and current_thumbnail:
+                if guild_data.thumbnail and current_thumbnail:
                     thumb = current_thumbnail
 
                 notify_message = await self.send_embed_msg(
@@ -1,10 +1,9 @@
-import asyncio
 import time
 from pathlib import Path
 
-from typing import Dict
-
+import discord
 import lavalink
+from lavalink import NodeNotFound, PlayerNotFound
 from red_commons.logging import getLogger
 
 from redbot.core.i18n import Translator
@@ -19,78 +18,60 @@ _ = Translator("Audio", Path(__file__))
 
 class PlayerTasks(MixinMeta, metaclass=CompositeMetaClass):
     async def player_automated_timer(self) -> None:
-        stop_times: Dict = {}
-        pause_times: Dict = {}
-        while True:
-            async for p in AsyncIter(lavalink.all_players()):
-                server = p.guild
-                if await self.bot.cog_disabled_in_guild(self, server):
-                    continue
+        async for p in AsyncIter(lavalink.all_players()):
+            await self.update_idle_timers(p.guild)
+        await self.idle_timers.run()
+
+    async def update_idle_timers(self, guild: discord.Guild) -> None:
+        try:
+            player = lavalink.get_player(guild.id)
+        except (NodeNotFound, PlayerNotFound):
+            player = None
+        if player is None or await self.bot.cog_disabled_in_guild(self, guild):
+            self._idle_since.pop(guild.id, None)
+            self.idle_timers.disarm(guild.id)
+            return
 
-                if p.channel.members and all(m.bot for m in p.channel.members):
-                    stop_times.setdefault(server.id, time.time())
-                    pause_times.setdefault(server.id, time.time())
-                else:
-                    stop_times.pop(server.id, None)
-                    if p.paused and server.id in pause_times:
-                        try:
-                            await p.pause(False)
-                        except Exception as exc:
-                            log.debug("Exception raised in Audio's unpausing %r.", p, exc_info=exc)
-                    pause_times.pop(server.id, None)
-            servers = stop_times.copy()
-            servers.update(pause_times)
-            async for sid in AsyncIter(servers, steps=5):
-                server_obj = self.bot.get_guild(sid)
-                if not server_obj:
-                    stop_times.pop(sid, None)
-                    pause_times.pop(sid, None)
-                    try:
-                        player = lavalink.get_player(sid)
-                        await self.api_interface.persistent_queue_api.drop(sid)
-                        player.store("autoplay_notified", False)
-                        await player.stop()
-                        await player.disconnect()
-                        await self.config.guild_from_id(
-                            guild_id=sid
-                        ).currently_auto_playing_in.set([])
-                    except Exception as exc:
-                        log.debug(
-                            "Exception raised in Audio's emptydc_timer for %s.", sid, exc_info=exc
-                        )
+        members = player.channel.members if player.channel else []
+        if members and all(m.bot for m in members):
+            since = self._idle_since.setdefault(guild.id, time.monotonic())
+            guild_data = await self.guild_settings.get(guild)
+            if guild_data.emptydc_enabled:
+                self.idle_timers.disarm(guild.id, "pause")
+                self.idle_timers.arm(guild.id, "disconnect", since + guild_data.emptydc_timer)
+            elif guild_data.emptypause_enabled and not player.paused:
+                self.idle_timers.disarm(guild.id, "disconnect")
+                self.idle_timers.arm(guild.id, "pause", since + guild_data.emptypause_timer)
+            else:
+                self.idle_timers.disarm(guild.id)
+        else:
+            self.idle_timers.disarm(guild.id)
+            if self._idle_since.pop(guild.id, None) is not None and player.paused:
+                try:
+                    await player.pause(False)
+                except Exception as exc:
+                    log.debug("Exception raised in Audio's unpausing %r.", player, exc_info=exc)
 
-                elif sid in stop_times and await self.config.guild(server_obj).emptydc_enabled():
-                    emptydc_timer = await self.config.guild(server_obj).emptydc_timer()
-                    if (time.time() - stop_times[sid]) >= emptydc_timer:
-                        stop_times.pop(sid)
-                        try:
-                            player = lavalink.get_player(sid)
-                            await self.api_interface.persistent_queue_api.drop(sid)
-                            player.store("autoplay_notified", False)
-                            await player.stop()
-                            await player.disconnect()
-                            await self.config.guild_from_id(
-                                guild_id=sid
-                            ).currently_auto_playing_in.set([])
-                        except Exception as exc:
-                            if "No such player for that guild" in str(exc):
-                                stop_times.pop(sid, None)
-                            log.debug(
-                                "Exception raised in Audio's emptydc_timer for %s.",
-                                sid,
-                                exc_info=exc,
-                            )
-                elif (
-                    sid in pause_times and await self.config.guild(server_obj).emptypause_enabled()
-                ):
-                    emptypause_timer = await self.config.guild(server_obj).emptypause_timer()
-                    if (time.time() - pause_times.get(sid, 0)) >= emptypause_timer:
-                        try:
-                            await lavalink.get_player(sid).pause()
-                        except Exception as exc:
-                            if "No such player for that guild" in str(exc):
-                                pause_times.pop(sid, None)
-                            log.debug(
-                                "Exception raised in Audio's pausing for %s.", sid, exc_info=exc
-                            )
-            await asyncio.sleep(5)
+    async def _on_idle_timeout(self, guild_id: int, kind: str) -> None:
+        guild = self.bot.get_guild(guild_id)
+        if guild is not None:
+            # the deadline was armed by the last event, make sure nothing was missed since
+            await self.update_idle_timers(guild)
+            deadline = self.idle_timers.get_deadline(guild_id, kind)
+            if deadline is None or deadline > time.monotonic():
+                return
+            self.idle_timers.disarm(guild_id, kind)
+            if kind == "pause":
+                await lavalink.get_player(guild_id).pause()
+                return
+        self._idle_since.pop(guild_id, None)
+        self.idle_timers.disarm(guild_id)
+        try:
+            player = lavalink.get_player(guild_id)
+        except (NodeNotFound, PlayerNotFound):
+            return
+        await self.api_interface.persistent_queue_api.drop(guild_id)
+        player.store("autoplay_notified", False)
+        await player.stop()
+        await player.disconnect()
+        await self.config.guild_from_id(guild_id=guild_id).currently_auto_playing_in.set([])
@@ -1,9 +1,11 @@
 import asyncio
-import itertools
+import statistics
+import time
 from pathlib import Path
 
-from typing import Optional
+from typing import Dict, Final, List, MutableMapping, Optional, Tuple
 
+import discord
 import lavalink
 from lavalink import NodeNotFound, PlayerNotFound
 from red_commons.logging import getLogger
@@ -11,17 +13,27 @@ from red_commons.logging import getLogger
 from redbot.core.data_manager import cog_data_path
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.dbtools import APSWConnectionWrapper
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
 
+from ...apis.api_utils import QueueFetchResult
 from ...apis.interface import AudioAPIInterface
+from ...apis.local_tracks import LocalTrackIndex
 from ...apis.playlist_wrapper import PlaylistWrapper
 from ...errors import DatabaseError, TrackEnqueueError
+from ...sql_statements import (
+    PRAGMA_SET_journal_mode,
+    PRAGMA_SET_read_uncommitted,
+    PRAGMA_SET_temp_store,
+)
 from ..abc import MixinMeta
 from ..cog_utils import _SCHEMA_VERSION, CompositeMetaClass
 
 log = getLogger("red.cogs.Audio.cog.Tasks.startup")
 _ = Translator("Audio", Path(__file__))
 
+# The maximum amount of players restored at the same time on startup
+_RESTORE_CONCURRENCY: Final[int] = 10
+
 
 class StartUpTasks(MixinMeta, metaclass=CompositeMetaClass):
     def start_up_task(self):
@@ -35,15 +47,22 @@ class StartUpTasks(MixinMeta, metaclass=CompositeMetaClass):
         await self.bot.wait_until_red_ready()
         # Unlike most cases, we want the cache to exit before migration.
         try:
-            self.db_conn = APSWConnectionWrapper(
-                str(cog_data_path(self.bot.get_cog("Audio")) / "Audio.db")
+            self.db_conn = ThreadedAPSWConnection(
+                cog_data_path(self.bot.get_cog("Audio")) / "Audio.db",
+                setup_statements=(
+                    PRAGMA_SET_temp_store,
+                    PRAGMA_SET_journal_mode,
+                    PRAGMA_SET_read_uncommitted,
+                ),
             )
             self.api_interface = AudioAPIInterface(
-                self.bot, self.config, self.session, self.db_conn, self.bot.get_cog("Audio")
+                self.bot, self.config, self.http_client, self.db_conn, self.bot.get_cog("Audio")
             )
             self.playlist_api = PlaylistWrapper(self.bot, self.config, self.db_conn)
             await self.playlist_api.init()
             await self.api_interface.initialize()
+            self.local_track_index = LocalTrackIndex(self.db_conn)
+            await self.local_track_index.init()
             self.global_api_user = await self.api_interface.global_cache_api.get_perms()
             await self.data_schema_migration(
                 from_version=await self.config.schema_version(), to_version=_SCHEMA_VERSION
@@ -81,6 +100,7 @@ class StartUpTasks(MixinMeta, metaclass=CompositeMetaClass):
             )
             log.warning("Audio will attempt queue restore on next restart.")
             return
+        start = time.perf_counter()
         metadata = {}
         all_guilds = await self.config.all_guilds()
         async for guild_id, guild_data in AsyncIter(all_guilds.items(), steps=100):
@@ -91,200 +111,222 @@ class StartUpTasks(MixinMeta, metaclass=CompositeMetaClass):
         if self.lavalink_connection_aborted:
             log.warning("Aborting player restore due to Lavalink connection being aborted.")
             return
-        for guild_id, track_data in itertools.groupby(tracks_to_restore, key=lambda x: x.guild_id):
-            await asyncio.sleep(0)
-            tries = 0
-            try:
-                player: Optional[lavalink.Player] = None
-                track_data = list(track_data)
-                guild = self.bot.get_guild(guild_id)
-                if not guild:
-                    log.verbose(
-                        "Skipping player restore - Bot is no longer in Guild (%s)", guild_id
-                    )
-                    continue
-                persist_cache = self._persist_queue_cache.setdefault(
-                    guild_id, await self.config.guild(guild).persist_queue()
-                )
-                if not persist_cache:
-                    log.verbose(
-                        "Skipping player restore - Guild (%s) does not have a persist cache",
-                        guild_id,
-                    )
-                    await self.api_interface.persistent_queue_api.drop(guild_id)
-                    continue
-                try:
-                    player = lavalink.get_player(guild_id)
-                except (NodeNotFound, PlayerNotFound):
-                    player = None
-                vc = 0
-                guild_data = await self.config.guild_from_id(guild.id).all()
-                shuffle = guild_data["shuffle"]
-                repeat = guild_data["repeat"]
-                volume = guild_data["volume"]
-                shuffle_bumped = guild_data["shuffle_bumped"]
-                auto_deafen = guild_data["auto_deafen"]
-
-                if player is None:
-                    while tries < 5 and vc is not None:
-                        try:
-                            notify_channel_id, vc_id = metadata.pop(
-                                guild_id, (None, track_data[-1].room_id)
-                            )
-                            vc = guild.get_channel(vc_id)
-                            if not vc:
-                                break
-                            perms = vc.permissions_for(guild.me)
-                            if not (perms.connect and perms.speak):
-                                vc = None
-                                break
-                            player = await lavalink.connect(vc, self_deaf=auto_deafen)
-                            player.store("notify_channel", notify_channel_id)
-                            break
-                        except NodeNotFound:
-                            await asyncio.sleep(5)
-                            tries += 1
-                        except Exception as exc:
-                            tries += 1
-                            log.debug(
-                                "Failed to restore music voice channel %s", vc_id, exc_info=exc
-                            )
-                            if vc is None:
-                                break
-                            else:
-                                await asyncio.sleep(1)
-
-                if tries >= 5 or vc is None or player is None:
-                    if tries >= 5:
-                        log.verbose(
-                            "Skipping player restore - Guild (%s), 5 attempts to restore player failed.",
-                            guild_id,
-                        )
-                    elif vc is None:
-                        log.verbose(
-                            "Skipping player restore - Guild (%s), VC (%s) does not exist.",
-                            guild_id,
-                            vc_id,
-                        )
-                    else:
-                        log.verbose(
-                            "Skipping player restore - Guild (%s), Unable to create player for VC (%s).",
-                            guild_id,
-                            vc_id,
-                        )
-                    await self.api_interface.persistent_queue_api.drop(guild_id)
-                    continue
-
-                player.repeat = repeat
-                player.shuffle = shuffle
-                player.shuffle_bumped = shuffle_bumped
-                if player.volume != volume:
-                    await player.set_volume(volume)
-                for track in track_data:
-                    track = track.track_object
-                    player.add(guild.get_member(track.extras.get("requester")) or guild.me, track)
-                player.maybe_shuffle()
-                if not player.is_playing:
-                    await player.play()
-                log.debug("Restored %r", player)
-            except Exception as exc:
-                log.debug("Error restoring player in %s", guild_id, exc_info=exc)
-                await self.api_interface.persistent_queue_api.drop(guild_id)
 
-        for guild_id, (notify_channel_id, vc_id) in metadata.items():
+        queues: Dict[int, List[QueueFetchResult]] = {}
+        for track_data in tracks_to_restore:
+            queues.setdefault(track_data.guild_id, []).append(track_data)
+        jobs = []
+        for guild_id in {**queues, **metadata}:
             guild = self.bot.get_guild(guild_id)
-            player: Optional[lavalink.Player] = None
-            vc = 0
-            tries = 0
             if not guild:
+                log.verbose("Skipping player restore - Bot is no longer in Guild (%s)", guild_id)
                 continue
-            if self.lavalink_connection_aborted:
-                player = None
-            else:
-                try:
-                    player = lavalink.get_player(guild_id)
-                except (NodeNotFound, PlayerNotFound):
-                    player = None
-            if player is None:
-                guild_data = await self.config.guild_from_id(guild.id).all()
-                shuffle = guild_data["shuffle"]
-                repeat = guild_data["repeat"]
-                volume = guild_data["volume"]
-                shuffle_bumped = guild_data["shuffle_bumped"]
-                auto_deafen = guild_data["auto_deafen"]
+            track_data = queues.get(guild_id)
+            __, vc_id = metadata.get(guild_id, (None, track_data[-1].room_id if track_data else 0))
+            vc = guild.get_channel(vc_id)
+            has_listeners = vc is not None and any(not m.bot for m in vc.members)
+            jobs.append((not has_listeners, guild, track_data))
+        # guilds with people waiting in the voice channel are restored first
+        jobs.sort(key=lambda job: job[0])
 
-                while tries < 5 and vc is not None:
-                    try:
-                        vc = guild.get_channel(vc_id)
-                        if not vc:
-                            break
-                        perms = vc.permissions_for(guild.me)
-                        if not (perms.connect and perms.speak):
-                            vc = None
-                            break
-                        player = await lavalink.connect(vc, self_deaf=auto_deafen)
-                        player.store("notify_channel", notify_channel_id)
-                        break
-                    except NodeNotFound:
-                        await asyncio.sleep(5)
-                        tries += 1
-                    except Exception as exc:
-                        tries += 1
-                        log.debug("Failed to restore music voice channel %s", vc_id, exc_info=exc)
-                        if vc is None:
-                            break
-                        else:
-                            await asyncio.sleep(1)
-                if tries >= 5 or vc is None or player is None:
-                    if tries >= 5:
-                        log.verbose(
-                            "Skipping player restore - Guild (%s), 5 attempts to restore player failed.",
-                            guild_id,
-                        )
-                    elif vc is None:
-                        log.verbose(
-                            "Skipping player restore - Guild (%s), VC (%s) does not exist.",
-                            guild_id,
-                            vc_id,
+        restored = 0
+        processed = 0
+        latencies = []
+        semaphore = asyncio.Semaphore(_RESTORE_CONCURRENCY)
+
+        async def restore(guild: discord.Guild, track_data: Optional[List[QueueFetchResult]]):
+            nonlocal restored, processed
+            async with semaphore:
+                if self.lavalink_connection_aborted:
+                    return
+                guild_data = all_guilds.get(guild.id)
+                if guild_data is None:
+                    guild_data = await self.config.guild(guild).all()
+                try:
+                    if track_data is not None:
+                        success = await self._restore_player_queue(
+                            guild, track_data, guild_data, metadata
                         )
                     else:
-                        log.verbose(
-                            "Skipping player restore - Guild (%s), Unable to create player for VC (%s).",
-                            guild_id,
-                            vc_id,
+                        success = await self._restore_autoplay_player(
+                            guild, guild_data, *metadata[guild.id]
                         )
-                    continue
+                except Exception as exc:
+                    log.debug("Error restoring player in %s", guild.id, exc_info=exc)
+                    if track_data is not None:
+                        await self.api_interface.persistent_queue_api.drop(guild.id)
+                    success = False
+            processed += 1
+            if success:
+                restored += 1
+                latencies.append(time.perf_counter() - start)
+            log.debug(
+                "Player restore progress: %s/%s guilds processed, %s players restored.",
+                processed,
+                len(jobs),
+                restored,
+            )
 
-                player.repeat = repeat
-                player.shuffle = shuffle
-                player.shuffle_bumped = shuffle_bumped
-                if player.volume != volume:
-                    await player.set_volume(volume)
-                player.maybe_shuffle()
-                log.debug("Restored %r", player)
-                if not player.is_playing:
-                    notify_channel = player.fetch("notify_channel")
-                    try:
-                        await self.api_interface.autoplay(player, self.playlist_api)
-                    except DatabaseError:
-                        notify_channel = guild.get_channel_or_thread(notify_channel)
-                        if notify_channel:
-                            await self.send_embed_msg(
-                                notify_channel, title=_("Couldn't get a valid track.")
-                            )
-                        return
-                    except TrackEnqueueError:
-                        notify_channel = guild.get_channel_or_thread(notify_channel)
-                        if notify_channel:
-                            await self.send_embed_msg(
-                                notify_channel,
-                                title=_("Unable to Get Track"),
-                                description=_(
-                                    "I'm unable to get a track from the Lavalink node at the moment, "
-                                    "try again in a few minutes."
-                                ),
-                            )
-                        return
+        await asyncio.gather(*(restore(guild, track_data) for __, guild, track_data in jobs))
+        if jobs:
+            log.info(
+                "Restored %s of %s players in %.2fs (first after %.2fs, median after %.2fs).",
+                restored,
+                len(jobs),
+                time.perf_counter() - start,
+                latencies[0] if latencies else 0,
+                statistics.median(latencies) if latencies else 0,
+            )
         del metadata
         del all_guilds
         log.debug("Player restore task completed successfully")
+
+    async def _connect_restored_player(
+        self,
+        guild: discord.Guild,
+        vc_id: int,
+        notify_channel_id: Optional[int],
+        auto_deafen: bool,
+    ) -> Optional[lavalink.Player]:
+        player: Optional[lavalink.Player] = None
+        vc = 0
+        tries = 0
+        while tries < 5 and vc is not None:
+            try:
+                vc = guild.get_channel(vc_id)
+                if not vc:
+                    break
+                perms = vc.permissions_for(guild.me)
+                if not (perms.connect and perms.speak):
+                    vc = None
+                    break
+                player = await lavalink.connect(vc, self_deaf=auto_deafen)
+                player.store("notify_channel", notify_channel_id)
+                break
+            except NodeNotFound:
+                await asyncio.sleep(5)
+                tries += 1
+            except Exception as exc:
+                tries += 1
+                log.debug("Failed to restore music voice channel %s", vc_id, exc_info=exc)
+                if vc is None:
+                    break
+                else:
+                    await asyncio.sleep(1)
+
+        if tries >= 5 or vc is None or player is None:
+            if tries >= 5:
+                log.verbose(
+                    "Skipping player restore - Guild (%s), 5 attempts to restore player failed.",
+                    guild.id,
+                )
+            elif vc is None:
+                log.verbose(
+                    "Skipping player restore - Guild (%s), VC (%s) does not exist.",
+                    guild.id,
+                    vc_id,
+                )
+            else:
+                log.verbose(
+                    "Skipping player restore - Guild (%s), Unable to create player for VC (%s).",
+                    guild.id,
+                    vc_id,
+                )
+            return None
+        return player
+
+    async def _apply_restored_settings(
+        self, player: lavalink.Player, guild_data: MutableMapping
+    ) -> None:
+        player.repeat = guild_data["repeat"]
+        player.shuffle = guild_data["shuffle"]
+        player.shuffle_bumped = guild_data["shuffle_bumped"]
+        if player.volume != guild_data["volume"]:
+            await player.set_volume(guild_data["volume"])
+
+    async def _restore_player_queue(
+        self,
+        guild: discord.Guild,
+        track_data: List[QueueFetchResult],
+        guild_data: MutableMapping,
+        metadata: MutableMapping[int, Tuple[Optional[int], int]],
+    ) -> bool:
+        persist_cache = self._persist_queue_cache.setdefault(guild.id, guild_data["persist_queue"])
+        if not persist_cache:
+            log.verbose(
+                "Skipping player restore - Guild (%s) does not have a persist cache",
+                guild.id,
+            )
+            await self.api_interface.persistent_queue_api.drop(guild.id)
+            if guild.id in metadata:
+                return await self._restore_autoplay_player(guild, guild_data, *metadata[guild.id])
+            return False
+        try:
+            player = lavalink.get_player(guild.id)
+        except (NodeNotFound, PlayerNotFound):
+            player = None
+        if player is None:
+            notify_channel_id, vc_id = metadata.pop(guild.id, (None, track_data[-1].room_id))
+            player = await self._connect_restored_player(
+                guild, vc_id, notify_channel_id, guild_data["auto_deafen"]
+            )
+            if player is None:
+                await self.api_interface.persistent_queue_api.drop(guild.id)
+                return False
+
+        await self._apply_restored_settings(player, guild_data)
+        for track in track_data:
+            track = track.track_object
+            player.add(guild.get_member(track.extras.get("requester")) or guild.me, track)
+        player.maybe_shuffle()
+        if not player.is_playing:
+            await player.play()
+        log.debug("Restored %r", player)
+        return True
+
+    async def _restore_autoplay_player(
+        self,
+        guild: discord.Guild,
+        guild_data: MutableMapping,
+        notify_channel_id: Optional[int],
+        vc_id: int,
+    ) -> bool:
+        try:
+            lavalink.get_player(guild.id)
+        except (NodeNotFound, PlayerNotFound):
+            pass
+        else:
+            return False
+        player = await self._connect_restored_player(
+            guild, vc_id, notify_channel_id, guild_data["auto_deafen"]
+        )
+        if player is None:
+            return False
+
+        await self._apply_restored_settings(player, guild_data)
+        player.maybe_shuffle()
+        log.debug("Restored %r", player)
+        if not player.is_playing:
+            notify_channel = player.fetch("notify_channel")
+            try:
+                await self.api_interface.autoplay(player, self.playlist_api)
+            except DatabaseError:
+                notify_channel = guild.get_channel_or_thread(notify_channel)
+                if notify_channel:
+                    await self.send_embed_msg(
+                        notify_channel, title=_("Couldn't get a valid track.")
+                    )
+                return False
+            except TrackEnqueueError:
+                notify_channel = guild.get_channel_or_thread(notify_channel)
+                if notify_channel:
+                    await self.send_embed_msg(
+                        notify_channel,
+                        title=_("Unable to Get Track"),
+                        description=_(
+                            "I'm unable to get a track from the Lavalink node at the moment, "
+                            "try again in a few minutes."
+                        ),
+                    )
+                return False
+        return True
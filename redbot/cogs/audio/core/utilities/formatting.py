@@ -39,7 +39,7 @@ class FormattingUtilities(MixinMeta, metaclass=CompositeMetaClass):
             try:
                 await lavalink.connect(
                     ctx.author.voice.channel,
-                    self_deaf=await self.config.guild_from_id(ctx.guild.id).auto_deafen(),
+                    self_deaf=(await self.guild_settings.get(ctx.guild.id)).auto_deafen,
                 )
             except AttributeError:
                 return await self.send_embed_msg(ctx, title=_("Connect to a voice channel first."))
@@ -49,12 +49,12 @@ class FormattingUtilities(MixinMeta, metaclass=CompositeMetaClass):
                 )
         player = lavalink.get_player(ctx.guild.id)
         player.store("notify_channel", ctx.channel.id)
-        guild_data = await self.config.guild(ctx.guild).all()
+        guild_data = await self.guild_settings.get(ctx.guild)
         if len(player.queue) >= 10000:
             return await self.send_embed_msg(
                 ctx, title=_("Unable To Play Tracks"), description=_("Queue size limit reached.")
             )
-        if not await self.maybe_charge_requester(ctx, guild_data["jukebox_price"]):
+        if not await self.maybe_charge_requester(ctx, guild_data.jukebox_price):
             return
         try:
             if emoji == "\N{DIGIT ONE}\N{COMBINING ENCLOSING KEYCAP}":
@@ -106,8 +106,8 @@ class FormattingUtilities(MixinMeta, metaclass=CompositeMetaClass):
             return await self.send_embed_msg(
                 ctx, title=_("This track is not allowed in this server.")
             )
-        elif guild_data["maxlength"] > 0:
-            if self.is_track_length_allowed(search_choice, guild_data["maxlength"]):
+        elif guild_data.maxlength > 0:
+            if self.is_track_length_allowed(search_choice, guild_data.maxlength):
                 search_choice.extras.update(
                     {
                         "enqueue_time": int(time.time()),
@@ -134,7 +134,7 @@ class FormattingUtilities(MixinMeta, metaclass=CompositeMetaClass):
             player.maybe_shuffle()
             self.bot.dispatch("red_audio_track_enqueue", player.guild, search_choice, ctx.author)
 
-        if not guild_data["shuffle"] and queue_dur > 0:
+        if not guild_data.shuffle and queue_dur > 0:
             songembed.set_footer(
                 text=_("{time} until track playback: #{position} in queue").format(
                     time=queue_total_duration, position=before_queue_length + 1
@@ -29,11 +29,7 @@ class LocalTrackUtilities(MixinMeta, metaclass=CompositeMetaClass):
         if not await self.localtracks_folder_exists(ctx):
             return []
 
-        return (
-            await audio_data.subfolders_in_tree()
-            if search_subfolders
-            else await audio_data.subfolders()
-        )
+        return await self._get_local_folders(audio_data, search_subfolders)
 
     async def get_localtrack_folder_list(self, ctx: commands.Context, query: Query) -> List[Query]:
         """Return a list of folders per the provided query."""
@@ -44,11 +40,7 @@ class LocalTrackUtilities(MixinMeta, metaclass=CompositeMetaClass):
             return []
         if not query.local_track_path.exists():
             return []
-        return (
-            await query.local_track_path.tracks_in_tree()
-            if query.search_subfolders
-            else await query.local_track_path.tracks_in_folder()
-        )
+        return await self._get_local_tracks(query.local_track_path, query.search_subfolders)
 
     async def get_localtrack_folder_tracks(
         self, ctx, player: lavalink.player.Player, query: Query
@@ -92,10 +84,36 @@ class LocalTrackUtilities(MixinMeta, metaclass=CompositeMetaClass):
     ) -> List[Query]:
         if not await self.localtracks_folder_exists(ctx) or query.local_track_path is None:
             return []
+        return await self._get_local_tracks(query.local_track_path, query.search_subfolders)
+
+    async def _get_local_tracks(
+        self, local_path: LocalPath, search_subfolders: bool
+    ) -> List[Query]:
+        if self.local_track_index is None:
+            return (
+                await local_path.tracks_in_tree()
+                if search_subfolders
+                else await local_path.tracks_in_folder()
+            )
         return (
-            await query.local_track_path.tracks_in_tree()
-            if query.search_subfolders
-            else await query.local_track_path.tracks_in_folder()
+            await self.local_track_index.tracks_in_tree(local_path)
+            if search_subfolders
+            else await self.local_track_index.tracks_in_folder(local_path)
+        )
+
+    async def _get_local_folders(
+        self, local_path: LocalPath, search_subfolders: bool
+    ) -> List[LocalPath]:
+        if self.local_track_index is None:
+            return (
+                await local_path.subfolders_in_tree()
+                if search_subfolders
+                else await local_path.subfolders()
+            )
+        return (
+            await self.local_track_index.subfolders_in_tree(local_path)
+            if search_subfolders
+            else await self.local_track_index.subfolders(local_path)
         )
 
     async def localtracks_folder_exists(self, ctx: commands.Context) -> bool:
@@ -113,21 +131,18 @@ class LocalTrackUtilities(MixinMeta, metaclass=CompositeMetaClass):
     async def _build_local_search_list(
         self, to_search: List[Query], search_words: str
     ) -> List[str]:
-        to_search_string = {
-            i.local_track_path.name for i in to_search if i.local_track_path is not None
-        }
+        tracks_by_name = {}
+        for i in to_search:
+            if i.local_track_path is not None:
+                tracks_by_name.setdefault(i.local_track_path.name, []).append(i)
         search_results = rapidfuzz.process.extract(
-            search_words, to_search_string, limit=50, processor=rapidfuzz.utils.default_process
+            search_words,
+            tracks_by_name.keys(),
+            limit=50,
+            processor=rapidfuzz.utils.default_process,
         )
         search_list = []
         async for track_match, percent_match, __ in AsyncIter(search_results):
             if percent_match > 85:
-                search_list.extend(
-                    [
-                        i.to_string_user()
-                        for i in to_search
-                        if i.local_track_path is not None
-                        and i.local_track_path.name == track_match
-                    ]
-                )
+                search_list.extend(i.to_string_user() for i in tracks_by_name[track_match])
         return search_list
@@ -19,6 +19,7 @@ from redbot.core.utils import AsyncIter, can_user_send_messages_in
 from redbot.core.utils.chat_formatting import humanize_number
 
 from ...apis.playlist_interface import get_all_playlist_for_migration23
+from ...queue_stats import get_queue_stats
 from ...utils import PlaylistScope
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass, DataReader
@@ -37,7 +38,7 @@ class MiscellaneousUtilities(MixinMeta, metaclass=CompositeMetaClass):
         return asyncio.create_task(self.clear_react(message, emoji))
 
     async def maybe_charge_requester(self, ctx: commands.Context, jukebox_price: int) -> bool:
-        jukebox = await self.config.guild(ctx.guild).jukebox()
+        jukebox = (await self.guild_settings.get(ctx.guild)).jukebox
         if jukebox and not await self._can_instaskip(ctx, ctx.author):
             can_spend = await bank.can_spend(ctx.author, jukebox_price)
             if can_spend:
@@ -115,7 +116,7 @@ class MiscellaneousUtilities(MixinMeta, metaclass=CompositeMetaClass):
     async def _close_database(self) -> None:
         if self.api_interface is not None:
             await self.api_interface.run_all_pending_tasks()
-            self.api_interface.close()
+            await self.api_interface.close()
 
     async def update_external_status(self) -> bool:
         external = await self.config.use_external_lavalink()
@@ -205,13 +206,7 @@ class MiscellaneousUtilities(MixinMeta, metaclass=CompositeMetaClass):
 
     async def queue_duration(self, ctx: commands.Context) -> int:
         player = lavalink.get_player(ctx.guild.id)
-        dur = [
-            i.length
-            async for i in AsyncIter(player.queue, steps=50).filter(lambda x: not x.is_stream)
-        ]
-        queue_dur = sum(dur)
-        if not player.queue:
-            queue_dur = 0
+        queue_dur = get_queue_stats(player).duration
         try:
             if not player.current.is_stream:
                 remain = player.current.length - player.position
@@ -271,7 +266,7 @@ class MiscellaneousUtilities(MixinMeta, metaclass=CompositeMetaClass):
     async def get_lyrics_status(self, ctx: Context) -> bool:
         global _prefer_lyrics_cache
         prefer_lyrics = _prefer_lyrics_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).prefer_lyrics()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).prefer_lyrics
         )
         return prefer_lyrics
 
@@ -16,8 +16,14 @@ STREAM_TITLE: Final[re.Pattern] = re.compile(rb"StreamTitle='([^']*)';")
 
 class ParsingUtilities(MixinMeta, metaclass=CompositeMetaClass):
     async def icyparser(self, url: str) -> Optional[str]:
+        # many players can be playing the same stream, they all share a single lookup
+        return await self.http_client.coalesce(("icy", url), lambda: self._icyparser(url))
+
+    async def _icyparser(self, url: str) -> Optional[str]:
         try:
-            async with self.session.get(url, headers={"Icy-MetaData": "1"}) as resp:
+            async with self.http_client.request(
+                "icy", "GET", url, endpoint="stream", headers={"Icy-MetaData": "1"}
+            ) as resp:
                 metaint = int(resp.headers["icy-metaint"])
                 for _ in range(5):
                     await resp.content.readexactly(metaint)
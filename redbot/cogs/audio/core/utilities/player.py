@@ -82,7 +82,7 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
 
     async def _can_instaskip(self, ctx: commands.Context, member: discord.Member) -> bool:
         dj_enabled = self._dj_status_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
         )
 
         if member.bot:
@@ -112,7 +112,7 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
 
     async def _has_dj_role(self, ctx: commands.Context, member: discord.Member) -> bool:
         dj_role = self._dj_role_cache.setdefault(
-            ctx.guild.id, await self.config.guild(ctx.guild).dj_role()
+            ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_role
         )
         return member.get_role(dj_role) is not None
 
@@ -127,7 +127,7 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
 
     async def _skip_action(self, ctx: commands.Context, skip_to_track: int = None) -> None:
         player = lavalink.get_player(ctx.guild.id)
-        autoplay = await self.config.guild(player.guild).auto_play()
+        autoplay = (await self.guild_settings.get(player.guild)).auto_play
         if not player.current or (not player.queue and not autoplay):
             try:
                 pos, dur = player.position, player.current.length
@@ -215,7 +215,7 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
         guild_id = self.rgetattr(player, "channel.guild.id", None)
         if not guild_id:
             return
-        if not await self.config.guild_from_id(guild_id).auto_deafen():
+        if not (await self.guild_settings.get(guild_id)).auto_deafen:
             return
         await player.guild.change_voice_state(channel=player.channel, self_deaf=True)
 
@@ -232,7 +232,7 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
                 )
         except KeyError:
             self.update_player_lock(ctx, True)
-        guild_data = await self.config.guild(ctx.guild).all()
+        guild_data = await self.guild_settings.get(ctx.guild)
         first_track_only = False
         single_track = None
         index = None
@@ -321,8 +321,8 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
                 ):
                     log.debug("Query is not allowed in %r (%s)", ctx.guild.name, ctx.guild.id)
                     continue
-                elif guild_data["maxlength"] > 0:
-                    if self.is_track_length_allowed(track, guild_data["maxlength"]):
+                elif guild_data.maxlength > 0:
+                    if self.is_track_length_allowed(track, guild_data.maxlength):
                         track_len += 1
                         track.extras.update(
                             {
@@ -370,7 +370,7 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
                     num=track_len, maxlength_msg=maxlength_msg
                 )
             )
-            if not guild_data["shuffle"] and queue_dur > 0:
+            if not guild_data.shuffle and queue_dur > 0:
                 embed.set_footer(
                     text=_(
                         "{time} until start of playlist playback: starts at #{position} in queue"
@@ -414,8 +414,8 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
                     return await self.send_embed_msg(
                         ctx, title=_("This track is not allowed in this server.")
                     )
-                elif guild_data["maxlength"] > 0:
-                    if self.is_track_length_allowed(single_track, guild_data["maxlength"]):
+                elif guild_data.maxlength > 0:
+                    if self.is_track_length_allowed(single_track, guild_data.maxlength):
                         single_track.extras.update(
                             {
                                 "enqueue_time": int(time.time()),
@@ -464,7 +464,7 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
                 single_track, self.local_folder_current_path
             )
             embed = discord.Embed(title=_("Track Enqueued"), description=description)
-            if not guild_data["shuffle"] and queue_dur > 0:
+            if not guild_data.shuffle and queue_dur > 0:
                 embed.set_footer(
                     text=_("{time} until track playback: #{position} in queue").format(
                         time=queue_total_duration, position=before_queue_length + 1
@@ -479,15 +479,12 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
 
     async def set_player_settings(self, ctx: commands.Context) -> None:
         player = lavalink.get_player(ctx.guild.id)
-        shuffle = await self.config.guild(ctx.guild).shuffle()
-        repeat = await self.config.guild(ctx.guild).repeat()
-        volume = await self.config.guild(ctx.guild).volume()
-        shuffle_bumped = await self.config.guild(ctx.guild).shuffle_bumped()
-        player.repeat = repeat
-        player.shuffle = shuffle
-        player.shuffle_bumped = shuffle_bumped
-        if player.volume != volume:
-            await player.set_volume(volume)
+        guild_data = await self.guild_settings.get(ctx.guild)
+        player.repeat = guild_data.repeat
+        player.shuffle = guild_data.shuffle
+        player.shuffle_bumped = guild_data.shuffle_bumped
+        if player.volume != guild_data.volume:
+            await player.set_volume(guild_data.volume)
 
     async def maybe_move_player(self, ctx: commands.Context) -> bool:
         try:
@@ -515,7 +512,7 @@ class PlayerUtilities(MixinMeta, metaclass=CompositeMetaClass):
             ):
                 await player.move_to(
                     user_channel,
-                    self_deaf=await self.config.guild_from_id(ctx.guild.id).auto_deafen(),
+                    self_deaf=(await self.guild_settings.get(ctx.guild.id)).auto_deafen,
                 )
                 return True
         else:
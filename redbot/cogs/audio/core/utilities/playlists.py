@@ -9,7 +9,6 @@ from pathlib import Path
 
 from typing import List, MutableMapping, Optional, Tuple, Union
 
-import aiohttp
 import discord
 import lavalink
 from lavalink import NodeNotFound
@@ -68,7 +67,7 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
                 has_perms = True
         elif playlist.scope == PlaylistScope.GUILD.value and not is_different_guild:
             dj_enabled = self._dj_status_cache.setdefault(
-                ctx.guild.id, await self.config.guild(ctx.guild).dj_enabled()
+                ctx.guild.id, (await self.guild_settings.get(ctx.guild)).dj_enabled
             )
             if (
                 guild.owner_id == ctx.author.id
@@ -125,6 +124,7 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
         author: discord.User,
         guild: discord.Guild,
         specified_user: bool = False,
+        load_tracks: bool = True,
     ) -> Tuple[Optional[Playlist], str, str]:
         """
         Parameters
@@ -141,6 +141,8 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
             The guild.
         specified_user: bool
             Whether or not a user ID was specified via argparse.
+        load_tracks: bool
+            Whether to load the tracks of the matched playlist.
         Returns
         -------
         Tuple[Optional[Playlist], str, str]
@@ -227,6 +229,8 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
                     ).format(match_count=match_count, original_input=original_input)
                 )
         elif match_count == 1:
+            if load_tracks:
+                await correct_scope_matches[0].load_tracks()
             return correct_scope_matches[0], original_input, correct_scope_matches[0].scope
         elif match_count == 0:
             return None, original_input, scope or PlaylistScope.GUILD.value
@@ -249,7 +253,7 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
                 number=number,
                 playlist=playlist,
                 scope=self.humanize_scope(playlist.scope),
-                tracks=len(playlist.tracks),
+                tracks=playlist.track_count,
                 author=author,
             )
             playlists += line
@@ -284,6 +288,8 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
             )
         with contextlib.suppress(discord.HTTPException):
             await msg.delete()
+        if load_tracks:
+            await correct_scope_matches[pred.result].load_tracks()
         return (
             correct_scope_matches[pred.result],
             original_input,
@@ -321,6 +327,42 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
         )
         return embed
 
+    async def _build_playlist_info_page(
+        self, ctx: commands.Context, playlist: Playlist, page_num: int, title: str
+    ) -> discord.Embed:
+        track_len = playlist.track_count
+        total_pages = max(math.ceil(track_len / 10), 1)
+        track_idx_start = (page_num - 1) * 10
+        tracks = await playlist.fetch_tracks(track_idx_start, track_idx_start + 10)
+        spaces = "\N{EN SPACE}" * (len(str(track_len)) + 2)
+        msg = "​" if track_len > 0 else "No tracks."
+        async for i, track in AsyncIter(tracks).enumerate(start=track_idx_start):
+            track_idx = i + 1
+            query = Query.process_input(track["info"]["uri"], self.local_folder_current_path)
+            if query.is_local:
+                if track["info"]["title"] != "Unknown title":
+                    msg += "`{}.` **{} - {}**\n{}{}\n".format(
+                        track_idx,
+                        track["info"]["author"],
+                        track["info"]["title"],
+                        spaces,
+                        query.to_string_user(),
+                    )
+                else:
+                    msg += "`{}.` {}\n".format(track_idx, query.to_string_user())
+            else:
+                msg += "`{}.` **[{}]({})**\n".format(
+                    track_idx, track["info"]["title"], track["info"]["uri"]
+                )
+        embed = discord.Embed(colour=await ctx.embed_colour(), title=title, description=msg)
+        author_obj = self.bot.get_user(playlist.author) or playlist.author or _("Unknown")
+        embed.set_footer(
+            text=_("Page {page}/{pages} | Author: {author_name} | {num} track(s)").format(
+                author_name=author_obj, num=track_len, pages=total_pages, page=page_num
+            )
+        )
+        return embed
+
     async def _load_v3_playlist(
         self,
         ctx: commands.Context,
@@ -545,7 +587,7 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
                     return False
                 await lavalink.connect(
                     ctx.author.voice.channel,
-                    self_deaf=await self.config.guild_from_id(ctx.guild.id).auto_deafen(),
+                    self_deaf=(await self.guild_settings.get(ctx.guild.id)).auto_deafen,
                 )
             except NodeNotFound:
                 await self.send_embed_msg(
@@ -656,24 +698,23 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
             return str(ctx) if ctx else _("the User") if the else _("User")
 
     async def _get_bundled_playlist_tracks(self):
-        async with aiohttp.ClientSession(json_serialize=json.dumps) as session:
-            async with session.get(
-                CURATED_DATA + f"?timestamp={int(time.time())}",
-                headers={"content-type": "application/json"},
-            ) as response:
-                if response.status != 200:
-                    return 0, []
-                try:
-                    data = json.loads(await response.read())
-                except Exception as exc:
-                    log.error(
-                        "Curated playlist couldn't be parsed, report this error.", exc_info=exc
-                    )
-                    data = {}
-                web_version = data.get("version", 0)
-                entries = data.get("entries", [])
-                if entries:
-                    random.shuffle(entries)
+        async with self.http_client.request(
+            "curated",
+            "GET",
+            CURATED_DATA + f"?timestamp={int(time.time())}",
+            headers={"content-type": "application/json"},
+        ) as response:
+            if response.status != 200:
+                return 0, []
+            try:
+                data = json.loads(await response.read())
+            except Exception as exc:
+                log.error("Curated playlist couldn't be parsed, report this error.", exc_info=exc)
+                data = {}
+            web_version = data.get("version", 0)
+            entries = data.get("entries", [])
+            if entries:
+                random.shuffle(entries)
         tracks = []
         async for entry in AsyncIter(entries, steps=25):
             with contextlib.suppress(Exception):
@@ -1,7 +1,7 @@
 import math
 from pathlib import Path
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import discord
 import lavalink
@@ -14,6 +14,7 @@ from redbot.core.utils import AsyncIter
 from redbot.core.utils.chat_formatting import humanize_number
 
 from ...audio_dataclasses import LocalPath, Query
+from ...guild_settings import GuildSettings
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass
 
@@ -28,10 +29,14 @@ class QueueUtilities(MixinMeta, metaclass=CompositeMetaClass):
         queue: list,
         player: lavalink.player.Player,
         page_num: int,
+        guild_data: Optional[GuildSettings] = None,
+        queue_dur: Optional[int] = None,
     ) -> discord.Embed:
-        shuffle = await self.config.guild(ctx.guild).shuffle()
-        repeat = await self.config.guild(ctx.guild).repeat()
-        autoplay = await self.config.guild(ctx.guild).auto_play()
+        if guild_data is None:
+            guild_data = await self.guild_settings.get(ctx.guild)
+        shuffle = guild_data.shuffle
+        repeat = guild_data.repeat
+        autoplay = guild_data.auto_play
 
         queue_num_pages = math.ceil(len(queue) / 10)
         queue_idx_start = (page_num - 1) * 10
@@ -81,9 +86,10 @@ class QueueUtilities(MixinMeta, metaclass=CompositeMetaClass):
             description=queue_list,
         )
 
-        if await self.config.guild(ctx.guild).thumbnail() and player.current.thumbnail:
+        if guild_data.thumbnail and player.current.thumbnail:
             embed.set_thumbnail(url=player.current.thumbnail)
-        queue_dur = await self.queue_duration(ctx)
+        if queue_dur is None:
+            queue_dur = await self.queue_duration(ctx)
         queue_total_duration = self.format_time(queue_dur)
         text = _(
             "Page {page_num}/{total_pages} | {num_tracks} tracks, {num_remaining} remaining\n"
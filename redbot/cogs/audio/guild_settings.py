@@ -0,0 +1,123 @@
+import contextlib
+import dataclasses
+import types
+from typing import Any, AsyncIterator, Dict, Mapping, Optional, Tuple, Union
+
+import discord
+
+from redbot.core import Config
+
+__all__ = ("GuildSettings", "GuildSettingsCache")
+
+
+@dataclasses.dataclass(frozen=True)
+class GuildSettings:
+    """A snapshot of a guild's Audio settings.
+
+    Runtime state stored in the guild's scope, such as ``currently_auto_playing_in``,
+    isn't part of the snapshot.
+    """
+
+    auto_play: bool
+    auto_deafen: bool
+    autoplaylist: Mapping[str, Any]
+    persist_queue: bool
+    disconnect: bool
+    dj_enabled: Optional[bool]
+    dj_role: Optional[int]
+    daily_playlists: bool
+    emptydc_enabled: bool
+    emptydc_timer: int
+    emptypause_enabled: bool
+    emptypause_timer: int
+    jukebox: bool
+    jukebox_price: int
+    maxlength: int
+    max_volume: int
+    notify: bool
+    prefer_lyrics: bool
+    repeat: bool
+    shuffle: bool
+    shuffle_bumped: bool
+    thumbnail: bool
+    volume: int
+    vote_enabled: bool
+    vote_percent: int
+    room_lock: Optional[int]
+    url_keyword_blacklist: Tuple[str, ...]
+    url_keyword_whitelist: Tuple[str, ...]
+    country_code: str
+
+    @classmethod
+    def from_config_data(cls, data: Mapping[str, Any]) -> "GuildSettings":
+        values = {field.name: data[field.name] for field in dataclasses.fields(cls)}
+        # snapshots are shared, so their containers mustn't be mutable
+        values["autoplaylist"] = types.MappingProxyType(dict(values["autoplaylist"]))
+        values["url_keyword_blacklist"] = tuple(values["url_keyword_blacklist"])
+        values["url_keyword_whitelist"] = tuple(values["url_keyword_whitelist"])
+        return cls(**values)
+
+
+class GuildSettingsCache:
+    """Keeps a `GuildSettings` snapshot per guild, loaded with a single Config read.
+
+    Guild settings must be written with `set`, `clear` or `edit`,
+    which drop the guild's snapshot once the write is done.
+    """
+
+    def __init__(self, config: Config):
+        self._config = config
+        self._cache: Dict[int, GuildSettings] = {}
+        # bumped on each invalidation, so that a load which started before it isn't cached
+        self._generation = 0
+
+    async def get(self, guild: Union[discord.Guild, int]) -> GuildSettings:
+        """Get the settings of the given guild."""
+        guild_id = getattr(guild, "id", guild)
+        settings = self._cache.get(guild_id)
+        if settings is None:
+            generation = self._generation
+            settings = GuildSettings.from_config_data(
+                await self._config.guild_from_id(guild_id).all()
+            )
+            if generation == self._generation:
+                self._cache[guild_id] = settings
+        return settings
+
+    def invalidate(self, guild_id: Optional[int] = None) -> None:
+        """Drop the snapshot of the given guild, or of all guilds."""
+        self._generation += 1
+        if guild_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(guild_id, None)
+
+    async def set(self, guild: Union[discord.Guild, int], **values: Any) -> None:
+        """Set the given settings of the guild."""
+        guild_id = getattr(guild, "id", guild)
+        group = self._config.guild_from_id(guild_id)
+        try:
+            for name, value in values.items():
+                await group.get_attr(name).set(value)
+        finally:
+            self.invalidate(guild_id)
+
+    async def clear(self, guild: Union[discord.Guild, int], *names: str) -> None:
+        """Reset the given settings of the guild to their defaults."""
+        guild_id = getattr(guild, "id", guild)
+        group = self._config.guild_from_id(guild_id)
+        try:
+            for name in names:
+                await group.get_attr(name).clear()
+        finally:
+            self.invalidate(guild_id)
+
+    @contextlib.asynccontextmanager
+    async def edit(self, guild: Union[discord.Guild, int], name: str) -> AsyncIterator[Any]:
+        """Edit a mutable setting of the guild in place, like Config's context manager."""
+        guild_id = getattr(guild, "id", guild)
+        try:
+            async with self._config.guild_from_id(guild_id).get_attr(name)() as value:
+                yield value
+        finally:
+            self.invalidate(guild_id)
@@ -0,0 +1,91 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from red_commons.logging import getLogger
+
+__all__ = ("IdleTimers",)
+
+log = getLogger("red.cogs.Audio.idle_timers")
+
+IdleCallback = Callable[[int, str], Awaitable[None]]
+
+
+class IdleTimers:
+    """Per-guild deadlines, all waited on by a single task.
+
+    Each guild can have one deadline armed per kind of action.
+    Disarmed and re-armed deadlines are left in the heap and skipped once they come up,
+    the heap is compacted when those outnumber the armed deadlines.
+    """
+
+    def __init__(self, callback: IdleCallback):
+        self._callback = callback
+        # (deadline, sequence, guild_id, kind)
+        self._heap: List[Tuple[float, int, int, str]] = []
+        # (guild_id, kind) -> (deadline, sequence) of the armed entry
+        self._armed: Dict[Tuple[int, str], Tuple[float, int]] = {}
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+
+    def arm(self, guild_id: int, kind: str, deadline: float) -> None:
+        """Arm the guild's timer for the given kind of action.
+
+        ``deadline`` is a `time.monotonic` timestamp, re-arming replaces the previous deadline.
+        """
+        key = (guild_id, kind)
+        armed = self._armed.get(key)
+        if armed is not None and armed[0] == deadline:
+            return
+        sequence = next(self._sequence)
+        self._armed[key] = (deadline, sequence)
+        heapq.heappush(self._heap, (deadline, sequence, guild_id, kind))
+        if len(self._heap) > 2 * len(self._armed) + 64:
+            self._heap = [
+                (deadline, sequence, guild_id, kind)
+                for (guild_id, kind), (deadline, sequence) in self._armed.items()
+            ]
+            heapq.heapify(self._heap)
+        if self._heap[0][1] == sequence:
+            self._wakeup.set()
+
+    def disarm(self, guild_id: int, kind: Optional[str] = None) -> None:
+        """Disarm the guild's timer for the given kind of action, or all of them."""
+        if kind is not None:
+            self._armed.pop((guild_id, kind), None)
+            return
+        for key in [key for key in self._armed if key[0] == guild_id]:
+            del self._armed[key]
+
+    def get_deadline(self, guild_id: int, kind: str) -> Optional[float]:
+        """Get the deadline the guild's timer for the given kind of action is armed with."""
+        armed = self._armed.get((guild_id, kind))
+        return armed[0] if armed is not None else None
+
+    def _is_current(self, entry: Tuple[float, int, int, str]) -> bool:
+        armed = self._armed.get((entry[2], entry[3]))
+        return armed is not None and armed[1] == entry[1]
+
+    async def run(self) -> None:
+        """Call the callback for each deadline as it passes, forever."""
+        while True:
+            while self._heap and not self._is_current(self._heap[0]):
+                heapq.heappop(self._heap)
+            timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+            if timeout is None or timeout > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            __, __, guild_id, kind = heapq.heappop(self._heap)
+            del self._armed[(guild_id, kind)]
+            try:
+                await self._callback(guild_id, kind)
+            except Exception as exc:
+                log.debug(
+                    "Exception raised in Audio's %s timer for %s.", kind, guild_id, exc_info=exc
+                )
@@ -2,7 +2,6 @@ import asyncio
 import asyncio.subprocess  # disables for # https://github.com/PyCQA/pylint/issues/1469
 import contextlib
 import itertools
-import json
 import pathlib
 import platform
 import re
@@ -12,7 +11,6 @@ import tempfile
 from typing import ClassVar, Final, List, Optional, Pattern, Tuple, Union, TYPE_CHECKING
 from typing_extensions import Self
 
-import aiohttp
 import lavalink
 import rich.progress
 import yaml
@@ -525,45 +523,46 @@ class ServerManager:
 
     async def _download_jar(self) -> None:
         log.info("Downloading Lavalink.jar...")
-        async with aiohttp.ClientSession(json_serialize=json.dumps) as session:
-            async with session.get(self.LAVALINK_DOWNLOAD_URL) as response:
-                if response.status == 404:
-                    # A 404 means our LAVALINK_DOWNLOAD_URL is invalid, so likely the jar version
-                    # hasn't been published yet
-                    raise LavalinkDownloadFailed(
-                        f"Lavalink jar version {self.JAR_VERSION} hasn't been published yet",
-                        response=response,
-                        should_retry=False,
-                    )
-                elif 400 <= response.status < 600:
-                    # Other bad responses should be raised but we should retry just incase
-                    raise LavalinkDownloadFailed(response=response, should_retry=True)
-                fd, path = tempfile.mkstemp()
-                file = open(fd, "wb")
-                nbytes = 0
-                with rich.progress.Progress(
-                    rich.progress.SpinnerColumn(),
-                    rich.progress.TextColumn("[progress.description]{task.description}"),
-                    rich.progress.BarColumn(),
-                    rich.progress.TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                    rich.progress.TimeRemainingColumn(),
-                    rich.progress.TimeElapsedColumn(),
-                ) as progress:
-                    progress_task_id = progress.add_task(
-                        "[red]Downloading Lavalink.jar", total=response.content_length
-                    )
-                    try:
+        async with self.cog.http_client.request(
+            "lavalink", "GET", self.LAVALINK_DOWNLOAD_URL
+        ) as response:
+            if response.status == 404:
+                # A 404 means our LAVALINK_DOWNLOAD_URL is invalid, so likely the jar version
+                # hasn't been published yet
+                raise LavalinkDownloadFailed(
+                    f"Lavalink jar version {self.JAR_VERSION} hasn't been published yet",
+                    response=response,
+                    should_retry=False,
+                )
+            elif 400 <= response.status < 600:
+                # Other bad responses should be raised but we should retry just incase
+                raise LavalinkDownloadFailed(response=response, should_retry=True)
+            fd, path = tempfile.mkstemp()
+            file = open(fd, "wb")
+            nbytes = 0
+            with rich.progress.Progress(
+                rich.progress.SpinnerColumn(),
+                rich.progress.TextColumn("[progress.description]{task.description}"),
+                rich.progress.BarColumn(),
+                rich.progress.TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                rich.progress.TimeRemainingColumn(),
+                rich.progress.TimeElapsedColumn(),
+            ) as progress:
+                progress_task_id = progress.add_task(
+                    "[red]Downloading Lavalink.jar", total=response.content_length
+                )
+                try:
+                    chunk = await response.content.read(1024)
+                    while chunk:
+                        chunk_size = file.write(chunk)
+                        nbytes += chunk_size
+                        progress.update(progress_task_id, advance=chunk_size)
                         chunk = await response.content.read(1024)
-                        while chunk:
-                            chunk_size = file.write(chunk)
-                            nbytes += chunk_size
-                            progress.update(progress_task_id, advance=chunk_size)
-                            chunk = await response.content.read(1024)
-                        file.flush()
-                    finally:
-                        file.close()
-
-                shutil.move(path, str(self.lavalink_jar_file), copy_function=shutil.copyfile)
+                    file.flush()
+                finally:
+                    file.close()
+
+            shutil.move(path, str(self.lavalink_jar_file), copy_function=shutil.copyfile)
 
         log.info("Successfully downloaded Lavalink.jar (%s bytes written)", format(nbytes, ","))
         await self._is_up_to_date()
@@ -0,0 +1,122 @@
+from collections import Counter
+from typing import Iterable, Optional
+
+import lavalink
+
+__all__ = ("QueueStats", "TrackedQueue", "get_queue_stats")
+
+
+def _requester_id(track: lavalink.Track) -> Optional[int]:
+    requester = getattr(track, "requester", None)
+    return getattr(requester, "id", requester)
+
+
+class QueueStats:
+    """Running totals over the tracks in a player's queue."""
+
+    __slots__ = ("duration", "streams", "requesters")
+
+    def __init__(self):
+        #: The total length of the queued tracks which aren't streams, in milliseconds.
+        self.duration = 0
+        #: The amount of queued streams.
+        self.streams = 0
+        #: The amount of queued tracks per requester ID.
+        self.requesters = Counter()
+
+    def add(self, tracks: Iterable[lavalink.Track]) -> None:
+        for track in tracks:
+            if track.is_stream:
+                self.streams += 1
+            else:
+                self.duration += track.length
+            self.requesters[_requester_id(track)] += 1
+
+    def remove(self, tracks: Iterable[lavalink.Track]) -> None:
+        for track in tracks:
+            if track.is_stream:
+                self.streams -= 1
+            else:
+                self.duration -= track.length
+            requester_id = _requester_id(track)
+            self.requesters[requester_id] -= 1
+            if self.requesters[requester_id] <= 0:
+                del self.requesters[requester_id]
+
+
+class TrackedQueue(list):
+    """A player queue which keeps its `QueueStats` up to date as tracks are added and removed.
+
+    Only in-place modifications are tracked,
+    a queue replaced by a new list is wrapped again by `get_queue_stats`.
+    """
+
+    def __init__(self, tracks: Iterable[lavalink.Track] = ()):
+        super().__init__(tracks)
+        self.stats = QueueStats()
+        self.stats.add(self)
+
+    def append(self, track):
+        super().append(track)
+        self.stats.add((track,))
+
+    def extend(self, tracks):
+        tracks = list(tracks)
+        super().extend(tracks)
+        self.stats.add(tracks)
+
+    def __iadd__(self, tracks):
+        self.extend(tracks)
+        return self
+
+    def __imul__(self, value):
+        added = list(self) * (max(value, 1) - 1)
+        super().__imul__(value)
+        if value > 0:
+            self.stats.add(added)
+        else:
+            self.stats = QueueStats()
+        return self
+
+    def insert(self, index, track):
+        super().insert(index, track)
+        self.stats.add((track,))
+
+    def pop(self, index=-1):
+        track = super().pop(index)
+        self.stats.remove((track,))
+        return track
+
+    def remove(self, track):
+        super().remove(track)
+        self.stats.remove((track,))
+
+    def clear(self):
+        super().clear()
+        self.stats = QueueStats()
+
+    def __delitem__(self, index):
+        removed = self[index]
+        super().__delitem__(index)
+        self.stats.remove(removed if isinstance(index, slice) else (removed,))
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            removed = self[index]
+        else:
+            removed = (self[index],)
+        super().__setitem__(index, value)
+        self.stats.remove(removed)
+        self.stats.add(value if isinstance(index, slice) else (value,))
+
+
+def get_queue_stats(player: lavalink.Player) -> QueueStats:
+    """Get the stats of the player's queue.
+
+    This only walks the queue if it was replaced since the last call.
+    """
+    queue = player.queue
+    if not isinstance(queue, TrackedQueue):
+        queue = player.queue = TrackedQueue(queue)
+    return queue.stats
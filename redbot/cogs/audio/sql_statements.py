@@ -23,6 +23,19 @@ __all__ = [
     "PLAYLIST_FETCH",
     "PLAYLIST_UPSERT",
     "PLAYLIST_CREATE_INDEX",
+    # Playlist tracks table statements
+    "PLAYLIST_TRACKS_CREATE_TABLE",
+    "PLAYLIST_TRACKS_INSERT",
+    "PLAYLIST_TRACKS_APPEND",
+    "PLAYLIST_TRACKS_DELETE",
+    "PLAYLIST_TRACKS_DELETE_SCOPE",
+    "PLAYLIST_TRACKS_DELETE_SCHEDULED",
+    "PLAYLIST_TRACKS_FETCH",
+    "PLAYLIST_TRACKS_FETCH_RANGE",
+    "PLAYLIST_TRACKS_MIGRATE_PENDING",
+    "PLAYLIST_TRACKS_MIGRATE_DELETE",
+    "PLAYLIST_TRACKS_MIGRATE",
+    "PLAYLIST_TRACKS_MIGRATE_CLEAR",
     # Lavalink table statements
     "LAVALINK_DROP_TABLE",
     "LAVALINK_CREATE_TABLE",
@@ -43,6 +56,20 @@ __all__ = [
     "PERSIST_QUEUE_FETCH_ALL",
     "PERSIST_QUEUE_UPSERT",
     "PERSIST_QUEUE_BULK_PLAYED",
+    # Local tracks index statements
+    "LOCAL_TRACKS_CREATE_TABLE",
+    "LOCAL_TRACKS_CREATE_INDEX",
+    "LOCAL_TRACKS_DELETE_FOLDER",
+    "LOCAL_TRACKS_INSERT",
+    "LOCAL_TRACKS_FETCH_FOLDER",
+    "LOCAL_TRACKS_FETCH_TREE",
+    "LOCAL_TRACK_FOLDERS_CREATE_TABLE",
+    "LOCAL_TRACK_FOLDERS_CREATE_INDEX",
+    "LOCAL_TRACK_FOLDERS_UPSERT",
+    "LOCAL_TRACK_FOLDERS_DELETE",
+    "LOCAL_TRACK_FOLDERS_FETCH_ALL",
+    "LOCAL_TRACK_FOLDERS_FETCH_CHILDREN",
+    "LOCAL_TRACK_FOLDERS_FETCH_TREE",
 ]
 
 # PRAGMA Statements
@@ -70,18 +97,13 @@ pragma user_version;
 PRAGMA_SET_user_version: Final[
     str
 ] = """
-pragma user_version=3;
+pragma user_version={version};
 """
 
 # Data Deletion
-# This is intentionally 2 seperate transactions due to concerns
-# Draper had. This should prevent it from being a large issue,
-# as this is no different than triggering a bulk deletion now.
 HANDLE_DISCORD_DATA_DELETION_QUERY: Final[
     str
 ] = """
-BEGIN TRANSACTION;
-
 UPDATE playlists
 SET deleted = true
 WHERE scope_id = :user_id ;
@@ -90,14 +112,13 @@ UPDATE playlists
 SET author_id = 0xde1
 WHERE author_id = :user_id ;
 
-COMMIT TRANSACTION;
-
-BEGIN TRANSACTION;
+DELETE FROM playlist_tracks
+WHERE (scope_type, playlist_id, scope_id) IN (
+    SELECT scope_type, playlist_id, scope_id FROM playlists WHERE deleted = true
+) ;
 
 DELETE FROM PLAYLISTS
 WHERE deleted=true;
-
-COMMIT TRANSACTION;
 """
 
 # Playlist table statements
@@ -157,7 +178,16 @@ SELECT
     scope_id,
     author_id,
     playlist_url,
-    tracks
+    (
+        SELECT
+            COUNT(*)
+        FROM
+            playlist_tracks
+        WHERE
+            playlist_tracks.scope_type = playlists.scope_type
+            AND playlist_tracks.playlist_id = playlists.playlist_id
+            AND playlist_tracks.scope_id = playlists.scope_id
+    ) AS track_count
 FROM
     playlists
 WHERE
@@ -175,7 +205,16 @@ SELECT
     scope_id,
     author_id,
     playlist_url,
-    tracks
+    (
+        SELECT
+            COUNT(*)
+        FROM
+            playlist_tracks
+        WHERE
+            playlist_tracks.scope_type = playlists.scope_type
+            AND playlist_tracks.playlist_id = playlists.playlist_id
+            AND playlist_tracks.scope_id = playlists.scope_id
+    ) AS track_count
 FROM
     playlists
 WHERE
@@ -196,7 +235,16 @@ SELECT
     scope_id,
     author_id,
     playlist_url,
-    tracks
+    (
+        SELECT
+            COUNT(*)
+        FROM
+            playlist_tracks
+        WHERE
+            playlist_tracks.scope_type = playlists.scope_type
+            AND playlist_tracks.playlist_id = playlists.playlist_id
+            AND playlist_tracks.scope_id = playlists.scope_id
+    ) AS track_count
 FROM
     playlists
 WHERE
@@ -221,7 +269,16 @@ SELECT
     scope_id,
     author_id,
     playlist_url,
-    tracks
+    (
+        SELECT
+            COUNT(*)
+        FROM
+            playlist_tracks
+        WHERE
+            playlist_tracks.scope_type = playlists.scope_type
+            AND playlist_tracks.playlist_id = playlists.playlist_id
+            AND playlist_tracks.scope_id = playlists.scope_id
+    ) AS track_count
 FROM
     playlists
 WHERE
@@ -237,17 +294,16 @@ PLAYLIST_UPSERT: Final[
     str
 ] = """
 INSERT INTO
-    playlists ( scope_type, playlist_id, playlist_name, scope_id, author_id, playlist_url, tracks )
+    playlists ( scope_type, playlist_id, playlist_name, scope_id, author_id, playlist_url )
 VALUES
     (
-        :scope_type, :playlist_id, :playlist_name, :scope_id, :author_id, :playlist_url, :tracks
+        :scope_type, :playlist_id, :playlist_name, :scope_id, :author_id, :playlist_url
     )
     ON CONFLICT (scope_type, playlist_id, scope_id) DO
     UPDATE
     SET
         playlist_name = excluded.playlist_name,
-        playlist_url = excluded.playlist_url,
-        tracks = excluded.tracks;
+        playlist_url = excluded.playlist_url;
 """
 PLAYLIST_CREATE_INDEX: Final[
     str
@@ -257,6 +313,168 @@ scope_type, playlist_id, playlist_name, scope_id
 );
 """
 
+# Playlist tracks table statements
+PLAYLIST_TRACKS_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS playlist_tracks (
+    scope_type INTEGER NOT NULL,
+    playlist_id INTEGER NOT NULL,
+    scope_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    track JSON NOT NULL,
+    PRIMARY KEY (scope_type, playlist_id, scope_id, position)
+);
+"""
+PLAYLIST_TRACKS_INSERT: Final[
+    str
+] = """
+INSERT INTO
+    playlist_tracks ( scope_type, playlist_id, scope_id, position, track )
+VALUES
+    (
+        :scope_type, :playlist_id, :scope_id, :position, :track
+    )
+;
+"""
+PLAYLIST_TRACKS_APPEND: Final[
+    str
+] = """
+INSERT INTO
+    playlist_tracks ( scope_type, playlist_id, scope_id, position, track )
+SELECT
+    :scope_type, :playlist_id, :scope_id, COALESCE(MAX(position) + 1, 0), :track
+FROM
+    playlist_tracks
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+    )
+;
+"""
+PLAYLIST_TRACKS_DELETE: Final[
+    str
+] = """
+DELETE
+FROM
+    playlist_tracks
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+    )
+;
+"""
+PLAYLIST_TRACKS_DELETE_SCOPE: Final[
+    str
+] = """
+DELETE
+FROM
+    playlist_tracks
+WHERE
+    scope_type = :scope_type ;
+"""
+PLAYLIST_TRACKS_DELETE_SCHEDULED: Final[
+    str
+] = """
+DELETE
+FROM
+    playlist_tracks
+WHERE
+    (scope_type, playlist_id, scope_id) IN (
+        SELECT scope_type, playlist_id, scope_id FROM playlists WHERE deleted = true
+    )
+;
+"""
+PLAYLIST_TRACKS_FETCH: Final[
+    str
+] = """
+SELECT
+    track
+FROM
+    playlist_tracks
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+    )
+ORDER BY position
+;
+"""
+PLAYLIST_TRACKS_FETCH_RANGE: Final[
+    str
+] = """
+SELECT
+    track
+FROM
+    playlist_tracks
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+        AND position >= :start
+        AND position < :stop
+    )
+ORDER BY position
+;
+"""
+# Moves the tracks stored in the playlists table by schema version 3 into playlist_tracks
+PLAYLIST_TRACKS_MIGRATE_PENDING: Final[
+    str
+] = """
+SELECT
+    EXISTS (
+        SELECT 1 FROM playlists WHERE tracks IS NOT NULL
+    )
+;
+"""
+PLAYLIST_TRACKS_MIGRATE_DELETE: Final[
+    str
+] = """
+DELETE
+FROM
+    playlist_tracks
+WHERE
+    (scope_type, playlist_id, scope_id) IN (
+        SELECT scope_type, playlist_id, scope_id FROM playlists WHERE tracks IS NOT NULL
+    )
+;
+"""
+PLAYLIST_TRACKS_MIGRATE: Final[
+    str
+] = """
+INSERT INTO
+    playlist_tracks ( scope_type, playlist_id, scope_id, position, track )
+SELECT
+    playlists.scope_type,
+    playlists.playlist_id,
+    playlists.scope_id,
+    tracks.key,
+    tracks.value
+FROM
+    playlists,
+    json_each(playlists.tracks) AS tracks
+WHERE
+    playlists.tracks IS NOT NULL
+    AND json_valid(playlists.tracks)
+;
+"""
+PLAYLIST_TRACKS_MIGRATE_CLEAR: Final[
+    str
+] = """
+UPDATE playlists
+    SET
+        tracks = NULL
+WHERE
+    tracks IS NOT NULL
+;
+"""
+
 # Lavalink table statements
 LAVALINK_DROP_TABLE: Final[
     str
@@ -434,3 +652,135 @@ UPDATE
     SET
         time = excluded.time
 """
+
+# Local tracks index statements
+LOCAL_TRACKS_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS local_tracks(
+    path TEXT PRIMARY KEY,
+    folder TEXT NOT NULL,
+    sort_key TEXT NOT NULL
+);
+"""
+LOCAL_TRACKS_CREATE_INDEX: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_local_tracks_folder ON local_tracks (folder, sort_key);
+"""
+LOCAL_TRACKS_DELETE_FOLDER: Final[
+    str
+] = """
+DELETE
+FROM
+    local_tracks
+WHERE
+    folder = :folder
+;
+"""
+LOCAL_TRACKS_INSERT: Final[
+    str
+] = """
+INSERT OR REPLACE INTO
+    local_tracks (path, folder, sort_key)
+VALUES
+    (
+        :path, :folder, :sort_key
+    )
+;
+"""
+LOCAL_TRACKS_FETCH_FOLDER: Final[
+    str
+] = """
+SELECT
+    path
+FROM
+    local_tracks
+WHERE
+    folder = :folder
+ORDER BY sort_key ASC;
+"""
+LOCAL_TRACKS_FETCH_TREE: Final[
+    str
+] = """
+SELECT
+    path
+FROM
+    local_tracks
+WHERE
+    folder = :folder
+    OR (
+        folder >= :prefix
+        AND folder < :prefix_end
+    )
+ORDER BY sort_key ASC;
+"""
+LOCAL_TRACK_FOLDERS_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS local_track_folders(
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime_ns INTEGER NOT NULL,
+    subfolders JSON NOT NULL,
+    sort_key TEXT NOT NULL
+);
+"""
+LOCAL_TRACK_FOLDERS_CREATE_INDEX: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_local_track_folders_parent ON local_track_folders (parent);
+"""
+LOCAL_TRACK_FOLDERS_UPSERT: Final[
+    str
+] = """
+INSERT OR REPLACE INTO
+    local_track_folders (path, parent, mtime_ns, subfolders, sort_key)
+VALUES
+    (
+        :path, :parent, :mtime_ns, :subfolders, :sort_key
+    )
+;
+"""
+LOCAL_TRACK_FOLDERS_DELETE: Final[
+    str
+] = """
+DELETE
+FROM
+    local_track_folders
+WHERE
+    path = :path
+;
+"""
+LOCAL_TRACK_FOLDERS_FETCH_ALL: Final[
+    str
+] = """
+SELECT
+    path, mtime_ns, subfolders
+FROM
+    local_track_folders
+;
+"""
+LOCAL_TRACK_FOLDERS_FETCH_CHILDREN: Final[
+    str
+] = """
+SELECT
+    path
+FROM
+    local_track_folders
+WHERE
+    parent = :parent
+ORDER BY sort_key ASC;
+"""
+LOCAL_TRACK_FOLDERS_FETCH_TREE: Final[
+    str
+] = """
+SELECT
+    path
+FROM
+    local_track_folders
+WHERE
+    path >= :prefix
+    AND path < :prefix_end
+ORDER BY sort_key ASC;
+"""
@@ -2,16 +2,16 @@ import asyncio
 import re
 import random
 from datetime import datetime, timedelta
-from typing import Iterable, List, Mapping, Tuple, Dict, Set, Literal, Union
+from typing import Iterable, List, Mapping, Optional, Tuple, Dict, Set, Literal, Union
 from urllib.parse import quote_plus
 
 import discord
-import rapidfuzz
 
 from redbot.core import Config, commands
 from redbot.core.commands import Parameter
 from redbot.core.i18n import Translator, cog_i18n
 from redbot.core.utils import menus, AsyncIter
+from redbot.core.utils._internal_utils import FuzzyIndex
 from redbot.core.utils.chat_formatting import box, pagify, escape, humanize_list
 from redbot.core.utils.predicates import MessagePredicate
 
@@ -46,11 +46,149 @@ class ResponseTooLong(CCError):
     pass
 
 
+_PARAMETER_OBJECTS = frozenset(("message", "author", "channel", "guild", "server"))
+_PARAMETER_RE = re.compile(r"{([^}]+)\}")
+_ARGUMENT_RE = re.compile(r"{((\d+)[^.}]*(\.[^:}]+)?[^}]*)\}")
+
+_TEXT = 0
+_PARAMETER = 1
+_ARGUMENT = 2
+
+
+class CompiledResponse:
+    """A single custom command response, parsed once into template segments.
+
+    Rendering a compiled response doesn't need to run any regex
+    and the result of `CustomCommands.prepare_args` is cached on first use.
+    """
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self.segments = self._compile(raw)
+        self._params = None
+
+    def __repr__(self) -> str:
+        return f"<CompiledResponse raw={self.raw!r}>"
+
+    @staticmethod
+    def _is_parameter(result: str) -> bool:
+        if result in _PARAMETER_OBJECTS:
+            return True
+        try:
+            first, second = result.split(".")
+        except ValueError:
+            return False
+        return first in _PARAMETER_OBJECTS and not second.startswith("_")
+
+    @classmethod
+    def _compile(cls, raw: str) -> List[tuple]:
+        # Message object placeholders ({author}, {channel.name}, ...) are split out first,
+        # argument placeholders ({0}, {1:Member}, {2.display_name}, ...) are only
+        # looked for in the text around them.
+        chunks = []
+        text_start = 0
+        for match in _PARAMETER_RE.finditer(raw):
+            if cls._is_parameter(match.group(1)):
+                chunks.append(raw[text_start : match.start()])
+                chunks.append((_PARAMETER, match.group(1)))
+                text_start = match.end()
+        chunks.append(raw[text_start:])
+
+        arg_matches = [
+            list(_ARGUMENT_RE.finditer(chunk)) if isinstance(chunk, str) else []
+            for chunk in chunks
+        ]
+        low = min((int(m.group(2)) for matches in arg_matches for m in matches), default=0)
+
+        segments = []
+        for chunk, matches in zip(chunks, arg_matches):
+            if not isinstance(chunk, str):
+                segments.append(chunk)
+                continue
+            text_start = 0
+            for match in matches:
+                if match.start() > text_start:
+                    segments.append((_TEXT, chunk[text_start : match.start()]))
+                index = int(match.group(2)) - low
+                segments.append((_ARGUMENT, match.group(1), index, match.group(3) or ""))
+                text_start = match.end()
+            if len(chunk) > text_start:
+                segments.append((_TEXT, chunk[text_start:]))
+        return segments
+
+    @property
+    def params(self) -> Mapping[str, Parameter]:
+        if self._params is None:
+            self._params = CustomCommands.prepare_args(self.raw)
+        return self._params
+
+
+class CachedCommand:
+    """An in-memory copy of the parts of a custom command needed to invoke it."""
+
+    def __init__(self, responses: List[CompiledResponse], cooldowns: Dict[str, int]):
+        self.responses = responses
+        self.cooldowns = cooldowns
+
+    @classmethod
+    def from_ccinfo(cls, ccinfo: dict) -> "CachedCommand":
+        response = ccinfo["response"]
+        if isinstance(response, str):
+            responses = [CompiledResponse(response)]
+        elif isinstance(response, list):
+            responses = [CompiledResponse(r) for r in response]
+        else:
+            responses = []
+        return cls(responses, dict(ccinfo.get("cooldowns", {})))
+
+
 class CommandObj:
     def __init__(self, **kwargs):
         self.config = kwargs.get("config")
         self.bot = kwargs.get("bot")
         self.db = self.config.guild
+        self._cache: Dict[int, Dict[str, CachedCommand]] = {}
+        self._search_indexes: Dict[int, FuzzyIndex[str]] = {}
+        self._loaded = False
+
+    async def load_commands(self):
+        """Load all custom commands into the in-memory index."""
+        all_guilds = await self.config.all_guilds()
+        async for guild_id, guild_data in AsyncIter(all_guilds.items(), steps=100):
+            self._cache[guild_id] = {
+                name: CachedCommand.from_ccinfo(ccinfo)
+                for name, ccinfo in guild_data.get("commands", {}).items()
+                if ccinfo
+            }
+        self._loaded = True
+
+    def _update_cache(self, guild_id: int, command: str, ccinfo: Optional[dict]):
+        self._search_indexes.pop(guild_id, None)
+        if ccinfo:
+            self._cache.setdefault(guild_id, {})[command] = CachedCommand.from_ccinfo(ccinfo)
+        elif guild_commands := self._cache.get(guild_id):
+            guild_commands.pop(command, None)
+
+    def get_cached(self, guild: discord.Guild, command: str) -> CachedCommand:
+        """Get a custom command from the in-memory index, without touching Config."""
+        try:
+            return self._cache[guild.id][command]
+        except KeyError:
+            raise NotFound() from None
+
+    def get_search_index(self, guild: discord.Guild) -> FuzzyIndex[str]:
+        """Get a fuzzy search index of the guild's custom command names."""
+        index = self._search_indexes.get(guild.id)
+        if index is None:
+            names = self._cache.get(guild.id, {})
+            index = self._search_indexes[guild.id] = FuzzyIndex({name: name for name in names})
+        return index
+
+    def has_commands(self, guild: discord.Guild) -> bool:
+        return bool(self._cache.get(guild.id))
+
+    def is_cached(self, guild: discord.Guild, command: str) -> bool:
+        return command in self._cache.get(guild.id, ())
 
     @staticmethod
     async def get_commands(config) -> dict:
@@ -160,6 +298,7 @@ class CommandObj:
             "response": response,
         }
         await self.db(ctx.guild).commands.set_raw(command, value=ccinfo)
+        self._update_cache(ctx.guild.id, command, ccinfo)
 
     async def edit(
         self,
@@ -222,6 +361,7 @@ class CommandObj:
         ccinfo["edited_at"] = self.get_now()
 
         await self.db(ctx.guild).commands.set_raw(command, value=ccinfo)
+        self._update_cache(ctx.guild.id, command, ccinfo)
 
     async def delete(self, ctx: commands.Context, command: str):
         """Delete an already existing custom command"""
@@ -229,6 +369,7 @@ class CommandObj:
         if not await self.db(ctx.guild).commands.get_raw(command, default=None):
             raise NotFound()
         await self.db(ctx.guild).commands.set_raw(command, value=None)
+        self._update_cache(ctx.guild.id, command, None)
 
 
 @cog_i18n(_)
@@ -249,6 +390,10 @@ class CustomCommands(commands.Cog):
         self.commandobj = CommandObj(config=self.config, bot=self.bot)
         self.cooldowns = {}
 
+    async def cog_load(self) -> None:
+        if not self.commandobj._loaded:
+            await self.commandobj.load_commands()
+
     async def red_delete_data_for_user(
         self,
         *,
@@ -324,9 +469,7 @@ class CustomCommands(commands.Cog):
         - `<query>` The query to search for. Can be multiple words.
         """
         cc_commands = await CommandObj.get_commands(self.config.guild(ctx.guild))
-        extracted = rapidfuzz.process.extract(
-            query, list(cc_commands.keys()), processor=rapidfuzz.utils.default_process
-        )
+        extracted = self.commandobj.get_search_index(ctx.guild).search(query, limit=5)
         accepted = []
         for key, score, __ in extracted:
             if score > 60:
@@ -649,38 +792,50 @@ class CustomCommands(commands.Cog):
         if len(message.content) < 2 or is_private or not user_allowed or message.author.bot:
             return
 
+        if not self.commandobj.has_commands(message.guild):
+            return
+
         if await self.bot.cog_disabled_in_guild(self, message.guild):
             return
 
+        # Only build a full context when the message can name a custom command.
+        if not await self._maybe_custom_command(message):
+            return
+
         ctx = await self.bot.get_context(message)
 
         if ctx.prefix is None:
             return
 
         try:
-            raw_response, cooldowns = await self.commandobj.get(
-                message=message, command=ctx.invoked_with
-            )
-            if isinstance(raw_response, list):
-                raw_response = random.choice(raw_response)
-            elif isinstance(raw_response, str):
-                pass
-            else:
+            cc = self.commandobj.get_cached(message.guild, ctx.invoked_with)
+            if not cc.responses:
                 raise NotFound()
-            if cooldowns:
-                self.test_cooldowns(ctx, ctx.invoked_with, cooldowns)
+            response = random.choice(cc.responses)
+            if cc.cooldowns:
+                self.test_cooldowns(ctx, ctx.invoked_with, cc.cooldowns)
         except CCError:
             return
 
         # wrap the command here so it won't register with the bot
         fake_cc = commands.command(name=ctx.invoked_with)(self.cc_callback)
-        fake_cc.params = self.prepare_args(raw_response)
+        fake_cc.params = dict(response.params)
         fake_cc.requires.ready_event.set()
         ctx.command = fake_cc
 
         await self.bot.invoke(ctx)
         if not ctx.command_failed:
-            await self.cc_command(*ctx.args, **ctx.kwargs, raw_response=raw_response)
+            await self.cc_command(*ctx.args, **ctx.kwargs, raw_response=response)
+
+    async def _maybe_custom_command(self, message: discord.Message) -> bool:
+        content = message.content
+        for prefix in await self.bot.command_prefix(self.bot, message):
+            if not content.startswith(prefix):
+                continue
+            words = content[len(prefix) :].split(maxsplit=1)
+            if words and self.commandobj.is_cached(message.guild, words[0]):
+                return True
+        return False
 
     async def cc_callback(self, *args, **kwargs) -> None:
         """
@@ -691,20 +846,23 @@ class CustomCommands(commands.Cog):
         # fake command to take advantage of discord.py's parsing and events
         pass
 
-    async def cc_command(self, ctx, *cc_args, raw_response, **cc_kwargs) -> None:
+    async def cc_command(
+        self, ctx, *cc_args, raw_response: Union[str, CompiledResponse], **cc_kwargs
+    ) -> None:
         cc_args = (*cc_args, *cc_kwargs.values())
-        results = re.findall(r"{([^}]+)\}", raw_response)
-        for result in results:
-            param = self.transform_parameter(result, ctx.message)
-            raw_response = raw_response.replace("{" + result + "}", param)
-        results = re.findall(r"{((\d+)[^.}]*(\.[^:}]+)?[^}]*)\}", raw_response)
-        if results:
-            low = min(int(result[1]) for result in results)
-            for result in results:
-                index = int(result[1]) - low
-                arg = self.transform_arg(result[0], result[2], cc_args[index])
-                raw_response = raw_response.replace("{" + result[0] + "}", arg)
-        await ctx.send(raw_response)
+        if isinstance(raw_response, str):
+            raw_response = CompiledResponse(raw_response)
+        parts = []
+        for segment in raw_response.segments:
+            kind = segment[0]
+            if kind == _TEXT:
+                parts.append(segment[1])
+            elif kind == _PARAMETER:
+                parts.append(self.transform_parameter(segment[1], ctx.message))
+            else:
+                __, result, index, attr = segment
+                parts.append(self.transform_arg(result, attr, cc_args[index]))
+        await ctx.send("".join(parts))
 
     @staticmethod
     def prepare_args(raw_response) -> Mapping[str, Parameter]:
@@ -61,6 +61,8 @@ class Downloader(commands.Cog):
         self.LIB_PATH = cog_data_path(self) / "lib"
         self.SHAREDLIB_PATH = self.LIB_PATH / "cog_shared"
         self.SHAREDLIB_INIT = self.SHAREDLIB_PATH / "__init__.py"
+        # kept outside of LIB_PATH, so that it's reused when the libs are reinstalled
+        self.PIP_CACHE_PATH = cog_data_path(self) / "pip_cache"
 
         self._create_lib_folder()
 
@@ -422,7 +424,10 @@ class Downloader(commands.Cog):
             for commit, libs in libs_by_commit.items():
                 await repo.checkout(commit)
                 installed, failed = await repo.install_libraries(
-                    target_dir=self.SHAREDLIB_PATH, req_target_dir=self.LIB_PATH, libraries=libs
+                    target_dir=self.SHAREDLIB_PATH,
+                    req_target_dir=self.LIB_PATH,
+                    libraries=libs,
+                    cache_dir=self.PIP_CACHE_PATH,
                 )
                 all_installed += installed
                 all_failed += failed
@@ -446,23 +451,15 @@ class Downloader(commands.Cog):
         """
 
         # Reduces requirements to a single list with no repeats
-        requirements = {requirement for cog in cogs for requirement in cog.requirements}
-        repos: List[Tuple[Repo, List[str]]] = [(repo, []) for repo in self._repo_manager.repos]
-
-        # This for loop distributes the requirements across all repos
-        # which will allow us to concurrently install requirements
-        for i, req in enumerate(requirements):
-            repo_index = i % len(repos)
-            repos[repo_index][1].append(req)
-
-        has_reqs = list(filter(lambda item: len(item[1]) > 0, repos))
-
-        failed_reqs = []
-        for repo, reqs in has_reqs:
-            for req in reqs:
-                if not await repo.install_raw_requirements([req], self.LIB_PATH):
-                    failed_reqs.append(req)
-        return tuple(failed_reqs)
+        requirements = sorted({requirement for cog in cogs for requirement in cog.requirements})
+        if not requirements:
+            return ()
+
+        # pip is run once for all requirements, so that they're resolved together
+        repo = next(iter(self._repo_manager.repos))
+        return await repo.install_raw_requirements_batch(
+            requirements, self.LIB_PATH, cache_dir=self.PIP_CACHE_PATH
+        )
 
     @staticmethod
     async def _delete_cog(target: Path) -> None:
@@ -502,7 +499,9 @@ class Downloader(commands.Cog):
         """
         repo = Repo("", "", "", "", Path.cwd())
         async with ctx.typing():
-            success = await repo.install_raw_requirements(deps, self.LIB_PATH)
+            success = await repo.install_raw_requirements(
+                deps, self.LIB_PATH, cache_dir=self.PIP_CACHE_PATH
+            )
 
         if success:
             await ctx.send(_("Libraries installed.") if len(deps) > 1 else _("Library installed."))
@@ -733,7 +732,9 @@ class Downloader(commands.Cog):
             all_failed_libs: List[Installable] = []
             for repo in repos:
                 installed_libs, failed_libs = await repo.install_libraries(
-                    target_dir=self.SHAREDLIB_PATH, req_target_dir=self.LIB_PATH
+                    target_dir=self.SHAREDLIB_PATH,
+                    req_target_dir=self.LIB_PATH,
+                    cache_dir=self.PIP_CACHE_PATH,
                 )
                 all_installed_libs += installed_libs
                 all_failed_libs += failed_libs
@@ -856,7 +857,9 @@ class Downloader(commands.Cog):
             if repo.available_libraries:
                 deprecation_notice = DEPRECATION_NOTICE.format(repo_list=inline(repo.name))
             installed_libs, failed_libs = await repo.install_libraries(
-                target_dir=self.SHAREDLIB_PATH, req_target_dir=self.LIB_PATH
+                target_dir=self.SHAREDLIB_PATH,
+                req_target_dir=self.LIB_PATH,
+                cache_dir=self.PIP_CACHE_PATH,
             )
             if rev is not None:
                 for cog in installed_cogs:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-import functools
+import filecmp
+import os
 import shutil
+import sys
 from enum import IntEnum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union, cast
@@ -15,6 +17,88 @@ from redbot.core import VersionInfo
 if TYPE_CHECKING:
     from .repo_manager import RepoManager, Repo
 
+if sys.platform == "linux":
+    import fcntl
+
+    # not exposed by the fcntl module before Python 3.12
+    _FICLONE: Optional[int] = getattr(fcntl, "FICLONE", 0x40049409)
+else:
+    _FICLONE = None
+
+
+def _clone_file(src: Path, dst: Path) -> None:
+    """Copy a file, sharing its data with the source when the filesystem supports reflinks."""
+    if _FICLONE is not None:
+        try:
+            with src.open("rb") as fsrc, dst.open("wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            pass
+        else:
+            shutil.copystat(src, dst)
+            return
+    shutil.copy2(src, dst)
+
+
+def _link_file(src: Path, dst: Path) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    elif path.exists() or path.is_symlink():
+        path.unlink()
+
+
+def _install_tree(src: Path, dst: Path) -> None:
+    """Replace ``dst`` with a copy of the ``src`` directory.
+
+    The copy is made next to ``dst`` and swapped in once complete.
+    Files unchanged since the previous installation are hardlinked from it
+    instead of being copied, and files that only exist in it are kept.
+    """
+    staging = dst.with_name(f".{dst.name}.new")
+    old = dst.with_name(f".{dst.name}.old")
+    _remove(staging)
+    _remove(old)
+    try:
+        if dst.is_dir():
+            for dirpath, __, filenames in os.walk(dst):
+                target = staging / Path(dirpath).relative_to(dst)
+                target.mkdir(parents=True, exist_ok=True)
+                for filename in filenames:
+                    _link_file(Path(dirpath, filename), target / filename)
+        for dirpath, __, filenames in os.walk(src, followlinks=True):
+            target = staging / Path(dirpath).relative_to(src)
+            if not target.is_dir():
+                _remove(target)
+                target.mkdir(parents=True)
+            for filename in filenames:
+                source = Path(dirpath, filename)
+                destination = target / filename
+                if destination.is_file() and filecmp.cmp(source, destination):
+                    continue
+                _remove(destination)
+                _clone_file(source, destination)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    if not (dst.exists() or dst.is_symlink()):
+        os.replace(staging, dst)
+        return
+    os.replace(dst, old)
+    try:
+        os.replace(staging, dst)
+    except BaseException:
+        os.replace(old, dst)
+        raise
+    _remove(old)
+
 
 class InstallableType(IntEnum):
     # using IntEnum, because hot-reload breaks its identity
@@ -68,7 +152,14 @@ class Installable(RepoJSONMixin):
 
     """
 
-    def __init__(self, location: Path, repo: Optional[Repo] = None, commit: str = ""):
+    def __init__(
+        self,
+        location: Path,
+        repo: Optional[Repo] = None,
+        commit: str = "",
+        *,
+        info_file_contents: Optional[str] = None,
+    ):
         """Base installable initializer.
 
         Parameters
@@ -79,6 +170,9 @@ class Installable(RepoJSONMixin):
             Repo object of the Installable, if repo is missing this will be `None`
         commit : str
             Installable's commit. This is not the same as ``repo.commit``
+        info_file_contents : str, optional
+            Contents of the installable's info.json,
+            read from the installable's location if not given.
 
         """
         self._location = location
@@ -98,7 +192,7 @@ class Installable(RepoJSONMixin):
         self.tags: Tuple[str, ...]
         self.type: InstallableType
 
-        super().__init__(location)
+        super().__init__(location, info_file_contents=info_file_contents)
 
     def __eq__(self, other: Any) -> bool:
         # noinspection PyProtectedMember
@@ -117,26 +211,29 @@ class Installable(RepoJSONMixin):
         Copies this cog/shared_lib to the given directory. This
         will overwrite any files in the target directory.
 
+        Packages are swapped in only once fully copied,
+        and only files that changed since the previous installation get copied.
+
         :param pathlib.Path target_dir: The installation directory to install to.
         :return: Status of installation
         :rtype: bool
         """
-        copy_func: Callable[..., Any]
+        copy_func: Callable[[Path, Path], Any]
         if self._location.is_file():
             copy_func = shutil.copy2
         else:
-            copy_func = functools.partial(shutil.copytree, dirs_exist_ok=True)
+            copy_func = _install_tree
 
         # noinspection PyBroadException
         try:
-            copy_func(src=str(self._location), dst=str(target_dir / self._location.name))
+            copy_func(self._location, target_dir / self._location.name)
         except:  # noqa: E722
             log.exception("Error occurred when copying path: %s", self._location)
             return False
         return True
 
-    def _read_info_file(self) -> None:
-        super()._read_info_file()
+    def _read_info_file(self, contents: Optional[str] = None) -> None:
+        super()._read_info_file(contents)
 
         update_mixin(self, INSTALLABLE_SCHEMA)
         if self.type == InstallableType.SHARED_LIBRARY:
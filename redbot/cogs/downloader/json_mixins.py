@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from .info_schemas import REPO_SCHEMA, update_mixin
 from .log import log
@@ -9,7 +9,7 @@ from .log import log
 class RepoJSONMixin:
     INFO_FILE_NAME = "info.json"
 
-    def __init__(self, repo_folder: Path):
+    def __init__(self, repo_folder: Path, *, info_file_contents: Optional[str] = None):
         self._repo_folder = repo_folder
 
         self.author: Tuple[str, ...]
@@ -20,13 +20,15 @@ class RepoJSONMixin:
         self._info_file = repo_folder / self.INFO_FILE_NAME
         self._info: Dict[str, Any]
 
-        self._read_info_file()
+        self._read_info_file(info_file_contents)
 
-    def _read_info_file(self) -> None:
-        if self._info_file.exists():
+    def _read_info_file(self, contents: Optional[str] = None) -> None:
+        # the info file's contents can be given when it isn't in the working tree
+        if contents is None and self._info_file.exists():
+            contents = self._info_file.read_text(encoding="utf-8")
+        if contents is not None:
             try:
-                with self._info_file.open(encoding="utf-8") as f:
-                    info = json.load(f)
+                info = json.loads(contents)
             except json.JSONDecodeError as e:
                 log.error(
                     "Invalid JSON information file at path: %s\nError: %s", self._info_file, str(e)
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import json
 import keyword
 import os
 import pkgutil
 import shlex
 import shutil
 import re
+import time
 import yarl
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
@@ -27,7 +29,6 @@ from typing import (
     Tuple,
 )
 
-import discord
 from redbot.core import data_manager, commands, Config
 from redbot.core.utils._internal_utils import safe_delete
 from redbot.core.i18n import Translator
@@ -120,19 +121,24 @@ class Repo(RepoJSONMixin):
     GIT_IS_ANCESTOR = (
         "git -C {path} merge-base --is-ancestor {maybe_ancestor_rev} {descendant_rev}"
     )
-    GIT_CHECK_IF_MODULE_EXISTS = "git -C {path} cat-file -e {rev}:{module_name}/__init__.py"
-    # ↓ this gives a commit after last occurrence
-    GIT_GET_LAST_MODULE_OCCURRENCE_COMMIT = (
-        "git -C {path} log --diff-filter=D --pretty=format:%H -n 1 {descendant_rev}"
-        " -- {module_name}/__init__.py"
+    GIT_GET_LAST_MODULE_DELETIONS = (
+        "git -C {path} log --diff-filter=D --name-only --pretty=format:%P {descendant_rev}"
+        " -- {module_paths}"
     )
+    GIT_CAT_FILE_BATCH = "git -C {path} cat-file --batch"
 
     PIP_INSTALL = "{python} -m pip install -U -t {target_dir} {reqs}"
+    PIP_INSTALL_CACHED = (
+        "{python} -m pip install -U --cache-dir {cache_dir} -t {target_dir} {reqs}"
+    )
 
     MODULE_FOLDER_REGEX = re.compile(r"(\w+)\/")
     AMBIGUOUS_ERROR_REGEX = re.compile(
         r"^hint: {3}(?P<rev>[A-Za-z0-9]+) (?P<type>commit|tag) (?P<desc>.+)$", re.MULTILINE
     )
+    #: The maximum amount of commits kept in the repo's module index.
+    MODULE_INDEX_SIZE = 8
+    MODULE_INDEX_FILE_NAME = "red_module_index.json"
 
     def __init__(
         self,
@@ -155,6 +161,10 @@ class Repo(RepoJSONMixin):
         super().__init__(self.folder_path)
 
         self.available_modules = available_modules
+        # commit -> modules available in it, scanned once per commit
+        self._module_index: Dict[str, Tuple[Installable, ...]] = {}
+        # commit -> module name -> info.json contents, persisted across restarts
+        self._module_index_data: Optional[Dict[str, Dict[str, str]]] = None
 
         self._executor = ThreadPoolExecutor(1)
 
@@ -287,48 +297,94 @@ class Repo(RepoJSONMixin):
 
         return ret
 
-    async def get_last_module_occurrence(
-        self, module_name: str, descendant_rev: Optional[str] = None
-    ) -> Optional[Installable]:
+    async def _read_objects(
+        self, object_names: Iterable[str], *, commits: Iterable[str] = ()
+    ) -> Dict[str, Optional[Tuple[str, bytes]]]:
         """
-        Gets module's `Installable` from last commit in which it still occurs.
+        Reads the given objects with a single git process.
 
         Parameters
         ----------
-        module_name : str
-            Name of module to get.
-        descendant_rev : `str`, optional
-            Revision from which the module's commit must be
-            reachable (i.e. descendant commit),
-            defaults to repo's branch if not given.
+        object_names : `iterable` of `str`
+            Names of the objects to read, e.g. :code:`<rev>:<path>`
+        commits : `iterable` of `str`
+            Revisions to read the commits of, mapped as :code:`<rev>^{commit}`
+
+        Raises
+        ------
+        .UnknownRevision
+            When git cannot find one of the provided commits.
 
         Returns
         -------
-        `Installable`
-            Module from last commit in which it still occurs
-            or `None` if it couldn't be found.
+        Dict[str, Optional[Tuple[str, bytes]]]
+            Mapping of object name -> 2-`tuple` of object's full sha1 and contents
+            or `None` if the object doesn't exist.
 
         """
-        if descendant_rev is None:
-            descendant_rev = self.branch
+        commits = tuple(commits)
+        object_names = list(
+            dict.fromkeys((*(f"{rev}^{{commit}}" for rev in commits), *object_names))
+        )
+        if not object_names:
+            return {}
+        git_command = ProcessFormatter().format(self.GIT_CAT_FILE_BATCH, path=self.folder_path)
         p = await self._run(
-            ProcessFormatter().format(
-                self.GIT_CHECK_IF_MODULE_EXISTS,
-                path=self.folder_path,
-                rev=descendant_rev,
-                module_name=module_name,
-            ),
-            debug_only=True,
+            git_command, input="".join(f"{name}\n" for name in object_names).encode()
         )
-        if p.returncode == 0:
-            async with self.checkout(descendant_rev):
-                return discord.utils.get(self.available_modules, name=module_name)
 
+        if p.returncode != 0:
+            raise errors.GitException(
+                f"Git cat-file failed for repo at path: {self.folder_path}", git_command
+            )
+
+        ret: Dict[str, Optional[Tuple[str, bytes]]] = {}
+        stdout = p.stdout
+        pos = 0
+        for name in object_names:
+            end = stdout.index(b"\n", pos)
+            header = stdout[pos:end].split()
+            pos = end + 1
+            # `<object> missing` or `<object> ambiguous`
+            if len(header) != 3:
+                ret[name] = None
+                continue
+            size = int(header[2])
+            ret[name] = (header[0].decode(**DECODE_PARAMS), stdout[pos : pos + size])
+            # contents are followed by a newline
+            pos += size + 1
+
+        for rev in commits:
+            if ret[f"{rev}^{{commit}}"] is None:
+                raise errors.UnknownRevision(f"Revision {rev} cannot be found.", git_command)
+
+        return ret
+
+    async def _get_last_module_deletions(
+        self, module_names: Iterable[str], descendant_rev: str
+    ) -> Dict[str, str]:
+        """
+        Gets the last commit in which each module still occurred, before it was deleted.
+
+        Parameters
+        ----------
+        module_names : `iterable` of `str`
+            Names of the modules.
+        descendant_rev : `str`
+            Revision from which the deletion commits must be reachable.
+
+        Returns
+        -------
+        Dict[str, str]
+            Mapping of module name -> commit before the module's last deletion,
+            modules that were never deleted are missing from it.
+
+        """
         git_command = ProcessFormatter().format(
-            self.GIT_GET_LAST_MODULE_OCCURRENCE_COMMIT,
+            self.GIT_GET_LAST_MODULE_DELETIONS,
             path=self.folder_path,
             descendant_rev=descendant_rev,
-            module_name=module_name,
+            module_paths=[f"{name}/__init__.py" for name in module_names],
         )
         p = await self._run(git_command)
 
@@ -337,38 +393,82 @@ class Repo(RepoJSONMixin):
                 f"Git log failed for repo at path: {self.folder_path}", git_command
             )
 
-        commit = p.stdout.decode(**DECODE_PARAMS).strip()
-        if commit:
-            async with self.checkout(f"{commit}~"):
-                return discord.utils.get(self.available_modules, name=module_name)
-        return None
+        ret: Dict[str, str] = {}
+        parent = ""
+        # commits are listed from newest, each as a line with its parents
+        # followed by lines with deleted files
+        for line in p.stdout.decode(**DECODE_PARAMS).splitlines():
+            if "/" in line:
+                ret.setdefault(line.partition("/")[0], parent)
+            elif line:
+                parent = line.split(maxsplit=1)[0]
+
+        return ret
+
+    def _module_from_object(
+        self, module_name: str, commit: str, info_file: Optional[Tuple[str, bytes]]
+    ) -> Installable:
+        # a module without info file at the given commit mustn't read the working tree's one
+        contents = "{}" if info_file is None else info_file[1].decode("utf-8")
+        return Installable(
+            location=self.folder_path / module_name,
+            repo=self,
+            commit=commit,
+            info_file_contents=contents,
+        )
+
+    @staticmethod
+    def _is_valid_module_name(name: str) -> bool:
+        # reject package names that can't be valid python identifiers
+        return name.isidentifier() and not keyword.iskeyword(name)
 
-    async def _is_module_modified(self, module: Installable, other_hash: str) -> bool:
+    async def get_last_module_occurrence(
+        self, module_name: str, descendant_rev: Optional[str] = None
+    ) -> Optional[Installable]:
         """
-        Checks if given module was different in :code:`other_hash`.
+        Gets module's `Installable` from last commit in which it still occurs.
 
         Parameters
         ----------
-        module : `Installable`
-            Module to check.
-        other_hash : `str`
-            Hash to compare module to.
+        module_name : str
+            Name of module to get.
+        descendant_rev : `str`, optional
+            Revision from which the module's commit must be
+            reachable (i.e. descendant commit),
+            defaults to repo's branch if not given.
 
         Returns
         -------
-        bool
-            `True` if module was different, `False` otherwise.
+        `Installable`
+            Module from last commit in which it still occurs
+            or `None` if it couldn't be found.
 
         """
-        if module.commit == other_hash:
-            return False
-
-        for status in await self._get_file_update_statuses(other_hash, module.commit):
-            match = self.MODULE_FOLDER_REGEX.match(status)
-            if match is not None and match.group(1) == module.name:
-                return True
+        if descendant_rev is None:
+            descendant_rev = self.branch
+        if not self._is_valid_module_name(module_name):
+            return None
+        objects = await self._read_objects(
+            (
+                f"{descendant_rev}:{module_name}/__init__.py",
+                f"{descendant_rev}:{module_name}/info.json",
+            ),
+            commits=(descendant_rev,),
+        )
+        commit = objects[f"{descendant_rev}^{{commit}}"][0]
+        if objects[f"{descendant_rev}:{module_name}/__init__.py"] is not None:
+            return self._module_from_object(
+                module_name, commit, objects[f"{descendant_rev}:{module_name}/info.json"]
+            )
 
-        return False
+        deletions = await self._get_last_module_deletions((module_name,), commit)
+        last_commit = deletions.get(module_name)
+        if last_commit is None:
+            return None
+        objects = await self._read_objects((f"{last_commit}:{module_name}/info.json",))
+        return self._module_from_object(
+            module_name, last_commit, objects[f"{last_commit}:{module_name}/info.json"]
+        )
 
     async def get_modified_modules(
         self, old_rev: str, new_rev: Optional[str] = None
@@ -378,6 +478,8 @@ class Repo(RepoJSONMixin):
         For every module that doesn't exist in :code:`new_rev`,
         it will try to find last commit, where it still existed
 
+        This is done on git objects, without checking out either revision.
+
         Parameters
         ----------
         old_rev : `str`
@@ -397,31 +499,55 @@ class Repo(RepoJSONMixin):
         # check differences
         for status in await self._get_file_update_statuses(old_rev, new_rev):
             match = self.MODULE_FOLDER_REGEX.match(status)
-            if match is not None:
+            if match is not None and self._is_valid_module_name(match.group(1)):
                 modified_modules.add(match.group(1))
+        if not modified_modules:
+            return ()
+        module_names = sorted(modified_modules)
+
+        objects = await self._read_objects(
+            (
+                *(f"{old_rev}:{name}/__init__.py" for name in module_names),
+                *(f"{old_rev}:{name}" for name in module_names),
+                *(f"{new_rev}:{name}/__init__.py" for name in module_names),
+                *(f"{new_rev}:{name}/info.json" for name in module_names),
+            ),
+            commits=(new_rev,),
+        )
+        new_commit = objects[f"{new_rev}^{{commit}}"][0]
 
-        async with self.checkout(old_rev):
-            # save old modules
-            old_hash = self.commit
-            old_modules = self.available_modules
-            # save new modules
-            await self.checkout(new_rev)
-            modules = []
-            new_modules = self.available_modules
-            for old_module in old_modules:
-                if old_module.name not in modified_modules:
+        modules = {}
+        removed_modules = []
+        for name in module_names:
+            if objects[f"{old_rev}:{name}/__init__.py"] is None:
+                # module was added in new revision
+                continue
+            if objects[f"{new_rev}:{name}/__init__.py"] is not None:
+                modules[name] = self._module_from_object(
+                    name, new_commit, objects[f"{new_rev}:{name}/info.json"]
+                )
+            else:
+                removed_modules.append(name)
+
+        if removed_modules:
+            # module doesn't exist in new revision, try finding previous occurrences
+            deletions = await self._get_last_module_deletions(removed_modules, new_commit)
+            last_objects = await self._read_objects(
+                name
+                for module_name, commit in deletions.items()
+                for name in (f"{commit}:{module_name}", f"{commit}:{module_name}/info.json")
+            )
+            for name, commit in deletions.items():
+                tree = last_objects[f"{commit}:{name}"]
+                old_tree = objects[f"{old_rev}:{name}"]
+                # same tree object means there were no changes to the module
+                if tree is not None and old_tree is not None and tree[0] == old_tree[0]:
                     continue
-                try:
-                    index = new_modules.index(old_module)
-                except ValueError:
-                    # module doesn't exist in this revision, try finding previous occurrence
-                    module = await self.get_last_module_occurrence(old_module.name, new_rev)
-                    if module is not None and await self._is_module_modified(module, old_hash):
-                        modules.append(module)
-                else:
-                    modules.append(new_modules[index])
+                modules[name] = self._module_from_object(
+                    name, commit, last_objects[f"{commit}:{name}/info.json"]
+                )
 
-        return tuple(modules)
+        return tuple(modules[name] for name in module_names if name in modules)
 
     async def _get_commit_notes(self, old_rev: str, relative_file_path: str) -> str:
         """
@@ -499,11 +625,65 @@ class Repo(RepoJSONMixin):
 
         return p.stdout.decode(**DECODE_PARAMS).strip()
 
+    @property
+    def _module_index_file(self) -> Path:
+        # kept in the git directory, so that it goes away with the repo
+        return self.folder_path / ".git" / self.MODULE_INDEX_FILE_NAME
+
+    def _load_module_index(self) -> Dict[str, Dict[str, str]]:
+        if self._module_index_data is None:
+            try:
+                with self._module_index_file.open(encoding="utf-8") as fs:
+                    data = json.load(fs)
+            except (OSError, ValueError):
+                data = {}
+            if not isinstance(data, dict):
+                data = {}
+            self._module_index_data = {
+                commit: modules
+                for commit, modules in data.items()
+                if isinstance(modules, dict)
+                and all(
+                    self._is_valid_module_name(name) and isinstance(contents, str)
+                    for name, contents in modules.items()
+                )
+            }
+        return self._module_index_data
+
+    def _save_module_index(self) -> None:
+        try:
+            with self._module_index_file.open("w", encoding="utf-8") as fs:
+                json.dump(self._module_index_data, fs)
+        except OSError as exc:
+            log.debug("Failed to save the module index of repo %s", self.name, exc_info=exc)
+
     def _update_available_modules(self) -> Tuple[Installable, ...]:
         """
         Updates the available modules attribute for this repo.
+        Modules of a commit that was already scanned are taken from the repo's module index,
+        which is also saved in the repo's git directory to be reused after a restart.
         :return: List of available modules.
         """
+        if self.commit:
+            modules = self._module_index.pop(self.commit, None)
+            if modules is None:
+                index_data = self._load_module_index().get(self.commit)
+                if index_data is not None:
+                    modules = tuple(
+                        Installable(
+                            location=self.folder_path / name,
+                            repo=self,
+                            commit=self.commit,
+                            info_file_contents=contents,
+                        )
+                        for name, contents in index_data.items()
+                    )
+            if modules is not None:
+                # move to the end, as the most recently used commit
+                self._module_index[self.commit] = self.available_modules = modules
+                self._trim_module_index()
+                return modules
+
         curr_modules = []
         """
         for name in self.folder_path.iterdir():
@@ -516,18 +696,44 @@ class Repo(RepoJSONMixin):
                         Installable(location=name)
                     )
         """
+        index_data = {}
         for file_finder, name, is_pkg in pkgutil.iter_modules(path=[str(self.folder_path)]):
-            if not name.isidentifier() or keyword.iskeyword(name):
-                # reject package names that can't be valid python identifiers
+            if not self._is_valid_module_name(name):
                 continue
             if is_pkg:
+                info_file = self.folder_path / name / Installable.INFO_FILE_NAME
+                try:
+                    contents = info_file.read_text(encoding="utf-8")
+                except FileNotFoundError:
+                    contents = "{}"
+                index_data[name] = contents
                 curr_modules.append(
-                    Installable(location=self.folder_path / name, repo=self, commit=self.commit)
+                    Installable(
+                        location=self.folder_path / name,
+                        repo=self,
+                        commit=self.commit,
+                        info_file_contents=contents,
+                    )
                 )
         self.available_modules = tuple(curr_modules)
+        if self.commit:
+            self._module_index[self.commit] = self.available_modules
+            self._load_module_index()[self.commit] = index_data
+            self._trim_module_index()
+            self._save_module_index()
 
         return self.available_modules
 
+    def _trim_module_index(self) -> None:
+        # both indexes keep the most recently used commits last
+        if len(self._module_index) > self.MODULE_INDEX_SIZE:
+            del self._module_index[next(iter(self._module_index))]
+        index_data = self._load_module_index()
+        if self.commit in index_data:
+            index_data[self.commit] = index_data.pop(self.commit)
+        while len(index_data) > self.MODULE_INDEX_SIZE:
+            del index_data[next(iter(index_data))]
+
     async def _run(
         self,
         *args: Any,
@@ -869,7 +1075,12 @@ class Repo(RepoJSONMixin):
         return InstalledModule.from_installable(cog)
 
     async def install_libraries(
-        self, target_dir: Path, req_target_dir: Path, libraries: Iterable[Installable] = ()
+        self,
+        target_dir: Path,
+        req_target_dir: Path,
+        libraries: Iterable[Installable] = (),
+        *,
+        cache_dir: Optional[Path] = None,
     ) -> Tuple[Tuple[InstalledModule, ...], Tuple[Installable, ...]]:
         """Install shared libraries to the target directory.
 
@@ -884,6 +1095,8 @@ class Repo(RepoJSONMixin):
             Directory to install shared library requirements to.
         libraries : `tuple` of `Installable`
             A subset of available libraries.
+        cache_dir : pathlib.Path, optional
+            pip cache directory to use.
 
         Returns
         -------
@@ -903,7 +1116,9 @@ class Repo(RepoJSONMixin):
             failed = []
             for lib in libraries:
                 if not (
-                    await self.install_requirements(cog=lib, target_dir=req_target_dir)
+                    await self.install_requirements(
+                        cog=lib, target_dir=req_target_dir, cache_dir=cache_dir
+                    )
                     and await lib.copy_to(target_dir=target_dir)
                 ):
                     failed.append(lib)
@@ -912,7 +1127,9 @@ class Repo(RepoJSONMixin):
             return (tuple(installed), tuple(failed))
         return ((), ())
 
-    async def install_requirements(self, cog: Installable, target_dir: Path) -> bool:
+    async def install_requirements(
+        self, cog: Installable, target_dir: Path, *, cache_dir: Optional[Path] = None
+    ) -> bool:
         """Install a cog's requirements.
 
         Requirements will be installed via pip directly into
@@ -924,6 +1141,8 @@ class Repo(RepoJSONMixin):
             Cog for which to install requirements.
         target_dir : pathlib.Path
             Path to directory  where requirements are to be installed.
+        cache_dir : pathlib.Path, optional
+            pip cache directory to use.
 
         Returns
         -------
@@ -935,10 +1154,12 @@ class Repo(RepoJSONMixin):
             raise ValueError("Target directory is not a directory.")
         target_dir.mkdir(parents=True, exist_ok=True)
 
-        return await self.install_raw_requirements(cog.requirements, target_dir)
+        return await self.install_raw_requirements(
+            cog.requirements, target_dir, cache_dir=cache_dir
+        )
 
     async def install_raw_requirements(
-        self, requirements: Iterable[str], target_dir: Path
+        self, requirements: Iterable[str], target_dir: Path, *, cache_dir: Optional[Path] = None
     ) -> bool:
         """Install a list of requirements using pip.
 
@@ -948,6 +1169,8 @@ class Repo(RepoJSONMixin):
             List of requirement names to install via pip.
         target_dir : pathlib.Path
             Path to directory where requirements are to be installed.
+        cache_dir : pathlib.Path, optional
+            pip cache directory to use, pip's default cache is used when not provided.
 
         Returns
         -------
@@ -960,11 +1183,19 @@ class Repo(RepoJSONMixin):
 
         # TODO: Check and see if any of these modules are already available
 
-        p = await self._run(
-            ProcessFormatter().format(
+        if cache_dir is None:
+            command = ProcessFormatter().format(
                 self.PIP_INSTALL, python=executable, target_dir=target_dir, reqs=requirements
             )
-        )
+        else:
+            command = ProcessFormatter().format(
+                self.PIP_INSTALL_CACHED,
+                python=executable,
+                cache_dir=cache_dir,
+                target_dir=target_dir,
+                reqs=requirements,
+            )
+        p = await self._run(command)
 
         if p.returncode != 0:
             log.error(
@@ -975,6 +1206,40 @@ class Repo(RepoJSONMixin):
             return False
         return True
 
+    async def install_raw_requirements_batch(
+        self, requirements: Iterable[str], target_dir: Path, *, cache_dir: Optional[Path] = None
+    ) -> Tuple[str, ...]:
+        """Install a list of requirements using a single pip invocation.
+
+        If the installation fails, the requirements are split in halves
+        which are installed separately, until the failing requirements are found.
+
+        Parameters
+        ----------
+        requirements : `tuple` of `str`
+            List of requirement names to install via pip.
+        target_dir : pathlib.Path
+            Path to directory where requirements are to be installed.
+        cache_dir : pathlib.Path, optional
+            pip cache directory to use, pip's default cache is used when not provided.
+
+        Returns
+        -------
+        tuple
+            Tuple of failed requirements.
+
+        """
+
+        async def bisect(reqs: Tuple[str, ...]) -> Tuple[str, ...]:
+            if await self.install_raw_requirements(reqs, target_dir, cache_dir=cache_dir):
+                return ()
+            if len(reqs) == 1:
+                return reqs
+            middle = len(reqs) // 2
+            return await bisect(reqs[:middle]) + await bisect(reqs[middle:])
+
+        return await bisect(tuple(requirements))
+
     @property
     def available_cogs(self) -> Tuple[Installable, ...]:
         """`tuple` of `installable` : All available cogs in this Repo.
@@ -1008,7 +1273,30 @@ class Repo(RepoJSONMixin):
         return repo
 
 
+class RepoUpdateResult(tuple):
+    """The ``(updated, failed)`` pair returned by `RepoManager.update_repos`.
+
+    It unpacks like a 2-tuple and also holds the time each repo's update took.
+    """
+
+    timings: Dict[str, float]
+
+    def __new__(
+        cls,
+        updated: Dict[Repo, Tuple[str, str]],
+        failed: List[str],
+        timings: Dict[str, float],
+    ) -> "RepoUpdateResult":
+        self = super().__new__(cls, (updated, failed))
+        #: A mapping of `Repo` names to the time, in seconds, their update took.
+        self.timings = timings
+        return self
+
+
 class RepoManager:
+    #: The maximum amount of repos updated at the same time by `update_repos`.
+    UPDATE_CONCURRENCY = 8
+
     GITHUB_OR_GITLAB_RE = re.compile(r"https?://git(?:hub)|(?:lab)\.com/")
     TREE_URL_RE = re.compile(r"(?P<tree>/tree)/(?P<branch>\S+)$")
 
@@ -1158,13 +1446,12 @@ class RepoManager:
         old, new = await repo.update()
         return (repo, (old, new))
 
-    async def update_repos(
-        self, repos: Optional[Iterable[Repo]] = None
-    ) -> Tuple[Dict[Repo, Tuple[str, str]], List[str]]:
+    async def update_repos(self, repos: Optional[Iterable[Repo]] = None) -> RepoUpdateResult:
         """Calls `Repo.update` on passed repositories and
         catches failing ones.
 
         Calling without params updates all currently installed repos.
+        Up to `UPDATE_CONCURRENCY` repos are updated at the same time.
 
         Parameters
         ----------
@@ -1173,23 +1460,37 @@ class RepoManager:
 
         Returns
         -------
-        tuple of Dict and list
+        RepoUpdateResult
+            A tuple of Dict and list:
+
             A mapping of `Repo` objects that received new commits to
             a 2-`tuple` of `str` containing old and new commit hashes.
 
             `list` of failed `Repo` names
+
+            Its ``timings`` attribute maps `Repo` names to the time their update took.
         """
         failed = []
         ret = {}
+        timings = {}
 
         # select all repos if not specified
-        if not repos:
-            repos = self.repos
+        repos = list(repos or self.repos)
+        semaphore = asyncio.Semaphore(self.UPDATE_CONCURRENCY)
 
-        for repo in repos:
-            try:
-                updated_repo, (old, new) = await self.update_repo(repo.name)
-            except errors.UpdateError as err:
+        async def update(repo: Repo) -> Tuple[Repo, Tuple[str, str]]:
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    return await self.update_repo(repo.name)
+                finally:
+                    timings[repo.name] = time.perf_counter() - start
+                    log.debug("Updating repo '%s' took %.2fs", repo.name, timings[repo.name])
+
+        results = await asyncio.gather(*map(update, repos), return_exceptions=True)
+        for repo, result in zip(repos, results):
+            if isinstance(result, errors.UpdateError):
+                err = result
                 log.error(
                     "Repository '%s' failed to update. URL: '%s' on branch '%s'",
                     repo.name,
@@ -1200,11 +1501,14 @@ class RepoManager:
 
                 failed.append(repo.name)
                 continue
+            if isinstance(result, BaseException):
+                raise result
 
+            updated_repo, (old, new) = result
             if old != new:
                 ret[updated_repo] = (old, new)
 
-        return ret, failed
+        return RepoUpdateResult(ret, failed, timings)
 
     async def _load_repos(self, set_repos: bool = False) -> Dict[str, Repo]:
         ret = {}
@@ -1,6 +1,6 @@
 import logging
 import asyncio
-from typing import Union, List, Literal
+from typing import Dict, List, Literal, Optional, Set, Tuple, Union
 from datetime import timedelta
 from copy import copy
 import contextlib
@@ -59,6 +59,14 @@ class Reports(commands.Cog):
         self.tunnel_store = {}
         # (guild, ticket#):
         #   {'tun': Tunnel, 'msgs': List[int]}
+        # Routing indexes for the tunnels in tunnel_store, so that messages and reactions
+        # which aren't part of any correspondence can be dismissed without iterating it.
+        # origin channel id -> {(guild, ticket#)}
+        self._channel_routes: Dict[int, Set[Tuple[discord.Guild, int]]] = {}
+        # recipient user id -> {(guild, ticket#)}
+        self._dm_routes: Dict[int, Set[Tuple[discord.Guild, int]]] = {}
+        # message id -> (guild, ticket#)
+        self._message_routes: Dict[int, Tuple[discord.Guild, int]] = {}
 
     async def red_delete_data_for_user(
         self,
@@ -97,6 +105,55 @@ class Reports(commands.Cog):
     def tunnels(self):
         return [x["tun"] for x in self.tunnel_store.values()]
 
+    def _add_tunnel(self, key: Tuple[discord.Guild, int], tun: Tunnel, msgs: List[int]) -> None:
+        if key in self.tunnel_store:
+            self._remove_tunnel(key)
+        self.tunnel_store[key] = {"tun": tun, "msgs": msgs}
+        self._channel_routes.setdefault(tun.origin.id, set()).add(key)
+        self._dm_routes.setdefault(tun.recipient.id, set()).add(key)
+        for message_id in msgs:
+            self._message_routes[message_id] = key
+
+    def _set_tunnel_messages(self, key: Tuple[discord.Guild, int], msgs: List[int]) -> None:
+        entry = self.tunnel_store[key]
+        for message_id in entry["msgs"]:
+            if self._message_routes.get(message_id) == key:
+                del self._message_routes[message_id]
+        entry["msgs"] = msgs
+        for message_id in msgs:
+            self._message_routes[message_id] = key
+
+    def _remove_tunnel(self, key: Tuple[discord.Guild, int]) -> Optional[dict]:
+        entry = self.tunnel_store.pop(key, None)
+        if entry is None:
+            return None
+        tun = entry["tun"]
+        for routes, route_id in (
+            (self._channel_routes, tun.origin.id),
+            (self._dm_routes, tun.recipient.id),
+        ):
+            keys = routes.get(route_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del routes[route_id]
+        for message_id in entry["msgs"]:
+            if self._message_routes.get(message_id) == key:
+                del self._message_routes[message_id]
+        return entry
+
+    def _route_message(self, message: discord.Message) -> List[Tuple[discord.Guild, int]]:
+        """Get the keys of the tunnels the given message could be forwarded through."""
+        if message.guild is None:
+            keys = self._dm_routes.get(message.author.id, ())
+        else:
+            keys = [
+                key
+                for key in self._channel_routes.get(message.channel.id, ())
+                if self.tunnel_store[key]["tun"].sender.id == message.author.id
+            ]
+        return list(keys)
+
     @commands.admin_or_permissions(manage_guild=True)
     @commands.guild_only()
     @commands.group(name="reportset")
@@ -205,34 +262,37 @@ class Reports(commands.Cog):
         if channel is None:
             return None
 
-        files: List[discord.File] = await Tunnel.files_from_attach(msg)
-
-        ticket_number = await self.config.guild(guild).next_ticket()
-        await self.config.guild(guild).next_ticket.set(ticket_number + 1)
-
-        if await self.bot.embed_requested(channel):
-            em = discord.Embed(description=report, colour=await ctx.embed_colour())
-            em.set_author(
-                name=_("Report from {author}{maybe_nick}").format(
-                    author=author, maybe_nick=(f" ({author.nick})" if author.nick else "")
-                ),
-                icon_url=author.display_avatar,
-            )
-            em.set_footer(text=_("Report #{}").format(ticket_number))
-            send_content = None
-        else:
-            em = None
-            send_content = _("Report from {author.mention} (Ticket #{number})").format(
-                author=author, number=ticket_number
-            )
-            send_content += "\n" + report
+        attachments = await Tunnel.spool_attachments(msg)
+        with attachments:
+            ticket_number = await self.config.guild(guild).next_ticket()
+            await self.config.guild(guild).next_ticket.set(ticket_number + 1)
+
+            if await self.bot.embed_requested(channel):
+                em = discord.Embed(description=report, colour=await ctx.embed_colour())
+                em.set_author(
+                    name=_("Report from {author}{maybe_nick}").format(
+                        author=author, maybe_nick=(f" ({author.nick})" if author.nick else "")
+                    ),
+                    icon_url=author.display_avatar,
+                )
+                em.set_footer(text=_("Report #{}").format(ticket_number))
+                send_content = None
+            else:
+                em = None
+                send_content = _("Report from {author.mention} (Ticket #{number})").format(
+                    author=author, number=ticket_number
+                )
+                send_content += "\n" + report
 
-        try:
-            await Tunnel.message_forwarder(
-                destination=channel, content=send_content, embed=em, files=files
-            )
-        except (discord.Forbidden, discord.HTTPException):
-            return None
+            try:
+                await Tunnel.message_forwarder(
+                    destination=channel,
+                    content=send_content,
+                    embed=em,
+                    files=attachments.to_files(),
+                )
+            except (discord.Forbidden, discord.HTTPException):
+                return None
 
         await self.config.custom("REPORT", guild.id, ticket_number).report.set(
             {"user_id": author.id, "report": report}
@@ -344,41 +404,55 @@ class Reports(commands.Cog):
         if not str(payload.emoji) == "\N{NEGATIVE SQUARED CROSS MARK}":
             return
 
-        _id = payload.message_id
-        t = next(filter(lambda x: _id in x[1]["msgs"], self.tunnel_store.items()), None)
-
-        if t is None:
+        key = self._message_routes.get(payload.message_id)
+        if key is None:
             return
-        guild = t[0][0]
-        tun = t[1]["tun"]
+        guild = key[0]
+        tun = self.tunnel_store[key]["tun"]
         if payload.user_id in [x.id for x in tun.members]:
             await set_contextual_locales_from_guild(self.bot, guild)
             await tun.react_close(
                 uid=payload.user_id, message=_("{closer} has closed the correspondence")
             )
-            self.tunnel_store.pop(t[0], None)
+            self._remove_tunnel(key)
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
+        keys = self._route_message(message)
+        if not keys:
+            return
         to_remove = []
+        # downloaded once and shared by all tunnels the message is forwarded through
+        attachments = None
 
-        for k, v in self.tunnel_store.items():
-            guild, ticket_number = k
-            if await self.bot.cog_disabled_in_guild(self, guild):
-                to_remove.append(k)
-                continue
+        try:
+            for k in keys:
+                v = self.tunnel_store.get(k)
+                if v is None:
+                    continue
+                guild, ticket_number = k
+                if await self.bot.cog_disabled_in_guild(self, guild):
+                    to_remove.append(k)
+                    continue
 
-            await set_contextual_locales_from_guild(self.bot, guild)
-            topic = _("Re: ticket# {ticket_number} in {guild.name}").format(
-                ticket_number=ticket_number, guild=guild
-            )
-            # Tunnels won't forward unintended messages, this is safe
-            msgs = await v["tun"].communicate(message=message, topic=topic)
-            if msgs:
-                self.tunnel_store[k]["msgs"] = msgs
+                await set_contextual_locales_from_guild(self.bot, guild)
+                topic = _("Re: ticket# {ticket_number} in {guild.name}").format(
+                    ticket_number=ticket_number, guild=guild
+                )
+                if message.attachments and attachments is None:
+                    attachments = await Tunnel.spool_attachments(message)
+                # Tunnels won't forward unintended messages, this is safe
+                msgs = await v["tun"].communicate(
+                    message=message, topic=topic, attachments=attachments
+                )
+                if msgs and k in self.tunnel_store:
+                    self._set_tunnel_messages(k, msgs)
+        finally:
+            if attachments is not None:
+                attachments.close()
 
         for key in to_remove:
-            if tun := self.tunnel_store.pop(key, None):
+            if tun := self._remove_tunnel(key):
                 guild, ticket = key
                 await set_contextual_locales_from_guild(self.bot, guild)
                 await tun["tun"].close_because_disabled(
@@ -444,7 +518,7 @@ class Reports(commands.Cog):
         except discord.Forbidden:
             await ctx.send(_("That user has DMs disabled."))
         else:
-            self.tunnel_store[(guild, ticket_number)] = {"tun": tun, "msgs": m}
+            self._add_tunnel((guild, ticket_number), tun, m)
             await ctx.send(
                 _(
                     "You have opened a 2-way communication about ticket number {ticket_number}."
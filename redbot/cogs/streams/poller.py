@@ -0,0 +1,200 @@
+"""Concurrent polling of stream alerts."""
+import asyncio
+import logging
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import aiohttp
+
+from . import streamtypes as _streamtypes
+from .errors import OfflineStream
+from .streamtypes import Stream, TwitchStream
+
+__all__ = ("PollStats", "StreamPoller")
+
+log = logging.getLogger("red.core.cogs.Streams")
+
+#: The maximum amount of logins or user ids that Twitch's helix endpoints accept per request.
+TWITCH_BATCH_SIZE = 100
+
+DEFAULT_CONCURRENCY: Mapping[str, int] = {
+    "TwitchStream": 10,
+    "YoutubeStream": 5,
+    "PicartoStream": 5,
+}
+
+
+@dataclass
+class PollStats:
+    """Metrics of a single polling cycle."""
+
+    started_at: float
+    duration: float = 0.0
+    #: Streams checked, per service.
+    checked: Counter = field(default_factory=Counter)
+    #: Streams found online, per service.
+    online: Counter = field(default_factory=Counter)
+    #: Streams which failed to be checked, per service.
+    failed: Counter = field(default_factory=Counter)
+    #: Total time spent checking streams, per service.
+    service_time: Counter = field(default_factory=Counter)
+    #: Batched requests made to Twitch's helix endpoints.
+    twitch_batches: int = 0
+
+    def __str__(self) -> str:
+        services = ", ".join(
+            f"{service}: {count} checked, {self.online[service]} online,"
+            f" {self.failed[service]} failed, {self.service_time[service]:.2f}s"
+            for service, count in sorted(self.checked.items())
+        )
+        return (
+            f"Checked {sum(self.checked.values())} streams in {self.duration:.2f}s"
+            f" ({self.twitch_batches} batched Twitch requests) - {services or 'no streams'}"
+        )
+
+
+class StreamPoller:
+    """Checks a set of streams concurrently, using a shared HTTP session.
+
+    Checks are bounded per service. Twitch streams are looked up
+    in batches of up to `TWITCH_BATCH_SIZE` per request, and those requests
+    honour Twitch's rate limits through `TwitchStream.wait_for_rate_limit_reset`.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The session used for all requests.
+    concurrency : Optional[Mapping[str, int]]
+        The maximum amount of concurrent checks per stream type,
+        overriding `DEFAULT_CONCURRENCY`.
+
+    """
+
+    def __init__(
+        self, session: aiohttp.ClientSession, *, concurrency: Optional[Mapping[str, int]] = None
+    ):
+        self.session = session
+        self._concurrency = {**DEFAULT_CONCURRENCY, **(concurrency or {})}
+        # Used for the batched requests, so that their rate limit state persists across cycles.
+        self._twitch_requester: Optional[TwitchStream] = None
+        self.last_stats: Optional[PollStats] = None
+
+    async def poll(
+        self,
+        streams: Sequence[Stream],
+        *,
+        twitch_token: Optional[str] = None,
+        twitch_bearer: Optional[str] = None,
+    ) -> Dict[Stream, object]:
+        """Check whether the given streams are online.
+
+        Returns
+        -------
+        Dict[Stream, object]
+            A mapping of each stream to the result of its ``is_online()`` call,
+            or the exception that call raised.
+
+        """
+        stats = PollStats(started_at=time.time())
+        start = time.perf_counter()
+        for stream in streams:
+            stream._session = self.session
+
+        twitch_streams = [s for s in streams if s.type == "TwitchStream"]
+        prefetched = {}
+        if twitch_streams:
+            for stream in twitch_streams:
+                stream._bearer = twitch_bearer
+            prefetched = await self._prefetch_twitch(
+                twitch_streams, twitch_token, twitch_bearer, stats
+            )
+
+        semaphores = defaultdict(lambda: asyncio.Semaphore(5))
+        semaphores.update(
+            (service, asyncio.Semaphore(limit)) for service, limit in self._concurrency.items()
+        )
+
+        async def check(stream: Stream) -> Tuple[Stream, object]:
+            async with semaphores[stream.type]:
+                check_start = time.perf_counter()
+                try:
+                    if stream in prefetched:
+                        result = await stream.is_online(stream_response=prefetched[stream])
+                    else:
+                        result = await stream.is_online()
+                except OfflineStream as exc:
+                    result = exc
+                except Exception as exc:
+                    result = exc
+                    stats.failed[stream.type] += 1
+                else:
+                    stats.online[stream.type] += 1
+                stats.checked[stream.type] += 1
+                stats.service_time[stream.type] += time.perf_counter() - check_start
+            return stream, result
+
+        results = dict(await asyncio.gather(*(check(stream) for stream in streams)))
+        stats.duration = time.perf_counter() - start
+        self.last_stats = stats
+        log.debug("%s", stats)
+        return results
+
+    def _get_twitch_requester(self, token: Optional[str], bearer: Optional[str]) -> TwitchStream:
+        requester = self._twitch_requester
+        if requester is None:
+            requester = self._twitch_requester = TwitchStream(_bot=None, name=None)
+        requester._client_id = token
+        requester._bearer = bearer
+        requester._session = self.session
+        return requester
+
+    async def _prefetch_twitch(
+        self,
+        streams: List[TwitchStream],
+        token: Optional[str],
+        bearer: Optional[str],
+        stats: PollStats,
+    ) -> Dict[TwitchStream, Tuple[int, dict]]:
+        """Fetch the streams endpoint responses for Twitch streams in batches.
+
+        Streams without a known user id get it resolved by a batched lookup
+        of their logins first. Any stream not covered by a successful batch
+        is left for `TwitchStream.is_online` to look up on its own.
+        """
+        requester = self._get_twitch_requester(token, bearer)
+
+        missing_ids = [s for s in streams if s.id is None and s.name]
+        for chunk in _chunks(missing_ids, TWITCH_BATCH_SIZE):
+            code, data = await requester.get_data(
+                _streamtypes.TWITCH_ID_ENDPOINT, [("login", s.name) for s in chunk]
+            )
+            stats.twitch_batches += 1
+            if code != 200:
+                continue
+            users = {user["login"].lower(): user for user in data.get("data", [])}
+            for stream in chunk:
+                if (user := users.get(stream.name.lower())) is not None:
+                    stream.id = user["id"]
+
+        prefetched = {}
+        known_ids = [s for s in streams if s.id is not None]
+        for chunk in _chunks(known_ids, TWITCH_BATCH_SIZE):
+            params = [("user_id", s.id) for s in chunk]
+            params.append(("first", str(TWITCH_BATCH_SIZE)))
+            code, data = await requester.get_data(_streamtypes.TWITCH_STREAMS_ENDPOINT, params)
+            stats.twitch_batches += 1
+            if code != 200:
+                continue
+            live = defaultdict(list)
+            for stream_data in data.get("data", []):
+                live[stream_data["user_id"]].append(stream_data)
+            for stream in chunk:
+                prefetched[stream] = (code, {"data": live.get(stream.id, [])})
+        return prefetched
+
+
+def _chunks(items: list, size: int):
+    for idx in range(0, len(items), size):
+        yield items[idx : idx + size]
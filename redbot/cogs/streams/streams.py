@@ -21,6 +21,7 @@ from .errors import (
     StreamsError,
     YoutubeQuotaExceeded,
 )
+from .poller import StreamPoller
 from . import streamtypes as _streamtypes
 
 import re
@@ -28,11 +29,13 @@ import logging
 import asyncio
 import aiohttp
 import contextlib
+import copy
 from datetime import datetime
 from collections import defaultdict
 from typing import Optional, List, Tuple, Union, Dict
 
 MAX_RETRY_COUNT = 10
+STREAMS_GROUP = "STREAMS"
 
 _ = Translator("Streams", __file__)
 log = logging.getLogger("red.core.cogs.Streams")
@@ -73,11 +76,18 @@ class Streams(commands.Cog):
         self.config.register_global(**self.global_defaults)
         self.config.register_guild(**self.guild_defaults)
         self.config.register_role(**self.role_defaults)
+        # stream type -> stream key -> exported stream data
+        self.config.init_custom(STREAMS_GROUP, 2)
+        self.config.register_custom(STREAMS_GROUP)
 
         self.bot: Red = bot
 
         self.streams: List[Stream] = []
+        # (type, key) -> last persisted stream data, used to only save streams that changed
+        self._persisted_streams: Dict[Tuple[str, str], dict] = {}
         self.task: Optional[asyncio.Task] = None
+        self.session = aiohttp.ClientSession()
+        self.poller = StreamPoller(self.session)
 
         self.yt_cid_pattern = re.compile("^UC[-_A-Za-z0-9]{21}[AQgw]$")
 
@@ -210,6 +220,7 @@ class Streams(commands.Cog):
         token = (await self.bot.get_shared_api_tokens("twitch")).get("client_id")
         stream = TwitchStream(
             _bot=self.bot,
+            _session=self.session,
             name=channel_name,
             token=token,
             bearer=self.ttv_bearer_cache.get("access_token", None),
@@ -227,11 +238,19 @@ class Streams(commands.Cog):
         is_name = self.check_name_or_id(channel_id_or_name)
         if is_name:
             stream = YoutubeStream(
-                _bot=self.bot, name=channel_id_or_name, token=apikey, config=self.config
+                _bot=self.bot,
+                _session=self.session,
+                name=channel_id_or_name,
+                token=apikey,
+                config=self.config,
             )
         else:
             stream = YoutubeStream(
-                _bot=self.bot, id=channel_id_or_name, token=apikey, config=self.config
+                _bot=self.bot,
+                _session=self.session,
+                id=channel_id_or_name,
+                token=apikey,
+                config=self.config,
             )
         await self.check_online(ctx, stream)
 
@@ -239,7 +258,7 @@ class Streams(commands.Cog):
     @commands.command()
     async def picarto(self, ctx: commands.Context, channel_name: str):
         """Check if a Picarto channel is live."""
-        stream = PicartoStream(_bot=self.bot, name=channel_name)
+        stream = PicartoStream(_bot=self.bot, _session=self.session, name=channel_name)
         await self.check_online(ctx, stream)
 
     async def check_online(
@@ -436,11 +455,18 @@ class Streams(commands.Cog):
             is_yt = _class.__name__ == "YoutubeStream"
             is_twitch = _class.__name__ == "TwitchStream"
             if is_yt and not self.check_name_or_id(channel_name):
-                stream = _class(_bot=self.bot, id=channel_name, token=token, config=self.config)
+                stream = _class(
+                    _bot=self.bot,
+                    _session=self.session,
+                    id=channel_name,
+                    token=token,
+                    config=self.config,
+                )
             elif is_twitch:
                 await self.maybe_renew_twitch_bearer_token()
                 stream = _class(
                     _bot=self.bot,
+                    _session=self.session,
                     name=channel_name,
                     token=token.get("client_id"),
                     bearer=self.ttv_bearer_cache.get("access_token", None),
@@ -448,10 +474,16 @@ class Streams(commands.Cog):
             else:
                 if is_yt:
                     stream = _class(
-                        _bot=self.bot, name=channel_name, token=token, config=self.config
+                        _bot=self.bot,
+                        _session=self.session,
+                        name=channel_name,
+                        token=token,
+                        config=self.config,
                     )
                 else:
-                    stream = _class(_bot=self.bot, name=channel_name, token=token)
+                    stream = _class(
+                        _bot=self.bot, _session=self.session, name=channel_name, token=token
+                    )
             try:
                 exists = await self.check_exists(stream)
             except InvalidTwitchCredentials:
@@ -823,20 +855,32 @@ class Streams(commands.Cog):
 
     async def check_streams(self):
         to_remove = []
-        for stream in self.streams:
+        if any(stream.type == "TwitchStream" for stream in self.streams):
+            await self.maybe_renew_twitch_bearer_token()
+        results = await self.poller.poll(
+            list(self.streams),
+            twitch_token=(await self.bot.get_shared_api_tokens("twitch")).get("client_id"),
+            twitch_bearer=self.ttv_bearer_cache.get("access_token", None),
+        )
+        # streams may have been removed while they were being checked
+        tracked = set(map(id, self.streams))
+        for stream, result in results.items():
+            if id(stream) not in tracked:
+                continue
             try:
                 try:
                     is_rerun = False
                     is_schedule = False
+                    if isinstance(result, Exception):
+                        raise result
                     if stream.__class__.__name__ == "TwitchStream":
-                        await self.maybe_renew_twitch_bearer_token()
-                        embed, is_rerun = await stream.is_online()
+                        embed, is_rerun = result
 
                     elif stream.__class__.__name__ == "YoutubeStream":
-                        embed, is_schedule = await stream.is_online()
+                        embed, is_schedule = result
 
                     else:
-                        embed = await stream.is_online()
+                        embed = result
                 except StreamNotFound:
                     if stream.retry_count > MAX_RETRY_COUNT:
                         log.info("Stream with name %s no longer exists. Removing...", stream.name)
@@ -864,7 +908,6 @@ class Streams(commands.Cog):
                             await partial_msg.delete()
 
                     stream.messages.clear()
-                    await self.save_streams()
                 except APIError as e:
                     log.error(
                         "Something went wrong whilst trying to contact the stream service's API.\n"
@@ -890,7 +933,6 @@ class Streams(commands.Cog):
                         if is_schedule:
                             # skip messages and mentions
                             await self._send_stream_alert(stream, channel, embed, is_schedule=True)
-                            await self.save_streams()
                             continue
                         await set_contextual_locales_from_guild(self.bot, channel.guild)
 
@@ -942,14 +984,13 @@ class Streams(commands.Cog):
                         if edited_roles:
                             for role in edited_roles:
                                 await role.edit(mentionable=False)
-                        await self.save_streams()
             except Exception as e:
                 log.error("An error has occurred with Streams. Please report it.", exc_info=e)
 
-        if to_remove:
-            for stream in to_remove:
-                self.streams.remove(stream)
-            await self.save_streams()
+        for stream in to_remove:
+            self.streams.remove(stream)
+        # all changes made during this cycle are persisted at once
+        await self.save_streams()
 
     async def _get_mention_str(
         self,
@@ -998,12 +1039,31 @@ class Streams(commands.Cog):
         return filtered
 
     async def load_streams(self):
+        await self._migrate_legacy_streams()
         streams = []
-        for raw_stream in await self.config.streams():
-            _class = getattr(_streamtypes, raw_stream["type"], None)
-            if not _class:
+        # Every service is loaded upfront: the first polling cycle starts right after load
+        # and checks all of them, so deferring a service's group wouldn't save any reads.
+        # Each service is still read with a single query of its own STREAMS group.
+        for type_name in (TwitchStream.__name__, YoutubeStream.__name__, PicartoStream.__name__):
+            raw_streams = await self.config.custom(STREAMS_GROUP, type_name).all()
+            if not raw_streams:
                 continue
-            token = await self.bot.get_shared_api_tokens(_class.token_name)
+            streams.extend(await self._load_service_streams(type_name, raw_streams))
+
+        self._persisted_streams = {
+            (stream.type, self._get_stream_key(stream)): copy.deepcopy(stream.export())
+            for stream in streams
+        }
+        return streams
+
+    async def _load_service_streams(self, type_name: str, raw_streams: Dict[str, dict]):
+        _class = getattr(_streamtypes, type_name, None)
+        if not _class:
+            return []
+        token = await self.bot.get_shared_api_tokens(_class.token_name)
+        streams = []
+        for raw_stream in raw_streams.values():
+            raw_stream = raw_stream.copy()
             if token:
                 if _class.__name__ == "TwitchStream":
                     raw_stream["token"] = token.get("client_id")
@@ -1013,17 +1073,53 @@ class Streams(commands.Cog):
                         raw_stream["config"] = self.config
                     raw_stream["token"] = token
             raw_stream["_bot"] = self.bot
+            raw_stream["_session"] = self.session
             streams.append(_class(**raw_stream))
-
         return streams
 
+    async def _migrate_legacy_streams(self) -> None:
+        """Move streams saved as a single list into the per-stream custom group."""
+        legacy_streams = await self.config.streams()
+        if not legacy_streams:
+            return
+        migrated = await self.config.custom(STREAMS_GROUP).all()
+        for raw_stream in legacy_streams:
+            type_name = raw_stream.get("type", "")
+            if getattr(_streamtypes, type_name, None) is None:
+                continue
+            key = self._get_stream_key(raw_stream)
+            migrated.setdefault(type_name, {})[key] = raw_stream
+        await self.config.custom(STREAMS_GROUP).set(migrated)
+        await self.config.streams.clear()
+
+    @staticmethod
+    def _get_stream_key(stream: Union[Stream, dict]) -> str:
+        if isinstance(stream, dict):
+            stream_id, name = stream.get("id"), stream.get("name")
+        else:
+            stream_id, name = getattr(stream, "id", None), stream.name
+        if stream_id:
+            return str(stream_id)
+        return f"name:{name.lower()}"
+
     async def save_streams(self):
-        raw_streams = []
+        """Persist the streams which were added, changed or removed since the last save."""
+        current = {}
         for stream in self.streams:
-            raw_streams.append(stream.export())
+            current[(stream.type, self._get_stream_key(stream))] = stream.export()
+
+        for type_name, key in self._persisted_streams.keys() - current.keys():
+            await self.config.custom(STREAMS_GROUP, type_name, key).clear()
+            del self._persisted_streams[(type_name, key)]
 
-        await self.config.streams.set(raw_streams)
+        for (type_name, key), data in current.items():
+            if self._persisted_streams.get((type_name, key)) == data:
+                continue
+            data = copy.deepcopy(data)
+            await self.config.custom(STREAMS_GROUP, type_name, key).set(data)
+            self._persisted_streams[(type_name, key)] = data
 
-    def cog_unload(self):
+    async def cog_unload(self):
         if self.task:
             self.task.cancel()
+        await self.session.close()
@@ -8,7 +8,7 @@ from random import choice
 from string import ascii_letters
 from datetime import datetime, timedelta, timezone
 import xml.etree.ElementTree as ET
-from typing import ClassVar, Optional, List, Tuple
+from typing import AsyncIterator, ClassVar, Dict, Iterable, Iterator, Optional, List, Tuple
 
 import aiohttp
 import discord
@@ -34,6 +34,12 @@ YOUTUBE_CHANNELS_ENDPOINT = YOUTUBE_BASE_URL + "/channels"
 YOUTUBE_SEARCH_ENDPOINT = YOUTUBE_BASE_URL + "/search"
 YOUTUBE_VIDEOS_ENDPOINT = YOUTUBE_BASE_URL + "/videos"
 YOUTUBE_CHANNEL_RSS = "https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+#: The maximum amount of video ids the videos endpoint accepts in a single request.
+YOUTUBE_MAX_VIDEOS_PER_REQUEST = 50
+# The channel's RSS feed only lists its 15 latest videos,
+# these just need to be comfortably above that.
+YOUTUBE_MAX_NOT_LIVESTREAMS = 100
+YOUTUBE_MAX_LIVESTREAMS = 50
 
 _ = Translator("Streams", __file__)
 
@@ -53,12 +59,48 @@ def get_video_ids_from_feed(feed):
             yield i.text
 
 
+class BoundedSet:
+    """An insertion-ordered set which forgets its oldest items past ``maxlen``."""
+
+    def __init__(self, iterable: Iterable[str] = (), *, maxlen: int):
+        self.maxlen = maxlen
+        self._items: Dict[str, None] = {}
+        for item in iterable:
+            self.add(item)
+
+    def add(self, item: str) -> None:
+        if item in self._items:
+            return
+        self._items[item] = None
+        if len(self._items) > self.maxlen:
+            del self._items[next(iter(self._items))]
+
+    def discard(self, item: str) -> None:
+        self._items.pop(item, None)
+
+    def last(self) -> str:
+        return next(reversed(self._items))
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"<BoundedSet maxlen={self.maxlen} items={list(self._items)!r}>"
+
+
 class Stream:
     token_name: ClassVar[Optional[str]] = None
     platform_name: ClassVar[Optional[str]] = None
 
     def __init__(self, **kwargs):
         self._bot = kwargs.pop("_bot")
+        self._session: Optional[aiohttp.ClientSession] = kwargs.pop("_session", None)
         self.name = kwargs.pop("name", None)
         self.channels = kwargs.pop("channels", [])
         # self.already_online = kwargs.pop("already_online", False)
@@ -78,6 +120,15 @@ class Stream:
     def make_embed(self):
         raise NotImplementedError()
 
+    @contextlib.asynccontextmanager
+    async def _get_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Get the shared HTTP session, or a temporary one if there isn't any."""
+        if self._session is not None and not self._session.closed:
+            yield self._session
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
+
     def iter_messages(self):
         for msg_data in self.messages:
             data = msg_data.copy()
@@ -112,11 +163,83 @@ class YoutubeStream(Stream):
         self.id = kwargs.pop("id", None)
         self._token = kwargs.pop("token", None)
         self._config = kwargs.pop("config")
-        self.not_livestreams: List[str] = []
-        self.livestreams: List[str] = []
+        self.not_livestreams = BoundedSet(
+            kwargs.pop("not_livestreams", ()), maxlen=YOUTUBE_MAX_NOT_LIVESTREAMS
+        )
+        # Live videos are always checked again, so they're not restored from config.
+        kwargs.pop("livestreams", None)
+        self.livestreams = BoundedSet(maxlen=YOUTUBE_MAX_LIVESTREAMS)
+        # validators of the last fetched RSS feed, used to make conditional requests
+        self._rss_etag: Optional[str] = None
+        self._rss_last_modified: Optional[str] = None
+        self._rss_video_ids: List[str] = []
 
         super().__init__(**kwargs)
 
+    def export(self):
+        data = super().export()
+        data["not_livestreams"] = list(self.not_livestreams)
+        data["livestreams"] = list(self.livestreams)
+        return data
+
+    async def _fetch_feed_video_ids(self) -> List[str]:
+        headers = {}
+        if self._rss_etag is not None:
+            headers["If-None-Match"] = self._rss_etag
+        if self._rss_last_modified is not None:
+            headers["If-Modified-Since"] = self._rss_last_modified
+
+        async with self._get_session() as session:
+            async with session.get(
+                YOUTUBE_CHANNEL_RSS.format(channel_id=self.id), headers=headers
+            ) as r:
+                if r.status == 404:
+                    raise StreamNotFound()
+                if r.status == 304:
+                    log.debug("RSS feed for %s is unchanged", self.id)
+                    return self._rss_video_ids
+                rssdata = await r.text()
+                self._rss_etag = r.headers.get("ETag")
+                self._rss_last_modified = r.headers.get("Last-Modified")
+
+        self._rss_video_ids = list(get_video_ids_from_feed(rssdata))
+        return self._rss_video_ids
+
+    async def _fetch_videos(self, video_ids: List[str]) -> Dict[str, dict]:
+        """Fetch the data of the given videos, in as few requests as the API allows."""
+        videos = {}
+        for idx in range(0, len(video_ids), YOUTUBE_MAX_VIDEOS_PER_REQUEST):
+            params = {
+                "key": self._token["api_key"],
+                "id": ",".join(video_ids[idx : idx + YOUTUBE_MAX_VIDEOS_PER_REQUEST]),
+                "part": "id,snippet,liveStreamingDetails",
+            }
+            async with self._get_session() as session:
+                async with session.get(YOUTUBE_VIDEOS_ENDPOINT, params=params) as r:
+                    data = await r.json()
+            try:
+                self._check_api_errors(data)
+            except InvalidYoutubeCredentials:
+                log.error("The YouTube API key is either invalid or has not been set.")
+                break
+            except YoutubeQuotaExceeded:
+                log.error("YouTube quota has been exceeded.")
+                break
+            except APIError as e:
+                log.error(
+                    "Something went wrong whilst trying to"
+                    " contact the stream service's API.\n"
+                    "Raw response data:\n%r",
+                    e,
+                )
+                continue
+            for video_data in data.get("items", []):
+                videos[video_data["id"]] = video_data
+            # videos which were deleted or made private are missing from the response
+            for video_id in params["id"].split(","):
+                videos.setdefault(video_id, {})
+        return videos
+
     async def is_online(self):
         if not self._token:
             raise InvalidYoutubeCredentials("YouTube API key is not set.")
@@ -126,85 +249,49 @@ class YoutubeStream(Stream):
         elif not self.name:
             self.name = await self.fetch_name()
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(YOUTUBE_CHANNEL_RSS.format(channel_id=self.id)) as r:
-                if r.status == 404:
-                    raise StreamNotFound()
-                rssdata = await r.text()
+        feed_video_ids = await self._fetch_feed_video_ids()
 
         # Reset the retry count since we successfully got information about this
         # channel's streams
         self.retry_count = 0
 
-        if self.not_livestreams:
-            self.not_livestreams = list(dict.fromkeys(self.not_livestreams))
-
-        if self.livestreams:
-            self.livestreams = list(dict.fromkeys(self.livestreams))
-
-        for video_id in get_video_ids_from_feed(rssdata):
-            if video_id in self.not_livestreams:
-                log.debug(f"video_id in not_livestreams: {video_id}")
-                continue
-            log.debug(f"video_id not in not_livestreams: {video_id}")
-            params = {
-                "key": self._token["api_key"],
-                "id": video_id,
-                "part": "id,liveStreamingDetails",
-            }
-            async with aiohttp.ClientSession() as session:
-                async with session.get(YOUTUBE_VIDEOS_ENDPOINT, params=params) as r:
-                    data = await r.json()
-                    try:
-                        self._check_api_errors(data)
-                    except InvalidYoutubeCredentials:
-                        log.error("The YouTube API key is either invalid or has not been set.")
-                        break
-                    except YoutubeQuotaExceeded:
-                        log.error("YouTube quota has been exceeded.")
-                        break
-                    except APIError as e:
-                        log.error(
-                            "Something went wrong whilst trying to"
-                            " contact the stream service's API.\n"
-                            "Raw response data:\n%r",
-                            e,
-                        )
+        to_check = [
+            video_id for video_id in feed_video_ids if video_id not in self.not_livestreams
+        ]
+        log.debug("video_ids not in not_livestreams: %s", to_check)
+        videos = await self._fetch_videos(to_check) if to_check else {}
+        for video_id, video_data in videos.items():
+            stream_data = video_data.get("liveStreamingDetails", {})
+            log.debug(f"stream_data for {video_id}: {stream_data}")
+            if (
+                stream_data
+                and stream_data != "None"
+                and stream_data.get("actualEndTime", None) is None
+            ):
+                actual_start_time = stream_data.get("actualStartTime", None)
+                scheduled = stream_data.get("scheduledStartTime", None)
+                if scheduled is not None and actual_start_time is None:
+                    scheduled = parse_time(scheduled)
+                    if (scheduled - datetime.now(timezone.utc)).total_seconds() < -3600:
                         continue
-                    video_data = data.get("items", [{}])[0]
-                    stream_data = video_data.get("liveStreamingDetails", {})
-                    log.debug(f"stream_data for {video_id}: {stream_data}")
-                    if (
-                        stream_data
-                        and stream_data != "None"
-                        and stream_data.get("actualEndTime", None) is None
-                    ):
-                        actual_start_time = stream_data.get("actualStartTime", None)
-                        scheduled = stream_data.get("scheduledStartTime", None)
-                        if scheduled is not None and actual_start_time is None:
-                            scheduled = parse_time(scheduled)
-                            if (scheduled - datetime.now(timezone.utc)).total_seconds() < -3600:
-                                continue
-                        elif actual_start_time is None:
-                            continue
-                        if video_id not in self.livestreams:
-                            self.livestreams.append(video_id)
-                    else:
-                        self.not_livestreams.append(video_id)
-                        if video_id in self.livestreams:
-                            self.livestreams.remove(video_id)
-        log.debug(f"livestreams for {self.name}: {self.livestreams}")
-        log.debug(f"not_livestreams for {self.name}: {self.not_livestreams}")
-        # This is technically redundant since we have the
-        # info from the RSS ... but incase you don't wanna deal with fully rewriting the
-        # code for this part, as this is only a 2 quota query.
+                elif actual_start_time is None:
+                    continue
+                self.livestreams.add(video_id)
+            else:
+                self.not_livestreams.add(video_id)
+                self.livestreams.discard(video_id)
+        log.debug(f"livestreams for {self.name}: {list(self.livestreams)}")
+        log.debug(f"not_livestreams for {self.name}: {list(self.not_livestreams)}")
         if self.livestreams:
+            latest = self.livestreams.last()
+            if latest in videos:
+                return await self.make_embed({"items": [videos[latest]]})
             params = {
                 "key": self._token["api_key"],
-                "id": self.livestreams[-1],
+                "id": latest,
                 "part": "snippet,liveStreamingDetails",
             }
-            async with aiohttp.ClientSession() as session:
+            async with self._get_session() as session:
                 async with session.get(YOUTUBE_VIDEOS_ENDPOINT, params=params) as r:
                     data = await r.json()
             return await self.make_embed(data)
@@ -269,7 +356,7 @@ class YoutubeStream(Stream):
         else:
             params["id"] = self.id
 
-        async with aiohttp.ClientSession() as session:
+        async with self._get_session() as session:
             async with session.get(YOUTUBE_CHANNELS_ENDPOINT, params=params) as r:
                 data = await r.json()
 
@@ -342,12 +429,12 @@ class TwitchStream(Stream):
                 wait_time = reset_time - current_time + 0.1
                 await asyncio.sleep(wait_time)
 
-    async def get_data(self, url: str, params: dict = {}) -> Tuple[Optional[int], dict]:
+    async def get_data(self, url: str, params=None) -> Tuple[Optional[int], dict]:
         header = {"Client-ID": str(self._client_id)}
         if self._bearer is not None:
             header["Authorization"] = f"Bearer {self._bearer}"
         await self.wait_for_rate_limit_reset()
-        async with aiohttp.ClientSession() as session:
+        async with self._get_session() as session:
             try:
                 async with session.get(url, headers=header, params=params, timeout=60) as resp:
                     remaining = resp.headers.get("Ratelimit-Remaining")
@@ -362,7 +449,7 @@ class TwitchStream(Stream):
                             "Ratelimited. Trying again at %s.", datetime.fromtimestamp(int(reset))
                         )
                         resp.release()
-                        return await self.get_data(url)
+                        return await self.get_data(url, params)
 
                     if resp.status != 200:
                         return resp.status, {}
@@ -372,14 +459,20 @@ class TwitchStream(Stream):
                 log.warning("Connection error occurred when fetching Twitch stream", exc_info=exc)
                 return None, {}
 
-    async def is_online(self):
+    async def is_online(self, *, stream_response: Optional[Tuple[Optional[int], dict]] = None):
+        """Check if the stream is online.
+
+        ``stream_response`` can be used to pass in the ``(status, data)`` response
+        from a request to the streams endpoint that was already made for this stream,
+        e.g. as a part of a batched request for multiple streams.
+        """
         user_profile_data = None
         if self.id is None:
             user_profile_data = await self._fetch_user_profile()
 
-        stream_code, stream_data = await self.get_data(
-            TWITCH_STREAMS_ENDPOINT, {"user_id": self.id}
-        )
+        if stream_response is None:
+            stream_response = await self.get_data(TWITCH_STREAMS_ENDPOINT, {"user_id": self.id})
+        stream_code, stream_data = stream_response
         if stream_code == 200:
             if not stream_data["data"]:
                 raise OfflineStream()
@@ -467,7 +560,7 @@ class PicartoStream(Stream):
     async def is_online(self):
         url = "https://api.picarto.tv/api/v1/channel/name/" + self.name
 
-        async with aiohttp.ClientSession() as session:
+        async with self._get_session() as session:
             async with session.get(url) as r:
                 data = await r.text(encoding="utf-8")
         if r.status == 200:
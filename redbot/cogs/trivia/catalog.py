@@ -0,0 +1,244 @@
+"""Module for the catalog of available trivia lists."""
+import json
+import os
+import pathlib
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional
+
+from .log import LOG
+
+__all__ = ("TriviaCatalog", "TriviaListInfo")
+
+_INDEX_FILENAME = "index.json"
+_RESERVED_KEYS = ("$schema", "AUTHOR", "CONFIG")
+
+
+@dataclass(frozen=True)
+class TriviaListInfo:
+    """Metadata about a trivia list, available without loading its questions.
+
+    ``author`` and ``question_count`` are ``None`` until the list
+    has been parsed at least once.
+    """
+
+    name: str
+    path: pathlib.Path
+    is_core: bool
+    mtime_ns: int
+    size: int
+    author: Optional[str] = None
+    question_count: Optional[int] = None
+
+    @property
+    def cache_key(self) -> str:
+        return f"{'core' if self.is_core else 'custom'}-{self.name}"
+
+
+class TriviaCatalog:
+    """A catalog of the core and custom trivia lists.
+
+    Each list is parsed and validated once, after which a JSON copy of it
+    is kept in the cache directory until the source file's mtime or size changes.
+    The directories are only scanned on `refresh`, uploads and deletions
+    update the catalog incrementally through `add` and `remove`.
+
+    Parameters
+    ----------
+    core_path : pathlib.Path
+        The directory containing the trivia lists packaged with the bot.
+    custom_path : pathlib.Path
+        The directory containing the uploaded trivia lists.
+    cache_path : pathlib.Path
+        The directory to keep parsed lists and their metadata in.
+    loader : Callable[[pathlib.Path], Dict[str, Any]]
+        The function used to parse and validate a trivia list file.
+
+    """
+
+    def __init__(
+        self,
+        core_path: pathlib.Path,
+        custom_path: pathlib.Path,
+        cache_path: pathlib.Path,
+        *,
+        loader: Callable[[pathlib.Path], Dict[str, Any]],
+    ):
+        self.core_path = core_path
+        self.custom_path = custom_path
+        self.cache_path = cache_path
+        self._loader = loader
+        self._lists: Dict[str, TriviaListInfo] = {}
+        self._index: Dict[str, Dict[str, Any]] = {}
+
+    def refresh(self) -> None:
+        """Rescan the trivia list directories, reusing cached metadata where possible."""
+        if not self._index:
+            self._index = self._read_index()
+        lists = {}
+        # custom lists are added last so that, like before, they take priority over core ones
+        for directory, is_core in ((self.core_path, True), (self.custom_path, False)):
+            try:
+                entries = list(os.scandir(directory))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                name, ext = os.path.splitext(entry.name)
+                if ext != ".yaml" or not entry.is_file():
+                    continue
+                info = self._make_info(pathlib.Path(entry.path).resolve(), name, is_core)
+                lists[name] = info
+        self._lists = lists
+
+    def all_lists(self) -> List[TriviaListInfo]:
+        """Get the metadata of all available trivia lists."""
+        return list(self._lists.values())
+
+    def custom_lists(self) -> List[TriviaListInfo]:
+        """Get the metadata of all uploaded trivia lists."""
+        return [info for info in self._lists.values() if not info.is_core]
+
+    def get_info(self, name: str) -> Optional[TriviaListInfo]:
+        """Get the metadata of the trivia list with the given name, if it exists."""
+        return self._lists.get(name)
+
+    def get_list(self, name: str) -> Dict[str, Any]:
+        """Get the trivia list with the given name.
+
+        Raises
+        ------
+        FileNotFoundError
+            There's no trivia list with the given name.
+        InvalidListError
+            Parsing of list's YAML file failed.
+
+        """
+        info = self._lists.get(name)
+        if info is None:
+            raise FileNotFoundError("Could not find the `{}` category.".format(name))
+        try:
+            stat = info.path.stat()
+        except FileNotFoundError:
+            del self._lists[name]
+            raise
+        if (stat.st_mtime_ns, stat.st_size) != (info.mtime_ns, info.size):
+            info = self._lists[name] = TriviaListInfo(
+                name=name,
+                path=info.path,
+                is_core=info.is_core,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+            )
+        elif info.question_count is not None:
+            trivia_dict = self._read_cached(info)
+            if trivia_dict is not None:
+                return trivia_dict
+
+        trivia_dict = self._loader(info.path)
+        self._store(info, trivia_dict)
+        return trivia_dict
+
+    def add(self, path: pathlib.Path, trivia_dict: Dict[str, Any]) -> TriviaListInfo:
+        """Add an uploaded, already validated trivia list to the catalog."""
+        path = path.resolve()
+        stat = path.stat()
+        info = TriviaListInfo(
+            name=path.stem,
+            path=path,
+            is_core=False,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+        )
+        return self._store(info, trivia_dict)
+
+    def remove(self, name: str) -> None:
+        """Remove an uploaded trivia list from the catalog."""
+        info = self._lists.get(name)
+        if info is None or info.is_core:
+            return
+        del self._lists[name]
+        if self._index.pop(info.cache_key, None) is not None:
+            self._write_index()
+        self._unlink_cached(info)
+        core_path = (self.core_path / f"{name}.yaml").resolve()
+        if core_path.is_file():
+            self._lists[name] = self._make_info(core_path, name, True)
+
+    def _make_info(self, path: pathlib.Path, name: str, is_core: bool) -> TriviaListInfo:
+        stat = path.stat()
+        info = TriviaListInfo(
+            name=name, path=path, is_core=is_core, mtime_ns=stat.st_mtime_ns, size=stat.st_size
+        )
+        cached = self._index.get(info.cache_key)
+        if cached is not None and (cached["mtime_ns"], cached["size"]) == (
+            info.mtime_ns,
+            info.size,
+        ):
+            info = replace(info, author=cached["author"], question_count=cached["questions"])
+        return info
+
+    def _store(self, info: TriviaListInfo, trivia_dict: Dict[str, Any]) -> TriviaListInfo:
+        author = trivia_dict.get("AUTHOR")
+        info = replace(
+            info,
+            author=author,
+            question_count=sum(1 for key in trivia_dict if key not in _RESERVED_KEYS),
+        )
+        self._lists[info.name] = info
+        try:
+            self.cache_path.mkdir(parents=True, exist_ok=True)
+            self._atomic_write(
+                self.cache_path / f"{info.cache_key}.json",
+                json.dumps(trivia_dict).encode("utf-8"),
+            )
+        except OSError:
+            LOG.warning("Could not cache the trivia list %s.", info.name, exc_info=True)
+            return info
+        self._index[info.cache_key] = {
+            "mtime_ns": info.mtime_ns,
+            "size": info.size,
+            "author": author,
+            "questions": info.question_count,
+        }
+        self._write_index()
+        return info
+
+    def _read_cached(self, info: TriviaListInfo) -> Optional[Dict[str, Any]]:
+        try:
+            with (self.cache_path / f"{info.cache_key}.json").open(encoding="utf-8") as fp:
+                return json.load(fp)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            LOG.warning("The cached copy of trivia list %s is unreadable.", info.name)
+            return None
+
+    def _unlink_cached(self, info: TriviaListInfo) -> None:
+        try:
+            (self.cache_path / f"{info.cache_key}.json").unlink()
+        except FileNotFoundError:
+            pass
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with (self.cache_path / _INDEX_FILENAME).open(encoding="utf-8") as fp:
+                return json.load(fp)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            LOG.warning("The trivia list cache index is unreadable, it will be rebuilt.")
+            return {}
+
+    def _write_index(self) -> None:
+        try:
+            self._atomic_write(
+                self.cache_path / _INDEX_FILENAME, json.dumps(self._index).encode("utf-8")
+            )
+        except OSError:
+            LOG.warning("Could not save the trivia list cache index.", exc_info=True)
+
+    @staticmethod
+    def _atomic_write(path: pathlib.Path, data: bytes) -> None:
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with tmp_path.open("wb") as fp:
+            fp.write(data)
+        os.replace(tmp_path, path)
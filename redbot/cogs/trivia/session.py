@@ -1,5 +1,6 @@
 """Module to manage trivia sessions."""
 import asyncio
+import re
 import time
 import random
 from collections import Counter
@@ -246,7 +247,7 @@ class TriviaSession:
             The message predicate.
 
         """
-        answers = tuple(s.lower() for s in answers)
+        matcher = _AnswerMatcher(answers)
 
         def _pred(message: discord.Message):
             early_exit = (
@@ -256,15 +257,7 @@ class TriviaSession:
                 return False
 
             self._last_response = time.time()
-            guess = message.content.lower()
-            guess = normalize_smartquotes(guess)
-            for answer in answers:
-                if " " in answer and answer in guess:
-                    # Exact matching, issue #331
-                    return True
-                elif any(word == answer for word in guess.split(" ")):
-                    return True
-            return False
+            return matcher.matches(message.content)
 
         return _pred
 
@@ -347,6 +340,26 @@ class TriviaSession:
         await self.ctx.send(msg)
 
 
+class _AnswerMatcher:
+    """Answers to a single question, precompiled for matching guesses.
+
+    Single word answers must match a whole word of the guess, while answers
+    containing spaces may appear anywhere in it (issue #331).
+    """
+
+    def __init__(self, answers):
+        answers = {s.lower() for s in answers}
+        self.words = frozenset(a for a in answers if " " not in a)
+        phrases = sorted((a for a in answers if " " in a), key=len, reverse=True)
+        self.phrases = re.compile("|".join(map(re.escape, phrases))) if phrases else None
+
+    def matches(self, content: str) -> bool:
+        guess = normalize_smartquotes(content.lower())
+        if self.phrases is not None and self.phrases.search(guess):
+            return True
+        return not self.words.isdisjoint(guess.split(" "))
+
+
 def _parse_answers(answers):
     """Parse the raw answers to readable strings.
 
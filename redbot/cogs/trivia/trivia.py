@@ -19,6 +19,7 @@ from redbot.core.utils.chat_formatting import box, pagify, bold
 from redbot.core.utils.menus import start_adding_reactions
 from redbot.core.utils.predicates import MessagePredicate, ReactionPredicate
 
+from .catalog import TriviaCatalog
 from .checks import trivia_stop_check
 from .converters import finite_float
 from .log import LOG
@@ -28,6 +29,7 @@ from .schema import TRIVIA_LIST_SCHEMA, format_schema_error
 __all__ = ("Trivia", "UNIQUE_ID", "InvalidListError", "get_core_lists", "get_list")
 
 UNIQUE_ID = 0xB3C0E453
+_CORE_LISTS_PATH = pathlib.Path(__file__).parent.resolve() / "data/lists"
 _ = Translator("Trivia", __file__)
 
 
@@ -60,6 +62,16 @@ class Trivia(commands.Cog):
 
         self.config.register_member(wins=0, games=0, total_score=0)
 
+        self._catalog = TriviaCatalog(
+            _CORE_LISTS_PATH,
+            cog_data_path(self),
+            cog_data_path(self) / "cache",
+            loader=get_list,
+        )
+
+    async def cog_load(self) -> None:
+        self._catalog.refresh()
+
     async def red_delete_data_for_user(
         self,
         *,
@@ -225,7 +237,7 @@ class Trivia(commands.Cog):
     @triviaset_custom.command(name="list")
     async def custom_trivia_list(self, ctx: commands.Context):
         """List uploaded custom trivia."""
-        personal_lists = sorted([p.resolve().stem for p in cog_data_path(self).glob("*.yaml")])
+        personal_lists = sorted(info.name for info in self._catalog.custom_lists())
         no_lists_uploaded = _("No custom Trivia lists uploaded.")
 
         if not personal_lists:
@@ -299,6 +311,7 @@ class Trivia(commands.Cog):
         filepath = cog_data_path(self) / f"{name}.yaml"
         if filepath.exists():
             filepath.unlink()
+            self._catalog.remove(filepath.stem)
             await ctx.send(_("Trivia {filename} was deleted.").format(filename=filepath.stem))
         else:
             await ctx.send(_("Trivia file was not found."))
@@ -371,7 +384,7 @@ class Trivia(commands.Cog):
     @trivia.command(name="list")
     async def trivia_list(self, ctx: commands.Context):
         """List available trivia categories."""
-        lists = set(p.stem for p in self._all_lists())
+        lists = set(info.name for info in self._catalog.all_lists())
         if await ctx.embed_requested():
             await ctx.send(
                 embed=discord.Embed(
@@ -619,12 +632,10 @@ class Trivia(commands.Cog):
             A dict mapping questions (`str`) to answers (`list` of `str`).
 
         """
-        try:
-            path = next(p for p in self._all_lists() if p.stem == category)
-        except StopIteration:
-            raise FileNotFoundError("Could not find the `{}` category.".format(category))
-
-        return get_list(path)
+        if self._catalog.get_info(category) is None:
+            # the list may have been added to the data folder manually
+            self._catalog.refresh()
+        return self._catalog.get_list(category)
 
     async def _save_trivia_list(
         self, ctx: commands.Context, attachment: discord.Attachment
@@ -701,6 +712,7 @@ class Trivia(commands.Cog):
                 )
             )
             return
+        self._catalog.add(file, trivia_dict)
 
         await ctx.send(_("Saved Trivia list as {filename}.").format(filename=filename))
 
@@ -714,11 +726,6 @@ class Trivia(commands.Cog):
             (session for session in self.trivia_sessions if session.ctx.channel == channel), None
         )
 
-    def _all_lists(self) -> List[pathlib.Path]:
-        personal_lists = [p.resolve() for p in cog_data_path(self).glob("*.yaml")]
-
-        return personal_lists + get_core_lists()
-
     def cog_unload(self):
         for session in self.trivia_sessions:
             session.force_stop()
@@ -726,8 +733,7 @@ class Trivia(commands.Cog):
 
 def get_core_lists() -> List[pathlib.Path]:
     """Return a list of paths for all trivia lists packaged with the bot."""
-    core_lists_path = pathlib.Path(__file__).parent.resolve() / "data/lists"
-    return list(core_lists_path.glob("*.yaml"))
+    return list(_CORE_LISTS_PATH.glob("*.yaml"))
 
 
 def get_list(path: pathlib.Path) -> Dict[str, Any]:
@@ -1,5 +1,6 @@
 import asyncio
 import contextlib
+import functools
 import platform
 import sys
 import logging
@@ -391,8 +392,8 @@ def init_events(bot, cli_flags):
             help_settings = await HelpSettings.from_context(ctx)
             fuzzy_commands = await fuzzy_command_search(
                 ctx,
-                commands=RedHelpFormatter.help_filter_func(
-                    ctx, bot.walk_commands(), help_settings=help_settings
+                command_filter=functools.partial(
+                    RedHelpFormatter.help_filter_func, ctx, help_settings=help_settings
                 ),
             )
             if not fuzzy_commands:
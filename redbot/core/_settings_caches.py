@@ -515,3 +515,133 @@ class DisabledCogCache:
         self._disable_map[cog_name][guild_id] = False
         await self._config.custom("COG_DISABLE_SETTINGS", cog_name, guild_id).disabled.set(False)
         return True
+
+
+class PrivilegedRoleManager:
+    def __init__(self, config: Config):
+        self._config = config
+        self._cached_roles: Dict[str, Dict[int, Tuple[int, ...]]] = {
+            "admin_role": {},
+            "mod_role": {},
+        }
+
+    async def _get_roles(self, setting: str, guild_id: int) -> Tuple[int, ...]:
+        cache = self._cached_roles[setting]
+        ret = cache.get(guild_id)
+        if ret is None:
+            ret = cache[guild_id] = tuple(
+                await self._config.guild_from_id(guild_id).get_attr(setting)()
+            )
+        return ret
+
+    async def _add_role(self, setting: str, guild_id: int, role_id: int) -> bool:
+        async with self._config.guild_from_id(guild_id).get_attr(setting)() as roles:
+            if role_id in roles:
+                return False
+            roles.append(role_id)
+        self._cached_roles[setting][guild_id] = tuple(roles)
+        return True
+
+    async def _remove_role(self, setting: str, guild_id: int, role_id: int) -> bool:
+        async with self._config.guild_from_id(guild_id).get_attr(setting)() as roles:
+            if role_id not in roles:
+                return False
+            roles.remove(role_id)
+        self._cached_roles[setting][guild_id] = tuple(roles)
+        return True
+
+    async def get_admin_roles(self, guild_id: int) -> Tuple[int, ...]:
+        """
+        Get the IDs of the admin roles in a guild.
+
+        Parameters
+        ----------
+        guild_id: int
+
+        Returns
+        -------
+        Tuple[int, ...]
+        """
+        return await self._get_roles("admin_role", guild_id)
+
+    async def get_mod_roles(self, guild_id: int) -> Tuple[int, ...]:
+        """
+        Get the IDs of the mod roles in a guild.
+
+        Parameters
+        ----------
+        guild_id: int
+
+        Returns
+        -------
+        Tuple[int, ...]
+        """
+        return await self._get_roles("mod_role", guild_id)
+
+    async def add_admin_role(self, guild_id: int, role_id: int) -> bool:
+        """
+        Add an admin role in a guild.
+
+        Parameters
+        ----------
+        guild_id: int
+        role_id: int
+
+        Returns
+        -------
+        bool
+            Whether or not any change was made.
+            This may be useful for settings commands.
+        """
+        return await self._add_role("admin_role", guild_id, role_id)
+
+    async def add_mod_role(self, guild_id: int, role_id: int) -> bool:
+        """
+        Add a mod role in a guild.
+
+        Parameters
+        ----------
+        guild_id: int
+        role_id: int
+
+        Returns
+        -------
+        bool
+            Whether or not any change was made.
+            This may be useful for settings commands.
+        """
+        return await self._add_role("mod_role", guild_id, role_id)
+
+    async def remove_admin_role(self, guild_id: int, role_id: int) -> bool:
+        """
+        Remove an admin role in a guild.
+
+        Parameters
+        ----------
+        guild_id: int
+        role_id: int
+
+        Returns
+        -------
+        bool
+            Whether or not any change was made.
+            This may be useful for settings commands.
+        """
+        return await self._remove_role("admin_role", guild_id, role_id)
+
+    async def remove_mod_role(self, guild_id: int, role_id: int) -> bool:
+        """
+        Remove a mod role in a guild.
+
+        Parameters
+        ----------
+        guild_id: int
+        role_id: int
+
+        Returns
+        -------
+        bool
+            Whether or not any change was made.
+            This may be useful for settings commands.
+        """
+        return await self._remove_role("mod_role", guild_id, role_id)
@@ -15,6 +15,7 @@ from importlib.machinery import ModuleSpec
 from pathlib import Path
 from typing import (
     Optional,
+    Tuple,
     Union,
     List,
     Iterable,
@@ -51,13 +52,14 @@ from ._settings_caches import (
     WhitelistBlacklistManager,
     DisabledCogCache,
     I18nManager,
+    PrivilegedRoleManager,
 )
 from .utils.predicates import MessagePredicate
 from ._rpc import RPCMixin
 from .tree import RedTree
 from .utils import can_user_send_messages_in, common_filters, AsyncIter
 from .utils.chat_formatting import box, text_to_file
-from .utils._internal_utils import send_to_owners_with_prefix_replaced
+from .utils._internal_utils import FuzzyIndex, send_to_owners_with_prefix_replaced
 
 if TYPE_CHECKING:
     from discord.ext.commands.hybrid import CommandCallback, ContextT, P
@@ -193,6 +195,7 @@ class Red(
         self._ignored_cache = IgnoreManager(self._config)
         self._whiteblacklist_cache = WhitelistBlacklistManager(self._config)
         self._i18n_cache = I18nManager(self._config)
+        self._privileged_role_cache = PrivilegedRoleManager(self._config)
         self._bypass_cooldowns = False
 
         async def prefix_manager(bot, message) -> List[str]:
@@ -239,6 +242,9 @@ class Red(
         self._main_dir = bot_dir
         self._cog_mgr = CogManager()
         self._use_team_features = cli_flags.use_team_features
+        # Lazily built by `fuzzy_command_search` along with the version of the command tree
+        # it was built from, rebuilt whenever commands or subcommands are added or removed.
+        self._fuzzy_command_index: Optional[Tuple[int, FuzzyIndex[commands.Command]]] = None
         super().__init__(*args, help_command=None, tree_cls=RedTree, **kwargs)
         # Do not manually use the help formatter attribute here, see `send_help_for`,
         # for a documented API. The internals of this object are still subject to change.
@@ -1452,7 +1458,7 @@ class Red(
     async def is_admin(self, member: discord.Member) -> bool:
         """Checks if a member is an admin of their guild."""
         try:
-            for snowflake in await self._config.guild(member.guild).admin_role():
+            for snowflake in await self._privileged_role_cache.get_admin_roles(member.guild.id):
                 if member.get_role(snowflake):
                     return True
         except AttributeError:  # someone passed a webhook to this
@@ -1462,10 +1468,10 @@ class Red(
     async def is_mod(self, member: discord.Member) -> bool:
         """Checks if a member is a mod or admin of their guild."""
         try:
-            for snowflake in await self._config.guild(member.guild).admin_role():
+            for snowflake in await self._privileged_role_cache.get_admin_roles(member.guild.id):
                 if member.get_role(snowflake):
                     return True
-            for snowflake in await self._config.guild(member.guild).mod_role():
+            for snowflake in await self._privileged_role_cache.get_mod_roles(member.guild.id):
                 if member.get_role(snowflake):
                     return True
         except AttributeError:  # someone passed a webhook to this
@@ -1477,7 +1483,7 @@ class Red(
         Gets the admin roles for a guild.
         """
         ret: List[discord.Role] = []
-        for snowflake in await self._config.guild(guild).admin_role():
+        for snowflake in await self._privileged_role_cache.get_admin_roles(guild.id):
             r = guild.get_role(snowflake)
             if r:
                 ret.append(r)
@@ -1488,7 +1494,7 @@ class Red(
         Gets the mod roles for a guild.
         """
         ret: List[discord.Role] = []
-        for snowflake in await self._config.guild(guild).mod_role():
+        for snowflake in await self._privileged_role_cache.get_mod_roles(guild.id):
             r = guild.get_role(snowflake)
             if r:
                 ret.append(r)
@@ -1498,13 +1504,13 @@ class Red(
         """
         Gets the admin role ids for a guild id.
         """
-        return await self._config.guild(discord.Object(id=guild_id)).admin_role()
+        return list(await self._privileged_role_cache.get_admin_roles(guild_id))
 
     async def get_mod_role_ids(self, guild_id: int) -> List[int]:
         """
         Gets the mod role ids for a guild id.
         """
-        return await self._config.guild(discord.Object(id=guild_id)).mod_role()
+        return list(await self._privileged_role_cache.get_mod_roles(guild_id))
 
     @overload
     async def get_shared_api_tokens(self, service_name: str = ...) -> Dict[str, str]:
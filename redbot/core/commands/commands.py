@@ -701,6 +701,20 @@ class GroupMixin(discord.ext.commands.GroupMixin):
     This class inherits from :class:`discord.ext.commands.GroupMixin`.
     """
 
+    # bumped whenever a command is added to or removed from the bot or any group,
+    # so that caches built from the command tree can tell they're stale
+    _commands_version: ClassVar[int] = 0
+
+    def add_command(self, command: DPYCommand, /) -> None:
+        super().add_command(command)
+        GroupMixin._commands_version += 1
+
+    def remove_command(self, name: str, /) -> Optional[DPYCommand]:
+        command = super().remove_command(name)
+        if command is not None:
+            GroupMixin._commands_version += 1
+        return command
+
     def command(self, *args, **kwargs):
         """A shortcut decorator that invokes :func:`.command` and adds it to
         the internal command list via :meth:`~.GroupMixin.add_command`.
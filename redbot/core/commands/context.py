@@ -8,7 +8,7 @@ from typing import Iterable, List, Union, Optional, TYPE_CHECKING
 import discord
 from discord.ext.commands import Context as DPYContext
 
-from .requires import PermState
+from .requires import PermState, PrivilegeLevel
 from ..utils import can_user_react_in
 
 if TYPE_CHECKING:
@@ -53,6 +53,8 @@ class Context(DPYContext):
         self.assume_yes = attrs.pop("assume_yes", False)
         super().__init__(**attrs)
         self.permission_state: PermState = PermState.NORMAL
+        # memoized by `PrivilegeLevel.from_ctx()`
+        self._privilege_level: Optional[PrivilegeLevel] = None
 
     async def send(self, content=None, **kwargs):
         """Sends a message to the destination with the content given.
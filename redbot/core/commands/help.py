@@ -29,6 +29,7 @@
 
 import abc
 import asyncio
+import functools
 from collections import namedtuple
 from dataclasses import dataclass, asdict as dc_asdict
 from enum import Enum
@@ -750,8 +751,8 @@ class RedHelpFormatter(HelpFormatterABC):
         fuzzy_commands = await fuzzy_command_search(
             ctx,
             help_for,
-            commands=self.help_filter_func(
-                ctx, ctx.bot.walk_commands(), help_settings=help_settings
+            command_filter=functools.partial(
+                self.help_filter_func, ctx, help_settings=help_settings
             ),
             min_score=75,
         )
@@ -118,7 +118,18 @@ class PrivilegeLevel(enum.IntEnum):
 
     @classmethod
     async def from_ctx(cls, ctx: "Context") -> "PrivilegeLevel":
-        """Get a command author's PrivilegeLevel based on context."""
+        """Get a command author's PrivilegeLevel based on context.
+
+        The result is memoized on the context,
+        as it's checked for every command when verifying requirements or filtering help.
+        """
+        level = getattr(ctx, "_privilege_level", None)
+        if not isinstance(level, cls):
+            level = ctx._privilege_level = await cls._from_ctx(ctx)
+        return level
+
+    @classmethod
+    async def _from_ctx(cls, ctx: "Context") -> "PrivilegeLevel":
         if await ctx.bot.is_owner(ctx.author):
             return cls.BOT_OWNER
         elif ctx.guild is None:
@@ -128,12 +139,12 @@ class PrivilegeLevel(enum.IntEnum):
 
         # The following is simply an optimised way to check if the user has the
         # admin or mod role.
-        guild_settings = ctx.bot._config.guild(ctx.guild)
+        role_cache = ctx.bot._privileged_role_cache
 
-        for snowflake in await guild_settings.admin_role():
+        for snowflake in await role_cache.get_admin_roles(ctx.guild.id):
             if ctx.author.get_role(snowflake):
                 return cls.ADMIN
-        for snowflake in await guild_settings.mod_role():
+        for snowflake in await role_cache.get_mod_roles(ctx.guild.id):
             if ctx.author.get_role(snowflake):
                 return cls.MOD
 
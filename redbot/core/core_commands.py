@@ -3290,10 +3290,8 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         **Arguments:**
         - `<role>` - The role to add as an admin.
         """
-        async with ctx.bot._config.guild(ctx.guild).admin_role() as roles:
-            if role.id in roles:
-                return await ctx.send(_("This role is already an admin role."))
-            roles.append(role.id)
+        if not await ctx.bot._privileged_role_cache.add_admin_role(ctx.guild.id, role.id):
+            return await ctx.send(_("This role is already an admin role."))
         await ctx.send(_("That role is now considered an admin role."))
 
     @_set_roles.command(name="addmodrole")
@@ -3317,10 +3315,8 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         **Arguments:**
         - `<role>` - The role to add as a moderator.
         """
-        async with ctx.bot._config.guild(ctx.guild).mod_role() as roles:
-            if role.id in roles:
-                return await ctx.send(_("This role is already a mod role."))
-            roles.append(role.id)
+        if not await ctx.bot._privileged_role_cache.add_mod_role(ctx.guild.id, role.id):
+            return await ctx.send(_("This role is already a mod role."))
         await ctx.send(_("That role is now considered a mod role."))
 
     @_set_roles.command(
@@ -3339,10 +3335,8 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         **Arguments:**
         - `<role>` - The role to remove from being an admin.
         """
-        async with ctx.bot._config.guild(ctx.guild).admin_role() as roles:
-            if role.id not in roles:
-                return await ctx.send(_("That role was not an admin role to begin with."))
-            roles.remove(role.id)
+        if not await ctx.bot._privileged_role_cache.remove_admin_role(ctx.guild.id, role.id):
+            return await ctx.send(_("That role was not an admin role to begin with."))
         await ctx.send(_("That role is no longer considered an admin role."))
 
     @_set_roles.command(
@@ -3361,10 +3355,8 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         **Arguments:**
         - `<role>` - The role to remove from being a moderator.
         """
-        async with ctx.bot._config.guild(ctx.guild).mod_role() as roles:
-            if role.id not in roles:
-                return await ctx.send(_("That role was not a mod role to begin with."))
-            roles.remove(role.id)
+        if not await ctx.bot._privileged_role_cache.remove_mod_role(ctx.guild.id, role.id):
+            return await ctx.send(_("That role was not a mod role to begin with."))
         await ctx.send(_("That role is no longer considered a mod role."))
 
     # -- End Set Roles Commands -- ###
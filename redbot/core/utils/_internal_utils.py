@@ -17,10 +17,13 @@ from typing import (
     AsyncIterator,
     Awaitable,
     Callable,
+    Dict,
     Generator,
+    Generic,
     Iterable,
     Iterator,
     List,
+    Mapping,
     Optional,
     Union,
     TypeVar,
@@ -49,6 +52,7 @@ main_log = logging.getLogger("red")
 
 __all__ = (
     "safe_delete",
+    "FuzzyIndex",
     "fuzzy_command_search",
     "format_fuzzy_results",
     "create_backup",
@@ -85,11 +89,115 @@ def _fuzzy_log_filter(record):
 logging.getLogger().addFilter(_fuzzy_log_filter)
 
 
+class FuzzyIndex(Generic[_T]):
+    """A precomputed index for fuzzy searching a fixed set of names.
+
+    Names are normalized once with `rapidfuzz.utils.default_process`
+    and bucketed by their character n-grams. A search only scores the names
+    sharing at least one n-gram with the query, unless the query is too short
+    for that pruning to be reliable.
+
+    Parameters
+    ----------
+    choices : Mapping[_T, str]
+        A mapping of the values to return from a search to the names they are matched by.
+    ngram_size : int
+        The length of the n-grams used for pruning candidates. Defaults to 2.
+
+    """
+
+    def __init__(self, choices: Mapping[_T, str], *, ngram_size: int = 2):
+        self._ngram_size = ngram_size
+        self._values: List[_T] = []
+        self._names: List[str] = []
+        self._processed: List[str] = []
+        self._buckets: Dict[str, List[int]] = collections.defaultdict(list)
+        # names which are too short to have any n-grams are always scored
+        self._unbucketed: List[int] = []
+        for idx, (value, name) in enumerate(choices.items()):
+            processed = rapidfuzz.utils.default_process(name)
+            self._values.append(value)
+            self._names.append(name)
+            self._processed.append(processed)
+            ngrams = self._ngrams(processed)
+            if not ngrams:
+                self._unbucketed.append(idx)
+            for ngram in ngrams:
+                self._buckets[ngram].append(idx)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _ngrams(self, text: str) -> set:
+        n = self._ngram_size
+        return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+    def _candidates(self, processed_query: str) -> Iterable[int]:
+        # Very short queries can score well against names
+        # without sharing any n-gram with them.
+        if len(processed_query) <= 2 * self._ngram_size:
+            return range(len(self._values))
+        candidates = set(self._unbucketed)
+        for ngram in self._ngrams(processed_query):
+            candidates.update(self._buckets.get(ngram, ()))
+        return sorted(candidates)
+
+    def search(
+        self,
+        query: str,
+        *,
+        scorer: Callable[..., float] = rapidfuzz.fuzz.WRatio,
+        min_score: float = 0,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[str, float, _T]]:
+        """Search the index for names similar to the query.
+
+        Parameters
+        ----------
+        query : str
+            The text to search for.
+        scorer : Callable[..., float]
+            The rapidfuzz scorer to use. Defaults to `rapidfuzz.fuzz.WRatio`.
+        min_score : float
+            The minimum score for a name to be included in the results.
+        limit : Optional[int]
+            The maximum amount of results to return. If ``None``, all matches are returned.
+
+        Returns
+        -------
+        List[Tuple[str, float, _T]]
+            A list of ``(name, score, value)`` tuples in order of decreasing score.
+
+        """
+        processed_query = rapidfuzz.utils.default_process(query)
+        choices = {idx: self._processed[idx] for idx in self._candidates(processed_query)}
+        extracted = rapidfuzz.process.extract(
+            processed_query,
+            choices,
+            scorer=scorer,
+            processor=None,
+            score_cutoff=min_score,
+            limit=limit,
+        )
+        return [(self._names[idx], score, self._values[idx]) for __, score, idx in extracted]
+
+
+def _get_command_index(bot: Red) -> FuzzyIndex[Command]:
+    version = bot._commands_version
+    if bot._fuzzy_command_index is None or bot._fuzzy_command_index[0] != version:
+        bot._fuzzy_command_index = (
+            version,
+            FuzzyIndex({c: c.qualified_name for c in bot.walk_commands()}),
+        )
+    return bot._fuzzy_command_index[1]
+
+
 async def fuzzy_command_search(
     ctx: Context,
     term: Optional[str] = None,
     *,
     commands: Optional[Union[AsyncIterator[Command], Iterator[Command]]] = None,
+    command_filter: Optional[Callable[[Iterable[Command]], AsyncIterator[Command]]] = None,
     min_score: int = 80,
 ) -> Optional[List[Command]]:
     """Search for commands which are similar in name to the one invoked.
@@ -106,7 +214,10 @@ async def fuzzy_command_search(
         `Context.invoked_with` will be used instead.
     commands : Optional[Union[AsyncIterator[commands.Command], Iterator[commands.Command]]]
         The commands available to choose from when doing a fuzzy match.
-        When omitted, `Bot.walk_commands` will be used instead.
+        When omitted, a cached index of `Bot.walk_commands` will be used instead.
+    command_filter : Optional[Callable[[Iterable[commands.Command]], AsyncIterator[commands.Command]]]
+        A filter applied to the fuzzily matched commands before they're returned.
+        Unlike filtering ``commands`` up front, this only runs for the shortlisted matches.
     min_score : int
         The minimum score for matched commands to reach. Defaults to 80.
 
@@ -136,42 +247,33 @@ async def fuzzy_command_search(
         if alias:
             return None
     customcom_cog = ctx.bot.get_cog("CustomCommands")
-    if customcom_cog is not None:
-        cmd_obj = customcom_cog.commandobj
-
-        try:
-            await cmd_obj.get(ctx.message, term)
-        except:
-            pass
-        else:
+    if customcom_cog is not None and ctx.guild is not None:
+        if customcom_cog.commandobj.is_cached(ctx.guild, term):
             return None
 
     if commands is None:
-        choices = {c: c.qualified_name for c in ctx.bot.walk_commands()}
+        index = _get_command_index(ctx.bot)
     elif isinstance(commands, collections.abc.AsyncIterator):
-        choices = {c: c.qualified_name async for c in commands}
+        index = FuzzyIndex({c: c.qualified_name async for c in commands})
     else:
-        choices = {c: c.qualified_name for c in commands}
+        index = FuzzyIndex({c: c.qualified_name for c in commands})
 
     # Do the scoring. `extracted` is a list of tuples in the form `(cmd_name, score, cmd)`
-    extracted = rapidfuzz.process.extract(
-        term,
-        choices,
-        limit=5,
-        scorer=rapidfuzz.fuzz.QRatio,
-        processor=rapidfuzz.utils.default_process,
-    )
+    extracted = index.search(term, scorer=rapidfuzz.fuzz.QRatio, min_score=min_score)
     if not extracted:
         return None
 
+    shortlist = [command for __, __, command in extracted]
+    if command_filter is not None:
+        shortlist = [command async for command in command_filter(shortlist)]
+
     # Filter through the fuzzy-matched commands.
     matched_commands = []
-    for __, score, command in extracted:
-        if score < min_score:
-            # Since the list is in decreasing order of score, we can exit early.
-            break
+    for command in shortlist:
         if await command.can_see(ctx):
             matched_commands.append(command)
+            if len(matched_commands) == 5:
+                break
 
     return matched_commands
 
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator, Union
+from typing import Any, Generator, Iterable, List, Optional, Sequence, Tuple, Union
 
 import apsw
 
-__all__ = ["APSWConnectionWrapper"]
+__all__ = ["APSWConnectionWrapper", "ThreadedAPSWConnection"]
 
 
 # TODO (mikeshardmind): make this inherit typing_extensions.Protocol
@@ -58,4 +62,223 @@ class APSWConnectionWrapper(apsw.Connection, ContextManagerMixin):
         super().__init__(str(filename), *args, **kwargs)
 
 
-# TODO (mikeshardmind): asyncio friendly ThreadedAPSWConnection class
+_Bindings = Optional[Union[Sequence[Any], dict]]
+
+
+class ThreadedAPSWConnection:
+    """
+    An asyncio friendly wrapper around SQLite connections.
+
+    Statements which modify the database are queued and run by a single writer
+    thread, which commits everything queued at the same time in one transaction.
+    Reads run on a small pool of threads with a connection each,
+    so they are never blocked by the writer when the database is in WAL mode.
+    Nothing runs on the event loop's thread.
+
+    Parameters
+    ----------
+    filename : Union[Path, str]
+        The database to connect to.
+    readers : int
+        The amount of threads (and connections) used for reads.
+    setup_statements : Iterable[str]
+        Statements to run on each new connection, e.g. ``PRAGMA`` statements.
+    statement_cache_size : int
+        The amount of prepared statements kept by each connection.
+    max_batch_size : int
+        The maximum amount of queued writes committed in a single transaction.
+    """
+
+    def __init__(
+        self,
+        filename: Union[Path, str],
+        *,
+        readers: int = 2,
+        setup_statements: Iterable[str] = (),
+        statement_cache_size: int = 100,
+        max_batch_size: int = 500,
+    ):
+        self.filename = str(filename)
+        self._setup_statements = tuple(setup_statements)
+        self._statement_cache_size = statement_cache_size
+        self._max_batch_size = max_batch_size
+        self._writer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="apsw-writer")
+        self._reader_executor = ThreadPoolExecutor(
+            max_workers=readers, thread_name_prefix="apsw-reader"
+        )
+        self._local = threading.local()
+        self._connections: List[APSWConnectionWrapper] = []
+        self._connections_lock = threading.Lock()
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._closed = False
+        #: The amount of transactions committed by the writer.
+        self.commits = 0
+        #: The amount of write statements committed by the writer.
+        self.writes = 0
+
+    def _get_connection(self) -> APSWConnectionWrapper:
+        # only ever called from the executors' threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = APSWConnectionWrapper(
+                self.filename, statementcachesize=self._statement_cache_size
+            )
+            conn.setbusytimeout(5000)
+            for statement in self._setup_statements:
+                conn.cursor().execute(statement)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    async def _run_read(self, func, *args) -> Any:
+        if self._closed:
+            raise RuntimeError("The connection is closed.")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._reader_executor, functools.partial(func, *args))
+
+    def _fetch(self, statement: str, bindings: _Bindings, limit: Optional[int]) -> List[Tuple]:
+        cursor = self._get_connection().cursor()
+        try:
+            cursor.execute(statement, bindings)
+            if limit is None:
+                return cursor.fetchall()
+            rows = []
+            for row in cursor:
+                rows.append(row)
+                if len(rows) >= limit:
+                    break
+            return rows
+        finally:
+            cursor.close()
+
+    async def fetch(self, statement: str, bindings: _Bindings = None) -> List[Tuple]:
+        """
+        Run a query and get all rows it returns.
+
+        This doesn't wait for queued writes,
+        but writes awaited before this was called are always visible.
+        """
+        return await self._run_read(self._fetch, statement, bindings, None)
+
+    async def fetchone(self, statement: str, bindings: _Bindings = None) -> Optional[Tuple]:
+        """Run a query and get the first row it returns, if any."""
+        rows = await self._run_read(self._fetch, statement, bindings, 1)
+        return rows[0] if rows else None
+
+    async def execute(self, statement: str, bindings: _Bindings = None) -> None:
+        """
+        Queue a statement which modifies the database, and wait until it is committed.
+
+        Raises
+        ------
+        apsw.Error
+            The statement failed, other statements committed with it aren't affected.
+        """
+        await self._queue_write([(statement, bindings, False)])
+
+    async def executemany(self, statement: str, sequence: Iterable[_Bindings]) -> None:
+        """
+        Queue a statement to run once for each set of bindings, and wait until it is committed.
+
+        All the executions either succeed or are rolled back together.
+        """
+        await self._queue_write([(statement, list(sequence), True)])
+
+    async def execute_batch(self, operations: Iterable[Tuple[str, Iterable[_Bindings]]]) -> None:
+        """
+        Queue multiple statements to run, each once for each set of its bindings,
+        and wait until they are committed.
+
+        The statements run in the given order, and either all succeed or are rolled back together.
+        """
+        await self._queue_write(
+            [(statement, list(sequence), True) for statement, sequence in operations]
+        )
+
+    async def _queue_write(self, operations: List[Tuple[str, Any, bool]]) -> None:
+        if self._closed:
+            raise RuntimeError("The connection is closed.")
+        if self._write_queue is None:
+            self._write_queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._writer())
+        future = asyncio.get_running_loop().create_future()
+        self._write_queue.put_nowait((operations, future))
+        await future
+
+    async def _writer(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._write_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self._max_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            writes = [item for item in batch if item is not None]
+            if writes:
+                try:
+                    results = await loop.run_in_executor(
+                        self._writer_executor, self._commit, [w[0] for w in writes]
+                    )
+                except Exception as exc:
+                    results = [exc] * len(writes)
+                for (__, future), exc in zip(writes, results):
+                    if future.done():
+                        continue
+                    if exc is None:
+                        future.set_result(None)
+                    else:
+                        future.set_exception(exc)
+            if len(writes) != len(batch):
+                # a None was queued by close()
+                return
+
+    def _commit(self, writes: List[List[Tuple[str, Any, bool]]]) -> List[Optional[Exception]]:
+        conn = self._get_connection()
+        results: List[Optional[Exception]] = []
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE TRANSACTION")
+            try:
+                for operations in writes:
+                    cursor.execute("SAVEPOINT queued_write")
+                    try:
+                        for statement, bindings, many in operations:
+                            if many:
+                                cursor.executemany(statement, bindings)
+                            else:
+                                cursor.execute(statement, bindings)
+                    except Exception as exc:
+                        cursor.execute("ROLLBACK TO queued_write")
+                        results.append(exc)
+                    else:
+                        results.append(None)
+                    cursor.execute("RELEASE queued_write")
+            except Exception:
+                cursor.execute("ROLLBACK TRANSACTION")
+                raise
+            cursor.execute("COMMIT TRANSACTION")
+        finally:
+            cursor.close()
+        self.commits += 1
+        self.writes += sum(1 for result in results if result is None)
+        return results
+
+    async def close(self) -> None:
+        """Commit all queued writes and close the connections."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer_task is not None:
+            self._write_queue.put_nowait(None)
+            await self._writer_task
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._shutdown)
+
+    def _shutdown(self) -> None:
+        self._writer_executor.shutdown(wait=True)
+        self._reader_executor.shutdown(wait=True)
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
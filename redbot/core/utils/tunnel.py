@@ -1,16 +1,124 @@
+import aiohttp
 import asyncio
 import discord
 from datetime import datetime
 from redbot.core.utils.chat_formatting import pagify
 import io
+import tempfile
 import weakref
-from typing import List, Optional, Union
+from typing import IO, List, Optional, Sequence, Union
 from .common_filters import filter_mass_mentions
 
-__all__ = ("Tunnel",)
+__all__ = ("Tunnel", "SpooledAttachments")
 
 _instances = weakref.WeakValueDictionary({})
 
+# the maximum total size of the attachments of a message that will be forwarded
+_MAX_ATTACHMENTS_SIZE = 26214400
+# attachments bigger than this are spooled to a temporary file instead of being kept in memory
+_SPOOL_MAX_MEMORY = 1048576
+_DOWNLOAD_CONCURRENCY = 4
+_DOWNLOAD_CHUNK_SIZE = 65536
+
+
+class SpooledAttachments:
+    """
+    The downloaded attachments of a message, which can be sent any number of times
+
+    Attachments are downloaded once, concurrently, and kept in memory or,
+    above a size threshold, in temporary files until this is closed.
+    It can be used as a context manager to close it automatically.
+
+    Use `Tunnel.spool_attachments` to create an instance of this class.
+    """
+
+    def __init__(self, attachments: Sequence[discord.Attachment], fps: Sequence[IO[bytes]]):
+        self._attachments = list(attachments)
+        self._fps = list(fps)
+
+    def __len__(self) -> int:
+        return len(self._fps)
+
+    def __bool__(self) -> bool:
+        return bool(self._fps)
+
+    def __enter__(self) -> "SpooledAttachments":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def to_files(self) -> List[discord.File]:
+        """
+        Makes a new list of file objects which can be passed to a single send
+
+        Returns
+        -------
+        list of `discord.File`
+            A list of `discord.File` objects
+        """
+        files = []
+        for attachment, fp in zip(self._attachments, self._fps):
+            fp.seek(0)
+            files.append(
+                discord.File(
+                    # on Windows, TemporaryFile returns a wrapper around the actual file
+                    getattr(fp, "file", fp),
+                    filename=attachment.filename,
+                    spoiler=attachment.is_spoiler(),
+                    description=attachment.description,
+                )
+            )
+        return files
+
+    def close(self) -> None:
+        """Releases the memory and temporary files used by the attachments."""
+        for fp in self._fps:
+            fp.close()
+        self._fps.clear()
+        self._attachments.clear()
+
+
+def _spool(fp: IO[bytes], data: bytes) -> IO[bytes]:
+    # moves the data out of memory once it gets bigger than _SPOOL_MAX_MEMORY
+    if isinstance(fp, io.BytesIO) and fp.tell() + len(data) > _SPOOL_MAX_MEMORY:
+        rolled = tempfile.TemporaryFile()
+        try:
+            rolled.write(fp.getbuffer())
+            rolled.write(data)
+        except BaseException:
+            rolled.close()
+            raise
+        fp.close()
+        return rolled
+    fp.write(data)
+    return fp
+
+
+async def _download_attachment(attachment: discord.Attachment, *, use_cached: bool) -> IO[bytes]:
+    # the bot's HTTP session, which is what discord.Attachment.read uses as well
+    session = getattr(getattr(attachment, "_http", None), "_HTTPClient__session", None)
+    fp = io.BytesIO()
+    try:
+        if not isinstance(session, aiohttp.ClientSession) or session.closed:
+            # the download can't be streamed, read it whole instead
+            return _spool(fp, await attachment.read(use_cached=use_cached))
+        url = attachment.proxy_url if use_cached else attachment.url
+        async with session.get(url) as resp:
+            # same errors as discord.py raises when downloading from the CDN
+            if resp.status == 403:
+                raise discord.Forbidden(resp, "cannot retrieve asset")
+            if resp.status == 404:
+                raise discord.NotFound(resp, "asset not found")
+            if resp.status != 200:
+                raise discord.HTTPException(resp, "failed to get asset")
+            async for chunk in resp.content.iter_chunked(_DOWNLOAD_CHUNK_SIZE):
+                fp = _spool(fp, chunk)
+    except BaseException:
+        fp.close()
+        raise
+    return fp
+
 
 class TunnelMeta(type):
     """
@@ -137,6 +245,60 @@ class Tunnel(metaclass=TunnelMeta):
             rets.append(await destination.send(files=files, embed=embed))
         return rets
 
+    @staticmethod
+    async def spool_attachments(
+        m: discord.Message, *, use_cached: bool = False, images_only: bool = False
+    ) -> SpooledAttachments:
+        """
+        downloads the attachments of a message, so that they can be
+        forwarded to any number of destinations without downloading them again.
+        nothing is downloaded if the sum of file sizes
+        is too large for the bot to send
+
+        Parameters
+        ---------
+        m: `discord.Message`
+            A message to get attachments from
+        use_cached: `bool`
+            Whether to use ``proxy_url`` rather than ``url`` when downloading the attachment
+        images_only: `bool`
+            Whether only image attachments should be downloaded
+
+        Returns
+        -------
+        SpooledAttachments
+            The downloaded attachments, which should be closed once they are no longer needed
+
+        """
+        attachments = []
+        if m.attachments and sum(a.size for a in m.attachments) <= _MAX_ATTACHMENTS_SIZE:
+            # if height is None, it's not an image
+            attachments = [a for a in m.attachments if not images_only or a.height is not None]
+        if not attachments:
+            return SpooledAttachments([], [])
+
+        semaphore = asyncio.Semaphore(_DOWNLOAD_CONCURRENCY)
+
+        async def download(attachment: discord.Attachment) -> Optional[IO[bytes]]:
+            async with semaphore:
+                try:
+                    return await _download_attachment(attachment, use_cached=use_cached)
+                except discord.HTTPException as e:
+                    # this is required, because animated webp files aren't cached
+                    if not (e.status == 415 and images_only and use_cached):
+                        raise
+                    return None
+
+        results = await asyncio.gather(*(download(a) for a in attachments), return_exceptions=True)
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            for r in results:
+                if r is not None and not isinstance(r, BaseException):
+                    r.close()
+            raise errors[0]
+        downloaded = [(a, fp) for a, fp in zip(attachments, results) if fp is not None]
+        return SpooledAttachments([a for a, _ in downloaded], [fp for _, fp in downloaded])
+
     @staticmethod
     async def files_from_attach(
         m: discord.Message, *, use_cached: bool = False, images_only: bool = False
@@ -146,6 +308,10 @@ class Tunnel(metaclass=TunnelMeta):
         returns an empty list if none, or if the sum of file sizes
         is too large for the bot to send
 
+        The returned files can only be sent once and their ``fp`` should be closed
+        once they were sent. Use `spool_attachments` to forward attachments
+        to multiple destinations.
+
         Parameters
         ---------
         m: `discord.Message`
@@ -161,22 +327,9 @@ class Tunnel(metaclass=TunnelMeta):
             A list of `discord.File` objects
 
         """
-        files = []
-        max_size = 26214400
-        if m.attachments and sum(a.size for a in m.attachments) <= max_size:
-            for a in m.attachments:
-                if images_only and a.height is None:
-                    # if this is None, it's not an image
-                    continue
-                try:
-                    file = await a.to_file()
-                except discord.HTTPException as e:
-                    # this is required, because animated webp files aren't cached
-                    if not (e.status == 415 and images_only and use_cached):
-                        raise
-                else:
-                    files.append(file)
-        return files
+        spooled = await Tunnel.spool_attachments(m, use_cached=use_cached, images_only=images_only)
+        # the returned files own the spooled data from now on
+        return spooled.to_files()
 
     # Backwards-compatible typo fix (GH-2496)
     files_from_attatch = files_from_attach
@@ -195,7 +348,12 @@ class Tunnel(metaclass=TunnelMeta):
         await asyncio.gather(*tasks, return_exceptions=True)
 
     async def communicate(
-        self, *, message: discord.Message, topic: str = None, skip_message_content: bool = False
+        self,
+        *,
+        message: discord.Message,
+        topic: str = None,
+        skip_message_content: bool = False,
+        attachments: Optional[SpooledAttachments] = None,
     ):
         """
         Forwards a message.
@@ -208,6 +366,9 @@ class Tunnel(metaclass=TunnelMeta):
             A string to prepend
         skip_message_content : `bool`
             If this flag is set, only the topic will be sent
+        attachments : `SpooledAttachments`
+            The already downloaded attachments of the message,
+            if this isn't passed, they are downloaded for this call
 
         Returns
         -------
@@ -236,8 +397,18 @@ class Tunnel(metaclass=TunnelMeta):
         else:
             content = topic
 
+        if message.attachments and attachments is None:
+            # downloaded for this call only, so they're closed once forwarded
+            with await self.spool_attachments(message) as attachments:
+                return await self.communicate(
+                    message=message,
+                    topic=topic,
+                    skip_message_content=skip_message_content,
+                    attachments=attachments,
+                )
+
         if message.attachments:
-            attach = await self.files_from_attach(message)
+            attach = attachments.to_files()
             if not attach:
                 await message.channel.send(
                     "Could not forward attachments. "
@@ -0,0 +1,13 @@
+import pytest
+
+from redbot.cogs.customcom import CustomCommands
+from redbot.core import Config
+
+__all__ = ["customcom"]
+
+
+@pytest.fixture()
+def customcom(config, monkeypatch):
+    with monkeypatch.context() as m:
+        m.setattr(Config, "get_conf", lambda *args, **kwargs: config)
+        return CustomCommands(None)
@@ -0,0 +1,13 @@
+import pytest
+
+from redbot.cogs.reports import Reports
+from redbot.core import Config
+
+__all__ = ["reports"]
+
+
+@pytest.fixture()
+def reports(config, monkeypatch):
+    with monkeypatch.context() as m:
+        m.setattr(Config, "get_conf", lambda *args, **kwargs: config)
+        return Reports(None)
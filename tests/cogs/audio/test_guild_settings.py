@@ -0,0 +1,58 @@
+import dataclasses
+
+import pytest
+
+from redbot.cogs.audio.guild_settings import GuildSettings, GuildSettingsCache
+
+
+def _register_settings(config):
+    config.register_guild(
+        **{
+            **{field.name: False for field in dataclasses.fields(GuildSettings)},
+            "autoplaylist": {"enabled": False},
+            "url_keyword_blacklist": [],
+            "url_keyword_whitelist": [],
+        },
+        currently_auto_playing_in=None,
+    )
+
+
+async def test_guild_settings_cache(config):
+    _register_settings(config)
+    settings = GuildSettingsCache(config)
+
+    first = await settings.get(1)
+    assert first.shuffle is False
+    await config.guild_from_id(1).shuffle.set(True)
+    # snapshots are kept until invalidated
+    assert await settings.get(1) is first
+    settings.invalidate(1)
+    assert (await settings.get(1)).shuffle is True
+
+    second = await settings.get(2)
+    settings.invalidate()
+    assert await settings.get(2) is not second
+
+
+async def test_guild_settings_cache_writes(config):
+    _register_settings(config)
+    settings = GuildSettingsCache(config)
+    await settings.get(1)
+
+    # writing through the cache drops the guild's snapshot
+    await settings.set(1, shuffle=True, repeat=True)
+    snapshot = await settings.get(1)
+    assert (snapshot.shuffle, snapshot.repeat) == (True, True)
+
+    async with settings.edit(1, "url_keyword_whitelist") as whitelist:
+        whitelist.append("youtube")
+    snapshot = await settings.get(1)
+    assert snapshot.url_keyword_whitelist == ("youtube",)
+    # the snapshot's containers can't be changed by its users
+    with pytest.raises(TypeError):
+        snapshot.autoplaylist["enabled"] = True
+
+    await settings.clear(1, "shuffle", "url_keyword_whitelist")
+    snapshot = await settings.get(1)
+    assert snapshot.shuffle is False
+    assert snapshot.url_keyword_whitelist == ()
@@ -0,0 +1,63 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from redbot.cogs.audio.apis.http_client import AudioHTTPClient
+
+
+@pytest.fixture()
+async def server():
+    requests = []
+
+    async def lookup(request):
+        requests.append(request.query.get("query"))
+        await asyncio.sleep(0.05)
+        return web.json_response({"query": request.query.get("query")})
+
+    async def limited(request):
+        requests.append("limited")
+        return web.json_response({}, status=429, headers={"Retry-After": "0.2"})
+
+    app = web.Application()
+    app.router.add_get("/lookup", lookup)
+    app.router.add_get("/limited", limited)
+    server = TestServer(app)
+    await server.start_server()
+    server.requests = requests
+    yield server
+    await server.close()
+
+
+@pytest.fixture()
+async def http_client():
+    async with aiohttp.ClientSession() as session:
+        yield AudioHTTPClient(session)
+
+
+async def test_get_json_coalesces(server, http_client):
+    url = str(server.make_url("/lookup"))
+    results = await asyncio.gather(
+        *(http_client.get_json("test", url, params={"query": q}) for q in "aaaab")
+    )
+    assert [r["query"] for r in results] == list("aaaab")
+    assert sorted(server.requests) == ["a", "b"]
+    assert http_client.stats[f"test GET {url}"].requests == 2
+
+    # once done, the next lookup makes a new request
+    await http_client.get_json("test", url, params={"query": "a"})
+    assert len(server.requests) == 3
+
+
+async def test_rate_limited_api_is_held_back(server, http_client):
+    url = str(server.make_url("/limited"))
+    with pytest.raises(aiohttp.ClientResponseError):
+        await http_client.get_json("test", url)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    with pytest.raises(aiohttp.ClientResponseError):
+        await http_client.get_json("test", url)
+    assert loop.time() - start >= 0.15
+    assert server.requests == ["limited", "limited"]
@@ -0,0 +1,41 @@
+import asyncio
+import time
+
+from redbot.cogs.audio.idle_timers import IdleTimers
+
+
+async def test_idle_timers():
+    fired = []
+
+    async def callback(guild_id, kind):
+        fired.append((guild_id, kind))
+
+    timers = IdleTimers(callback)
+    task = asyncio.create_task(timers.run())
+    try:
+        now = time.monotonic()
+        timers.arm(1, "disconnect", now + 0.05)
+        timers.arm(2, "pause", now + 0.02)
+        timers.arm(3, "pause", now + 0.01)
+        timers.disarm(3)
+        # re-arming replaces the deadline
+        timers.arm(2, "pause", now + 0.5)
+        timers.arm(2, "pause", now + 0.03)
+        assert timers.get_deadline(2, "pause") == now + 0.03
+        await asyncio.sleep(0.1)
+        assert fired == [(2, "pause"), (1, "disconnect")]
+        assert timers.get_deadline(1, "disconnect") is None
+
+        # an earlier deadline wakes up the waiting task
+        timers.arm(4, "disconnect", time.monotonic() + 3600)
+        timers.arm(5, "pause", time.monotonic())
+        await asyncio.sleep(0.01)
+        assert fired[-1] == (5, "pause")
+        assert timers.get_deadline(4, "disconnect") is not None
+
+        # stale heap entries are compacted
+        for n in range(1000):
+            timers.arm(6, "pause", time.monotonic() + 3600 + n)
+        assert len(timers._heap) < 100
+    finally:
+        task.cancel()
@@ -0,0 +1,98 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from redbot.cogs.audio.apis.local_db import LavalinkHotCache, LocalCacheWrapper
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
+
+
+async def _cache_age():
+    return 365
+
+
+@pytest.fixture()
+async def local_cache(tmp_path):
+    db = ThreadedAPSWConnection(tmp_path / "Audio.db")
+    cache = LocalCacheWrapper(None, SimpleNamespace(cache_age=_cache_age), db, None)
+    await cache.lavalink.init()
+    yield cache
+    await cache.lavalink_writes.close()
+    await cache.lavalink.close()
+
+
+def _entry(query, last_fetched=1):
+    return {
+        "query": query,
+        "data": json.dumps({"loadType": "TRACK_LOADED", "query": query}),
+        "last_updated": 2000000000,
+        "last_fetched": last_fetched,
+    }
+
+
+async def test_lavalink_write_buffer(local_cache):
+    writes = local_cache.lavalink_writes
+    writes.upsert([_entry("a"), _entry("b")])
+    writes.upsert([_entry("a")])
+    writes.touch("b")
+    assert writes.pending == 2
+    assert await local_cache.lavalink.fetch_one({"query": "a"}) == (None, None)
+
+    commits = local_cache.database.commits
+    await writes.flush()
+    assert local_cache.database.commits - commits == 1
+    assert writes.pending == 0
+    assert writes.flushes == 1 and writes.flushed_rows == 2
+    assert writes.last_flush_latency > 0
+    data, _ = await local_cache.lavalink.fetch_one({"query": "a"})
+    assert data["query"] == "a"
+
+    writes.touch("a")
+    writes.touch("a")
+    assert writes.pending == 1
+    await writes.flush()
+    rows = await local_cache.database.fetch("SELECT query, last_fetched FROM lavalink")
+    assert all(last_fetched > 1 for _, last_fetched in rows)
+
+
+async def test_lavalink_write_buffer_flushes_when_full(local_cache):
+    writes = local_cache.lavalink_writes
+    writes.max_pending = 3
+    writes.upsert([_entry(str(i)) for i in range(3)])
+    await writes._flush_task
+    assert writes.pending == 0
+    assert len(await local_cache.lavalink.fetch_all({"day": 0})) == 3
+
+
+def test_lavalink_hot_cache():
+    hot = LavalinkHotCache(max_size=100)
+    payload = {"loadType": "TRACK_LOADED", "tracks": [{"track": "x", "info": {"title": "t"}}]}
+    hot.put("a", payload, last_updated=10, size=40)
+    hot.put("b", payload, last_updated=10, size=40)
+
+    data = hot.get("a", maxage=5)
+    assert data == payload
+    # users can't modify the cached entry
+    data["tracks"][0]["info"]["timestamp"] = 0
+    assert "timestamp" not in hot.get("a", maxage=5)["tracks"][0]["info"]
+
+    # "b" is the least recently used entry
+    hot.put("c", payload, last_updated=10, size=40)
+    assert hot.get("b", maxage=5) is None
+    assert len(hot) == 2 and hot.size == 80 and hot.evictions == 1
+
+    # expired entries are dropped
+    assert hot.get("c", maxage=10) is None
+    assert len(hot) == 1
+    assert hot.hits == 2 and hot.misses == 2 and hot.hit_ratio == 0.5
+
+    hot.put("big", payload, last_updated=10, size=101)
+    assert hot.get("big", maxage=5) is None
+
+
+async def test_lavalink_fetch_entry_size(local_cache):
+    entry = _entry("a")
+    await local_cache.lavalink.insert([entry])
+    result = await local_cache.lavalink.fetch_entry({"query": "a"})
+    assert result.data_size == len(entry["data"])
+    assert result.last_updated == entry["last_updated"]
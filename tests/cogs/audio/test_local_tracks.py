@@ -0,0 +1,86 @@
+import os
+
+import pytest
+
+from redbot.cogs.audio.apis.local_tracks import LocalTrackIndex
+from redbot.cogs.audio.audio_dataclasses import LocalPath
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
+
+FILES = (
+    "root.mp3",
+    "Album/01 - first.mp3",
+    "Album/02 - second.flac",
+    "Album/cover.jpg",
+    "Album/.hidden.mp3",
+    "Album/Disc 2/01 - third.ogg",
+    "another/song.m4a",
+    "empty/.keep",
+)
+
+
+@pytest.fixture()
+async def local_index(tmp_path):
+    for name in FILES:
+        path = tmp_path / "localtracks" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    db = ThreadedAPSWConnection(tmp_path / "Audio.db")
+    index = LocalTrackIndex(db, refresh_interval=0)
+    await index.init()
+    yield index
+    await db.close()
+
+
+def _names(items):
+    return [item.to_string_user() for item in items]
+
+
+async def test_local_index_matches_glob(local_index, tmp_path):
+    root = LocalPath(None, tmp_path)
+    album = LocalPath.joinpath(tmp_path, "Album")
+    for local_path in (root, album):
+        assert _names(await local_index.tracks_in_tree(local_path)) == _names(
+            await local_path.tracks_in_tree()
+        )
+        assert _names(await local_index.tracks_in_folder(local_path)) == _names(
+            await local_path.tracks_in_folder()
+        )
+        assert _names(await local_index.subfolders_in_tree(local_path)) == _names(
+            await local_path.subfolders_in_tree()
+        )
+        assert _names(await local_index.subfolders(local_path)) == _names(
+            await local_path.subfolders()
+        )
+    assert len(await local_index.tracks_in_tree(root)) == 4
+
+
+async def test_local_index_refreshes_incrementally(local_index, tmp_path, monkeypatch):
+    root = LocalPath(None, tmp_path)
+    await local_index.tracks_in_tree(root)
+
+    scanned = []
+    real_scandir = os.scandir
+
+    def scandir(path):
+        scanned.append(os.path.basename(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    await local_index.refresh(root.localtrack_folder)
+    assert scanned == []
+
+    (tmp_path / "localtracks" / "Album" / "03 - fourth.mp3").touch()
+    (tmp_path / "localtracks" / "Album" / "04 - fifth.FLAC").touch()
+    os.rename(tmp_path / "localtracks" / "another", tmp_path / "localtracks" / "renamed")
+    tracks = _names(await local_index.tracks_in_tree(root))
+    assert sorted(scanned) == ["Album", "localtracks", "renamed"]
+    assert f"Album{os.sep}03 - fourth.mp3" in tracks
+    assert f"Album{os.sep}04 - fifth.FLAC" in tracks
+    assert f"renamed{os.sep}song.m4a" in tracks
+    assert f"another{os.sep}song.m4a" not in tracks
+
+    # the index persists across instances
+    index = LocalTrackIndex(local_index.database)
+    scanned.clear()
+    assert _names(await index.tracks_in_tree(root)) == tracks
+    assert scanned == []
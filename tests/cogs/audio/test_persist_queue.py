@@ -0,0 +1,16 @@
+from redbot.cogs.audio.apis.persist_queue_wrapper import QueueInterface
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
+
+
+async def test_failed_writes_are_logged(tmp_path, caplog):
+    db = ThreadedAPSWConnection(tmp_path / "Audio.db")
+    # the queue table doesn't exist, so every write fails
+    queue = QueueInterface(None, None, db, None)
+    try:
+        await queue.played(guild_id=1, track_id="track")
+        await queue.drop(1)
+        await queue.delete_scheduled()
+    finally:
+        await db.close()
+
+    assert [r.levelname for r in caplog.records] == ["WARNING"] * 3
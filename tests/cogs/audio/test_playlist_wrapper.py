@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from redbot.cogs.audio.apis.local_db import _SCHEMA_VERSION
+from redbot.cogs.audio.apis.playlist_wrapper import PlaylistWrapper
+from redbot.cogs.audio.sql_statements import PLAYLIST_CREATE_TABLE
+from redbot.cogs.audio.utils import PlaylistScope
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
+
+GUILD = PlaylistScope.GUILD.value
+
+
+@pytest.fixture()
+async def db(tmp_path):
+    db = ThreadedAPSWConnection(tmp_path / "Audio.db")
+    yield db
+    await db.close()
+
+
+def _track(n):
+    return {"track": f"encoded{n}", "info": {"title": f"Track {n}", "uri": f"https://t/{n}"}}
+
+
+async def test_playlist_tracks_migration(db):
+    await db.execute(PLAYLIST_CREATE_TABLE)
+    await db.executemany(
+        "INSERT INTO playlists (scope_type, playlist_id, playlist_name, scope_id, author_id,"
+        " playlist_url, tracks) VALUES (2, :id, :name, 10, 1, NULL, :tracks)",
+        [
+            {"id": 1, "name": "first", "tracks": json.dumps([_track(n) for n in range(3)])},
+            {"id": 2, "name": "second", "tracks": json.dumps([])},
+        ],
+    )
+    # the local cache may have bumped the schema version first
+    await db.execute(f"pragma user_version={_SCHEMA_VERSION};")
+
+    playlists = PlaylistWrapper(None, None, db)
+    await playlists.init()
+
+    assert await db.fetch("SELECT tracks FROM playlists WHERE tracks IS NOT NULL") == []
+    playlist = await playlists.fetch(GUILD, 1, 10)
+    assert playlist.tracks == [_track(n) for n in range(3)]
+    assert playlist.track_count == 3
+    listed = {p.playlist_name: p for p in await playlists.fetch_all(GUILD, 10)}
+    assert listed["first"].tracks is None
+    assert listed["first"].track_count == 3
+    assert listed["second"].track_count == 0
+
+    # running it again doesn't duplicate anything
+    await playlists.init()
+    assert (await playlists.fetch(GUILD, 1, 10)).track_count == 3
+
+
+async def test_playlist_tracks_storage(db):
+    playlists = PlaylistWrapper(None, None, db)
+    await playlists.init()
+    await playlists.upsert(GUILD, 1, "name", 10, 1, None, [_track(n) for n in range(5)])
+    await playlists.append_tracks(GUILD, 1, 10, [_track(5), _track(6)])
+
+    assert await playlists.fetch_tracks(GUILD, 1, 10, start=4, stop=6) == [_track(4), _track(5)]
+    tracks = [track async for track in playlists.iter_tracks(GUILD, 1, 10, page_size=3)]
+    assert tracks == [_track(n) for n in range(7)]
+
+    # renaming doesn't touch the tracks, saving them replaces them
+    await playlists.upsert(GUILD, 1, "renamed", 10, 1, None, None)
+    playlist = await playlists.fetch(GUILD, 1, 10)
+    assert (playlist.playlist_name, playlist.track_count) == ("renamed", 7)
+    await playlists.upsert(GUILD, 1, "renamed", 10, 1, None, [_track(1)])
+    await playlists.append_tracks(GUILD, 1, 10, [_track(2)])
+    assert (await playlists.fetch(GUILD, 1, 10)).tracks == [_track(1), _track(2)]
+
+    await playlists.delete(GUILD, 1, 10)
+    await playlists.delete_scheduled()
+    assert await playlists.fetch(GUILD, 1, 10) is None
+    assert await db.fetch("SELECT * FROM playlist_tracks") == []
+
+
+async def test_playlist_failed_writes_are_logged(db, caplog):
+    # the tables don't exist, so every write fails
+    playlists = PlaylistWrapper(None, None, db)
+    await playlists.upsert(GUILD, 1, "name", 10, 1, None, [_track(0)])
+    await playlists.append_tracks(GUILD, 1, 10, [_track(1)])
+
+    assert [r.levelname for r in caplog.records] == ["WARNING", "WARNING"]
@@ -0,0 +1,45 @@
+import random
+from types import SimpleNamespace
+
+from redbot.cogs.audio.queue_stats import QueueStats, TrackedQueue, get_queue_stats
+
+
+def _track(length, requester, is_stream=False):
+    return SimpleNamespace(
+        length=length, requester=SimpleNamespace(id=requester), is_stream=is_stream
+    )
+
+
+def _expected(queue):
+    stats = QueueStats()
+    stats.add(queue)
+    return stats.duration, stats.streams, dict(stats.requesters)
+
+
+def test_tracked_queue_stats():
+    player = SimpleNamespace(queue=[_track(1000, 1), _track(0, 2, is_stream=True)])
+    stats = get_queue_stats(player)
+    assert isinstance(player.queue, TrackedQueue)
+    assert (stats.duration, stats.streams, dict(stats.requesters)) == (1000, 1, {1: 1, 2: 1})
+
+    queue = player.queue
+    queue.append(_track(2000, 1))
+    queue.extend([_track(3000, 3), _track(4000, 2)])
+    queue.insert(0, _track(500, 3))
+    queue += [_track(100, 4)]
+    queue.pop(0)
+    queue.remove(queue[2])
+    del queue[1:3]
+    queue[0] = _track(7000, 5)
+    queue[1:2] = [_track(10, 6), _track(20, 6)]
+    stats = get_queue_stats(player)
+    assert (stats.duration, stats.streams, dict(stats.requesters)) == _expected(queue)
+
+    queue.clear()
+    assert get_queue_stats(player).duration == 0
+    assert not get_queue_stats(player).requesters
+
+    # a replaced queue is picked up on the next call
+    player.queue = [_track(random.randint(1, 100), n % 3) for n in range(20)]
+    stats = get_queue_stats(player)
+    assert (stats.duration, stats.streams, dict(stats.requesters)) == _expected(player.queue)
@@ -1,6 +1,6 @@
 import asyncio
+import json
 import pathlib
-from collections import namedtuple
 from typing import Any, NamedTuple
 from pathlib import Path
 
@@ -156,29 +156,6 @@ async def test_get_file_update_statuses(mocker, repo):
     }
 
 
-async def test_is_module_modified(mocker, repo):
-    old_rev = "c950fc05a540dd76b944719c2a3302da2e2f3090"
-    new_rev = "fb99eb7d2d5bed514efc98fe6686b368f8425745"
-    FakeInstallable = namedtuple("Installable", "name commit")
-    module = FakeInstallable("mycog", new_rev)
-    m = mocker.patch.object(
-        repo,
-        "_get_file_update_statuses",
-        autospec=True,
-        return_value={
-            "added_file.txt": "A",
-            "mycog/__init__.py": "M",
-            "sample_file1.txt": "D",
-            "sample_file2.txt": "D",
-            "sample_file3.txt": "A",
-        },
-    )
-    ret = await repo._is_module_modified(module, old_rev)
-    m.assert_called_once_with(old_rev, new_rev)
-
-    assert ret is True
-
-
 async def test_get_full_sha1_success(mocker, repo):
     commit = "c950fc05a540dd76b944719c2a3302da2e2f3090"
     m = _mock_run(mocker, repo, 0, commit.encode())
@@ -238,6 +215,46 @@ def test_update_available_modules(repo):
     )
 
 
+def test_update_available_modules_index(mocker, repo):
+    module = repo.folder_path / "mycog" / "__init__.py"
+    module.parent.mkdir(parents=True)
+    module.touch()
+    old_commit = repo.commit
+    modules = repo._update_available_modules()
+
+    repo.commit = "0123456789abcde0123456789abcde0123456789"
+    assert repo._update_available_modules() is not modules
+
+    # scanned commits are taken from the index, without reading the repo folder
+    iter_modules = mocker.patch("pkgutil.iter_modules", autospec=True)
+    repo.commit = old_commit
+    assert repo._update_available_modules() is modules
+    assert repo.available_modules is modules
+    iter_modules.assert_not_called()
+
+
+def test_update_available_modules_index_persisted(mocker, repo):
+    (repo.folder_path / ".git").mkdir()
+    module = repo.folder_path / "mycog" / "__init__.py"
+    module.parent.mkdir(parents=True)
+    module.touch()
+    (module.parent / "info.json").write_text(json.dumps({"short": "Cached"}))
+    repo._update_available_modules()
+
+    # a new Repo object, as after a restart, reuses the saved index
+    iter_modules = mocker.patch("pkgutil.iter_modules", autospec=True)
+    new_repo = Repo(
+        url=repo.url,
+        name=repo.name,
+        branch=repo.branch,
+        commit=repo.commit,
+        folder_path=repo.folder_path,
+    )
+    (module,) = new_repo._update_available_modules()
+    iter_modules.assert_not_called()
+    assert (module.name, module.commit, module.short) == ("mycog", repo.commit, "Cached")
+
+
 async def test_checkout(mocker, repo):
     commit = "c950fc05a540dd76b944719c2a3302da2e2f3090"
     m = _mock_run(mocker, repo, 0)
@@ -352,6 +369,27 @@ async def test_lib_install_requirements(monkeypatch, library_installable, repo,
     assert len(failed) == 0
 
 
+async def test_install_raw_requirements_batch(mocker, repo, tmp_path):
+    def fake_run(args):
+        return FakeCompletedProcess(1 if any(arg.startswith("broken") for arg in args) else 0)
+
+    m = mocker.patch.object(repo, "_run", autospec=True, side_effect=fake_run)
+    reqs = ["a", "b", "broken1", "c", "d", "e", "broken2", "f"]
+
+    failed = await repo.install_raw_requirements_batch(reqs, tmp_path, cache_dir=tmp_path / "c")
+
+    assert failed == ("broken1", "broken2")
+    # the first invocation installs everything at once, using the cache
+    first_call = m.call_args_list[0].args[0]
+    assert first_call[first_call.index("--cache-dir") + 1] == str(tmp_path / "c")
+    assert set(reqs) <= set(first_call)
+    assert m.call_count < 2 * len(reqs)
+
+    m.reset_mock()
+    assert await repo.install_raw_requirements_batch(reqs[:2], tmp_path) == ()
+    m.assert_called_once()
+
+
 async def test_remove_repo(monkeypatch, repo_manager):
     monkeypatch.setattr("redbot.cogs.downloader.repo_manager.Repo._run", fake_run_noprint)
     monkeypatch.setattr(
@@ -3,7 +3,7 @@ import subprocess as sp
 
 import pytest
 
-from redbot.cogs.downloader.repo_manager import ProcessFormatter, Repo
+from redbot.cogs.downloader.repo_manager import ProcessFormatter, Repo, RepoManager
 from redbot.pytest.downloader import (
     GIT_VERSION,
     cloned_git_repo,
@@ -454,76 +454,136 @@ async def test_git_is_ancestor_invalid_commit(git_repo):
     )
 
 
-async def test_git_check_if_module_exists_true(git_repo):
+async def test_git_get_last_module_deletions(git_repo):
     p = await git_repo._run(
         ProcessFormatter().format(
-            git_repo.GIT_CHECK_IF_MODULE_EXISTS,
+            git_repo.GIT_GET_LAST_MODULE_DELETIONS,
             path=git_repo.folder_path,
-            rev="fb99eb7d2d5bed514efc98fe6686b368f8425745",
-            module_name="mycog",
+            descendant_rev="2db662c1d341b1db7d225ccc1af4019ba5228c70",
+            module_paths=["mycog/__init__.py"],
         )
     )
     assert p.returncode == 0
+    # the command gives the parent of the commit that deleted the module
+    assert p.stdout.decode().splitlines() == [
+        "fb99eb7d2d5bed514efc98fe6686b368f8425745",
+        "mycog/__init__.py",
+    ]
 
 
-@pytest.mark.skipif(
-    GIT_VERSION < (2, 36), reason="This is test for output from Git 2.36 and newer."
-)
-async def test_git_check_if_module_exists_false(git_repo):
+async def test_git_get_last_module_deletions_non_existent(git_repo):
     p = await git_repo._run(
         ProcessFormatter().format(
-            git_repo.GIT_CHECK_IF_MODULE_EXISTS,
+            git_repo.GIT_GET_LAST_MODULE_DELETIONS,
             path=git_repo.folder_path,
-            rev="a7120330cc179396914e0d6af80cfa282adc124b",
-            module_name="mycog",
+            descendant_rev="c950fc05a540dd76b944719c2a3302da2e2f3090",
+            module_paths=["mycog/__init__.py"],
         )
     )
-    assert p.returncode == 128
-    assert p.stderr.decode().strip() == (
-        "fatal: path 'mycog/__init__.py' does not exist in 'a7120330cc179396914e0d6af80cfa282adc124b'"
-    )
+    assert p.returncode == 0
+    assert p.stdout.decode().strip() == ""
 
 
-@pytest.mark.skipif(
-    GIT_VERSION >= (2, 36), reason="This is test for output from Git older than 2.31."
-)
-async def test_git_check_if_module_exists_false_pre_2_36(git_repo):
+async def test_git_cat_file_batch(git_repo):
     p = await git_repo._run(
-        ProcessFormatter().format(
-            git_repo.GIT_CHECK_IF_MODULE_EXISTS,
-            path=git_repo.folder_path,
-            rev="a7120330cc179396914e0d6af80cfa282adc124b",
-            module_name="mycog",
-        )
+        ProcessFormatter().format(git_repo.GIT_CAT_FILE_BATCH, path=git_repo.folder_path),
+        input=(
+            "fb99eb7d2d5bed514efc98fe6686b368f8425745:mycog/__init__.py\n"
+            "a7120330cc179396914e0d6af80cfa282adc124b:mycog/__init__.py\n"
+        ).encode(),
     )
-    assert p.returncode == 128
-    assert p.stderr.decode().strip() == (
-        "fatal: Not a valid object name a7120330cc179396914e0d6af80cfa282adc124b:mycog/__init__.py"
-    )
-
-
-async def test_git_find_last_occurrence_existent(git_repo):
-    p = await git_repo._run(
-        ProcessFormatter().format(
-            git_repo.GIT_GET_LAST_MODULE_OCCURRENCE_COMMIT,
-            path=git_repo.folder_path,
-            descendant_rev="2db662c1d341b1db7d225ccc1af4019ba5228c70",
-            module_name="mycog",
+    assert p.returncode == 0
+    assert p.stdout.decode() == (
+        "5ed17bf7914989db85f2e66045e62b35eed10f3b blob 42\n"
+        'def setup(bot):\n    print("Hello world!")\n'
+        "\n"
+        "a7120330cc179396914e0d6af80cfa282adc124b:mycog/__init__.py missing\n"
+    )
+
+
+async def test_update_repos(git_repo, tmp_path):
+    repos = []
+    for name in ("first", "second", "broken"):
+        repo_path = tmp_path / name
+        sp.run(("git", "clone", str(git_repo.folder_path), str(repo_path)), check=True)
+        repos.append(
+            Repo(
+                name=name,
+                url=str(git_repo.folder_path),
+                branch=git_repo.branch,
+                commit="",
+                folder_path=repo_path,
+            )
         )
+    sp.run(
+        (
+            "git",
+            "-C",
+            str(tmp_path / "broken"),
+            "remote",
+            "set-url",
+            "origin",
+            str(tmp_path / "x"),
+        ),
+        check=True,
     )
-    assert p.returncode == 0
-    # the command gives a commit after last occurrence
-    assert p.stdout.decode().strip() == "a7120330cc179396914e0d6af80cfa282adc124b"
+    sp.run(
+        ("git", "-C", str(git_repo.folder_path), "commit", "--allow-empty", "-m", "test commit"),
+        check=True,
+    )
+    new_commit = (
+        sp.run(("git", "-C", str(git_repo.folder_path), "rev-parse", "HEAD"), stdout=sp.PIPE)
+        .stdout.decode()
+        .strip()
+    )
+    repo_manager = RepoManager()
+    repo_manager._repos = {repo.name: repo for repo in repos}
+
+    result = await repo_manager.update_repos()
+    updated, failed = result
+
+    assert {repo.name: new for repo, (old, new) in updated.items()} == {
+        "first": new_commit,
+        "second": new_commit,
+    }
+    assert failed == ["broken"]
+    assert result.timings.keys() == {"first", "second", "broken"}
+
+
+@pytest.mark.parametrize(
+    "old_rev,new_rev,expected",
+    [
+        # modified module
+        (
+            "c950fc05a540dd76b944719c2a3302da2e2f3090",
+            "fb99eb7d2d5bed514efc98fe6686b368f8425745",
+            {"mycog": "fb99eb7d2d5bed514efc98fe6686b368f8425745"},
+        ),
+        # modified and then removed module
+        (
+            "c950fc05a540dd76b944719c2a3302da2e2f3090",
+            "2db662c1d341b1db7d225ccc1af4019ba5228c70",
+            {"mycog": "fb99eb7d2d5bed514efc98fe6686b368f8425745"},
+        ),
+        # removed module without modifications
+        (
+            "fb99eb7d2d5bed514efc98fe6686b368f8425745",
+            "2db662c1d341b1db7d225ccc1af4019ba5228c70",
+            {},
+        ),
+    ],
+)
+async def test_get_modified_modules(mocker, git_repo, old_rev, new_rev, expected):
+    checkout = mocker.spy(git_repo, "_checkout")
+    modules = await git_repo.get_modified_modules(old_rev, new_rev)
+    assert {module.name: module.commit for module in modules} == expected
+    checkout.assert_not_called()
 
 
-async def test_git_find_last_occurrence_non_existent(git_repo):
-    p = await git_repo._run(
-        ProcessFormatter().format(
-            git_repo.GIT_GET_LAST_MODULE_OCCURRENCE_COMMIT,
-            path=git_repo.folder_path,
-            descendant_rev="c950fc05a540dd76b944719c2a3302da2e2f3090",
-            module_name="mycog",
-        )
+async def test_get_last_module_occurrence(git_repo):
+    module = await git_repo.get_last_module_occurrence(
+        "mycog", "2db662c1d341b1db7d225ccc1af4019ba5228c70"
     )
-    assert p.returncode == 0
-    assert p.stdout.decode().strip() == ""
+    assert module.commit == "fb99eb7d2d5bed514efc98fe6686b368f8425745"
+    assert module.repo is git_repo
+    assert await git_repo.get_last_module_occurrence("nonexistent", "2db662c") is None
@@ -56,3 +56,34 @@ def test_serialization(installed_cog):
     cog_name = data["module_name"]
 
     assert cog_name == "test_installed_cog"
+
+
+async def test_copy_to(installable, tmp_path, mocker):
+    target_dir = tmp_path / "cogs"
+    target_dir.mkdir()
+    source = installable._location
+    (source / "data").mkdir()
+    (source / "data" / "asset.txt").write_text("asset")
+    (source / "__init__.py").write_text("old")
+    assert await installable.copy_to(target_dir)
+    installed = target_dir / "test_cog"
+    assert (installed / "__init__.py").read_text() == "old"
+    (installed / "extra.txt").write_text("extra")
+    asset_inode = (installed / "data" / "asset.txt").stat().st_ino
+
+    (source / "__init__.py").write_text("new")
+    assert await installable.copy_to(target_dir)
+    assert (installed / "__init__.py").read_text() == "new"
+    assert (installed / "extra.txt").read_text() == "extra"
+    # unchanged file is linked from the previous installation
+    assert (installed / "data" / "asset.txt").stat().st_ino == asset_inode
+    assert sorted(p.name for p in target_dir.iterdir()) == ["test_cog"]
+
+    # failed copy leaves the previous installation untouched
+    (source / "__init__.py").write_text("newer")
+    mocker.patch(
+        "redbot.cogs.downloader.installable._clone_file", autospec=True, side_effect=OSError
+    )
+    assert not await installable.copy_to(target_dir)
+    assert (installed / "__init__.py").read_text() == "new"
+    assert sorted(p.name for p in target_dir.iterdir()) == ["test_cog"]
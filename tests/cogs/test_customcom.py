@@ -0,0 +1,54 @@
+from collections import namedtuple
+
+import pytest
+
+from redbot.cogs.customcom.customcom import CompiledResponse, NotFound
+from redbot.pytest.customcom import *
+
+
+class _FakeContext:
+    def __init__(self, message):
+        self.message = message
+        self.sent = []
+
+    async def send(self, content):
+        self.sent.append(content)
+
+
+def test_compiled_response_segments():
+    response = CompiledResponse("Hi {author}, {1} and {2.name} in {channel.name}!")
+    assert [segment[0] for segment in response.segments] == [0, 1, 0, 2, 0, 2, 0, 1, 0]
+    assert response.segments[3] == (2, "1", 0, "")
+    assert response.segments[5] == (2, "2.name", 1, ".name")
+
+
+def test_compiled_response_params_are_cached():
+    response = CompiledResponse("{0:int} {1}")
+    params = response.params
+    assert list(params) == ["int_0", "text_final"]
+    assert response.params is params
+
+
+async def test_cc_command_renders_compiled_response(customcom):
+    message = namedtuple("Message", "author channel guild")("Author", "general", "Guild")
+    ctx = _FakeContext(message)
+    await customcom.cc_command(
+        ctx, "one", "two", raw_response=CompiledResponse("{author}: {0} {1} {{0}}")
+    )
+    assert ctx.sent == ["Author: one two {one}"]
+
+
+async def test_command_cache_follows_config(customcom, empty_guild):
+    await customcom.config.guild(empty_guild).commands.set_raw(
+        "hello", value={"response": ["Hello {0}", "Hi {0}"], "cooldowns": {"member": 5}}
+    )
+    await customcom.commandobj.load_commands()
+
+    cached = customcom.commandobj.get_cached(empty_guild, "hello")
+    assert [r.raw for r in cached.responses] == ["Hello {0}", "Hi {0}"]
+    assert cached.cooldowns == {"member": 5}
+
+    customcom.commandobj._update_cache(empty_guild.id, "hello", None)
+    with pytest.raises(NotFound):
+        customcom.commandobj.get_cached(empty_guild, "hello")
+    assert customcom.commandobj.has_commands(empty_guild) is False
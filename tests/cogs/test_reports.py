@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+from redbot.pytest.reports import *
+
+
+class _FakeBot:
+    def __init__(self):
+        self.disabled_checks = 0
+
+    async def cog_disabled_in_guild(self, cog, guild):
+        self.disabled_checks += 1
+        return False
+
+
+class _FakeGuild:
+    id = 1
+
+
+def _tunnel(origin_id, sender_id, recipient_id):
+    return SimpleNamespace(
+        origin=SimpleNamespace(id=origin_id),
+        sender=SimpleNamespace(id=sender_id),
+        recipient=SimpleNamespace(id=recipient_id),
+    )
+
+
+def _message(*, channel_id, author_id, guild=None):
+    return SimpleNamespace(
+        channel=SimpleNamespace(id=channel_id), author=SimpleNamespace(id=author_id), guild=guild
+    )
+
+
+def test_tunnel_routes(reports):
+    guild = _FakeGuild()
+    key = (guild, 1)
+    reports._add_tunnel(key, _tunnel(10, 20, 30), [100, 101])
+
+    assert reports._route_message(_message(channel_id=10, author_id=20, guild=guild)) == [key]
+    assert reports._route_message(_message(channel_id=10, author_id=21, guild=guild)) == []
+    assert reports._route_message(_message(channel_id=11, author_id=20, guild=guild)) == []
+    assert reports._route_message(_message(channel_id=50, author_id=30)) == [key]
+    assert reports._route_message(_message(channel_id=50, author_id=31)) == []
+
+    reports._set_tunnel_messages(key, [102, 103])
+    assert reports._message_routes == {102: key, 103: key}
+
+    assert reports._remove_tunnel(key)["msgs"] == [102, 103]
+    assert reports.tunnel_store == {}
+    assert reports._channel_routes == {}
+    assert reports._dm_routes == {}
+    assert reports._message_routes == {}
+
+
+async def test_unrelated_messages_are_dismissed(reports):
+    reports.bot = _FakeBot()
+    guild = _FakeGuild()
+    reports._add_tunnel((guild, 1), _tunnel(10, 20, 30), [100])
+
+    await reports.on_message(_message(channel_id=11, author_id=20, guild=guild))
+    await reports.on_message(_message(channel_id=50, author_id=31))
+    assert reports.bot.disabled_checks == 0
@@ -0,0 +1,227 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from redbot.cogs.streams import streamtypes
+from redbot.cogs.streams.errors import OfflineStream, StreamNotFound
+from redbot.cogs.streams.poller import StreamPoller
+from redbot.cogs.streams.streamtypes import BoundedSet, TwitchStream, YoutubeStream
+
+USERS = {f"user{i}": str(i) for i in range(150)}
+LIVE = {"3", "120"}
+
+
+@pytest.fixture()
+async def fake_twitch(monkeypatch):
+    requests = []
+
+    async def users(request):
+        requests.append(("users", len(request.query.getall("login", []))))
+        logins = request.query.getall("login", [])
+        data = [
+            {"id": USERS[login], "login": login, "profile_image_url": None, "view_count": 0}
+            for login in logins
+            if login in USERS
+        ]
+        return web.json_response({"data": data})
+
+    async def streams(request):
+        user_ids = request.query.getall("user_id", [])
+        requests.append(("streams", len(user_ids)))
+        await asyncio.sleep(0.01)
+        data = [
+            {
+                "user_id": user_id,
+                "user_name": f"User {user_id}",
+                "game_name": "",
+                "thumbnail_url": "",
+                "title": "Live!",
+                "type": "live",
+            }
+            for user_id in user_ids
+            if user_id in LIVE
+        ]
+        return web.json_response({"data": data})
+
+    async def follows(request):
+        return web.json_response({"total": 5})
+
+    app = web.Application()
+    app.router.add_get("/helix/users", users)
+    app.router.add_get("/helix/streams/", streams)
+    app.router.add_get("/helix/users/follows", follows)
+    server = TestServer(app)
+    await server.start_server()
+    base = str(server.make_url("/helix"))
+    monkeypatch.setattr(streamtypes, "TWITCH_ID_ENDPOINT", base + "/users")
+    monkeypatch.setattr(streamtypes, "TWITCH_STREAMS_ENDPOINT", base + "/streams/")
+    monkeypatch.setattr(streamtypes, "TWITCH_FOLLOWS_ENDPOINT", base + "/users/follows")
+    yield requests
+    await server.close()
+
+
+async def test_poller_batches_twitch_requests(fake_twitch):
+    streams = [TwitchStream(_bot=None, name=login) for login in USERS]
+    streams.append(TwitchStream(_bot=None, name="missing"))
+    async with aiohttp.ClientSession() as session:
+        poller = StreamPoller(session)
+        results = await poller.poll(streams, twitch_token="client_id")
+
+    online = {stream.name for stream, result in results.items() if isinstance(result, tuple)}
+    assert online == {"user3", "user120"}
+    assert isinstance(results[streams[0]], OfflineStream)
+    assert isinstance(results[streams[-1]], StreamNotFound)
+
+    # one batch of logins over the limit, then the streams of every resolved user id
+    assert [r for r in fake_twitch if r[0] == "streams" and r[1] > 1] == [
+        ("streams", 100),
+        ("streams", 50),
+    ]
+    assert ("users", 100) in fake_twitch and ("users", 51) in fake_twitch
+
+    stats = poller.last_stats
+    assert stats.checked["TwitchStream"] == 151
+    assert stats.online["TwitchStream"] == 2
+    assert stats.failed["TwitchStream"] == 1
+    assert stats.twitch_batches == 4
+
+
+def test_bounded_set():
+    seen = BoundedSet(["a", "b"], maxlen=3)
+    seen.add("c")
+    seen.add("a")
+    seen.add("d")
+    assert list(seen) == ["b", "c", "d"]
+    assert "a" not in seen and seen.last() == "d"
+
+
+async def test_youtube_batches_video_checks(monkeypatch):
+    video_ids = [f"video{i:02}" for i in range(15)]
+    feed = (
+        '<feed xmlns="http://www.w3.org/2005/Atom"'
+        ' xmlns:yt="http://www.youtube.com/xml/schemas/2015">'
+        + "".join(f"<entry><yt:videoId>{v}</yt:videoId></entry>" for v in video_ids)
+        + "</feed>"
+    )
+    requests = []
+
+    async def rss(request):
+        requests.append("rss")
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text=feed, headers={"ETag": '"v1"'})
+
+    async def videos(request):
+        ids = request.query["id"].split(",")
+        requests.append(("videos", len(ids)))
+        items = [
+            {
+                "id": video_id,
+                "snippet": {
+                    "title": "Live!",
+                    "channelTitle": "Channel",
+                    "thumbnails": {"medium": {"url": "https://example.com/thumb.png"}},
+                },
+                "liveStreamingDetails": (
+                    {"actualStartTime": "2023-01-01T00:00:00Z"} if video_id == "video03" else {}
+                ),
+            }
+            for video_id in ids
+            if video_id != "video07"
+        ]
+        return web.json_response({"items": items})
+
+    app = web.Application()
+    app.router.add_get("/feed", rss)
+    app.router.add_get("/videos", videos)
+    server = TestServer(app)
+    await server.start_server()
+    monkeypatch.setattr(
+        streamtypes, "YOUTUBE_CHANNEL_RSS", str(server.make_url("/feed")) + "?id={channel_id}"
+    )
+    monkeypatch.setattr(streamtypes, "YOUTUBE_VIDEOS_ENDPOINT", str(server.make_url("/videos")))
+    monkeypatch.setattr(streamtypes, "YOUTUBE_MAX_VIDEOS_PER_REQUEST", 10)
+    try:
+        async with aiohttp.ClientSession() as session:
+            stream = YoutubeStream(
+                _bot=None,
+                _session=session,
+                id="channel",
+                name="Channel",
+                token={"api_key": "key"},
+                config=None,
+            )
+            embed, is_schedule = await stream.is_online()
+            assert embed.title == "Live!" and is_schedule is False
+            assert requests == ["rss", ("videos", 10), ("videos", 5)]
+            assert len(stream.not_livestreams) == 14 and list(stream.livestreams) == ["video03"]
+
+            # unchanged feed, only the live video is checked again
+            requests.clear()
+            await stream.is_online()
+            assert requests == ["rss", ("videos", 1)]
+            assert stream.export()["not_livestreams"] == list(stream.not_livestreams)
+    finally:
+        await server.close()
+
+
+class _FakeBot:
+    async def get_shared_api_tokens(self, service_name):
+        return {}
+
+
+@pytest.fixture()
+async def streams_cog(config, monkeypatch):
+    from redbot.cogs.streams import Streams
+    from redbot.core import Config
+
+    with monkeypatch.context() as m:
+        m.setattr(Config, "get_conf", lambda *args, **kwargs: config)
+        cog = Streams(_FakeBot())
+    yield cog
+    await cog.session.close()
+
+
+async def test_streams_migrate_and_save_incrementally(streams_cog, monkeypatch):
+    legacy = [
+        TwitchStream(_bot=None, name="user1", id="1", channels=[10]).export(),
+        TwitchStream(_bot=None, name="user2", channels=[20]).export(),
+    ]
+    await streams_cog.config.streams.set(legacy)
+
+    streams_cog.streams = await streams_cog.load_streams()
+    assert await streams_cog.config.streams() == []
+    assert {s.name for s in streams_cog.streams} == {"user1", "user2"}
+    stored = await streams_cog.config.custom("STREAMS", "TwitchStream").all()
+    assert set(stored) == {"1", "name:user2"}
+
+    written = []
+    custom = streams_cog.config.custom
+
+    def record(*identifiers):
+        if len(identifiers) == 3:
+            written.append(identifiers[1:])
+        return custom(*identifiers)
+
+    monkeypatch.setattr(streams_cog.config, "custom", record)
+
+    await streams_cog.save_streams()
+    assert written == []
+
+    user1 = next(s for s in streams_cog.streams if s.name == "user1")
+    user1.channels.append(11)
+    await streams_cog.save_streams()
+    assert written == [("TwitchStream", "1")]
+
+    # resolving the id of a stream moves it to its new key
+    written.clear()
+    user2 = next(s for s in streams_cog.streams if s.name == "user2")
+    user2.id = "2"
+    await streams_cog.save_streams()
+    assert sorted(written) == [("TwitchStream", "2"), ("TwitchStream", "name:user2")]
+    stored = await custom("STREAMS", "TwitchStream").all()
+    assert set(stored) == {"1", "2"}
+    assert stored["1"]["channels"] == [10, 11]
@@ -76,3 +76,65 @@ def test_trivia_schema_error_messages(data: Any, error_msg: str):
         TRIVIA_LIST_SCHEMA.validate(data)
 
     assert format_schema_error(exc.value) == error_msg
+
+
+@pytest.mark.parametrize(
+    "guess,expected",
+    (
+        ("it's paris", True),
+        ("PARIS!", False),
+        ("I think it is new york city", True),
+        ("new  york", False),
+        ("Yes", True),
+        ("berlin", False),
+    ),
+)
+def test_trivia_answer_matcher(guess: str, expected: bool):
+    from redbot.cogs.trivia.session import _AnswerMatcher
+
+    matcher = _AnswerMatcher(("Paris", "New York", "yes"))
+    assert matcher.matches(guess) is expected
+
+
+def test_trivia_catalog_caches_lists(tmp_path):
+    from redbot.cogs.trivia import get_list
+    from redbot.cogs.trivia.catalog import TriviaCatalog
+
+    core_path = tmp_path / "core"
+    custom_path = tmp_path / "custom"
+    core_path.mkdir()
+    custom_path.mkdir()
+    (core_path / "capitals.yaml").write_text("AUTHOR: Red\nFrance:\n- Paris\n", encoding="utf-8")
+    calls = []
+
+    def loader(path):
+        calls.append(path.stem)
+        return get_list(path)
+
+    catalog = TriviaCatalog(core_path, custom_path, tmp_path / "cache", loader=loader)
+    catalog.refresh()
+    assert [info.name for info in catalog.all_lists()] == ["capitals"]
+    assert catalog.get_info("capitals").question_count is None
+
+    assert catalog.get_list("capitals") == {"AUTHOR": "Red", "France": ["Paris"]}
+    assert catalog.get_list("capitals") == {"AUTHOR": "Red", "France": ["Paris"]}
+    assert calls == ["capitals"]
+
+    # a new catalog reuses the parsed list as long as the file is unchanged
+    catalog = TriviaCatalog(core_path, custom_path, tmp_path / "cache", loader=loader)
+    catalog.refresh()
+    info = catalog.get_info("capitals")
+    assert (info.author, info.question_count) == ("Red", 1)
+    catalog.get_list("capitals")
+    assert calls == ["capitals"]
+
+    (core_path / "capitals.yaml").write_text("France:\n- Paris\nItaly:\n- Rome\n")
+    assert catalog.get_list("capitals") == {"France": ["Paris"], "Italy": ["Rome"]}
+    assert calls == ["capitals", "capitals"]
+
+    custom_file = custom_path / "mine.yaml"
+    custom_file.write_text("Q:\n- A\n", encoding="utf-8")
+    catalog.add(custom_file, {"Q": ["A"]})
+    assert [info.name for info in catalog.custom_lists()] == ["mine"]
+    catalog.remove("mine")
+    assert catalog.get_info("mine") is None
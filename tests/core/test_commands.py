@@ -1,12 +1,13 @@
 import inspect
 import datetime
+from types import SimpleNamespace
 from dateutil.relativedelta import relativedelta
 
 import pytest
 from discord.ext import commands as dpy_commands
 
 from redbot.core import commands
-from redbot.core.commands import converter
+from redbot.core.commands import PrivilegeLevel, converter
 
 
 @pytest.fixture(scope="session")
@@ -69,3 +70,25 @@ def test_converter_relativedelta():
     assert converter.parse_relativedelta("1 year 10 days 3 seconds") == relativedelta(
         years=1, days=10, seconds=3
     )
+
+
+async def test_privileged_role_cache(red):
+    cache = red._privileged_role_cache
+    assert await cache.get_admin_roles(1) == ()
+    assert await cache.add_admin_role(1, 10)
+    assert not await cache.add_admin_role(1, 10)
+    assert await red._config.guild_from_id(1).admin_role() == [10]
+    assert await red.get_admin_role_ids(1) == [10]
+    assert await cache.add_mod_role(1, 20)
+    assert await cache.remove_admin_role(1, 10)
+    assert not await cache.remove_admin_role(1, 10)
+    assert await cache.get_admin_roles(1) == ()
+    assert await red.get_mod_role_ids(1) == [20]
+
+
+async def test_privilege_level_is_memoized(red, mocker):
+    is_owner = mocker.patch.object(red, "is_owner", autospec=True, return_value=True)
+    ctx = SimpleNamespace(bot=red, author=object(), guild=None)
+    assert await PrivilegeLevel.from_ctx(ctx) is PrivilegeLevel.BOT_OWNER
+    assert await PrivilegeLevel.from_ctx(ctx) is PrivilegeLevel.BOT_OWNER
+    is_owner.assert_called_once()
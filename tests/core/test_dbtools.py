@@ -0,0 +1,72 @@
+import asyncio
+
+import apsw
+import pytest
+
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
+
+
+@pytest.fixture()
+async def threaded_db(tmp_path):
+    db = ThreadedAPSWConnection(
+        tmp_path / "test.db", setup_statements=("PRAGMA journal_mode = wal;",)
+    )
+    await db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT UNIQUE)")
+    yield db
+    await db.close()
+
+
+async def test_writes_are_group_committed(threaded_db):
+    commits = threaded_db.commits
+    await asyncio.gather(
+        *(threaded_db.execute("INSERT INTO items (name) VALUES (?)", (str(i),)) for i in range(50))
+    )
+    assert threaded_db.commits - commits < 50
+    assert await threaded_db.fetchone("SELECT count(*) FROM items") == (50,)
+
+
+async def test_failed_write_does_not_affect_others(threaded_db):
+    results = await asyncio.gather(
+        threaded_db.execute("INSERT INTO items (name) VALUES ('a')"),
+        threaded_db.execute("INSERT INTO items (name) VALUES ('a')"),
+        threaded_db.executemany("INSERT INTO items (name) VALUES (?)", [("b",), ("c",)]),
+        threaded_db.executemany("INSERT INTO items (name) VALUES (?)", [("d",), ("b",)]),
+        return_exceptions=True,
+    )
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], apsw.ConstraintError)
+    assert isinstance(results[3], apsw.ConstraintError)
+    rows = await threaded_db.fetch("SELECT name FROM items ORDER BY name")
+    assert rows == [("a",), ("b",), ("c",)]
+
+
+async def test_close_commits_queued_writes(tmp_path):
+    db = ThreadedAPSWConnection(tmp_path / "test.db")
+    await db.execute("CREATE TABLE items (name TEXT)")
+    task = asyncio.create_task(db.execute("INSERT INTO items VALUES ('queued')"))
+    await asyncio.sleep(0)
+    await db.close()
+    await task
+    with pytest.raises(RuntimeError):
+        await db.fetch("SELECT * FROM items")
+
+    conn = apsw.Connection(str(tmp_path / "test.db"))
+    assert list(conn.cursor().execute("SELECT name FROM items")) == [("queued",)]
+    conn.close()
+
+
+async def test_execute_batch_is_atomic(threaded_db):
+    await threaded_db.execute_batch(
+        [
+            ("INSERT INTO items (name) VALUES (?)", [("a",), ("b",)]),
+            ("DELETE FROM items WHERE name = ?", [("a",)]),
+        ]
+    )
+    with pytest.raises(apsw.ConstraintError):
+        await threaded_db.execute_batch(
+            [
+                ("INSERT INTO items (name) VALUES (?)", [("c",)]),
+                ("INSERT INTO items (name) VALUES (?)", [("b",)]),
+            ]
+        )
+    assert await threaded_db.fetch("SELECT name FROM items") == [("b",)]
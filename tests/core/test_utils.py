@@ -1,7 +1,12 @@
+import aiohttp
 import asyncio
+import contextlib
+import io
 import pytest
 import operator
 import random
+import rapidfuzz
+from types import SimpleNamespace
 from redbot.core.utils import (
     bounded_gather,
     bounded_gather_iter,
@@ -9,6 +14,8 @@ from redbot.core.utils import (
     common_filters,
 )
 from redbot.core.utils.chat_formatting import pagify
+from redbot.core.utils._internal_utils import FuzzyIndex, _get_command_index
+from redbot.core.utils import tunnel
 from typing import List
 
 
@@ -258,3 +265,118 @@ def test_pagify_length_hint():
         assert operator.length_hint(it) == remaining
 
     assert operator.length_hint(it) == 0
+
+
+def test_fuzzy_index_search():
+    index = FuzzyIndex({1: "playlist", 2: "play", 3: "ping", 4: "set prefix"})
+    results = index.search("playlst", scorer=rapidfuzz.fuzz.QRatio, min_score=80)
+    assert [value for __, __, value in results] == [1]
+    assert index.search("set prefx", limit=1)[0][0] == "set prefix"
+    # short queries are matched against every name
+    assert {value for __, __, value in index.search("pl")} >= {1, 2}
+
+
+def test_command_index_tracks_subcommands(red, coroutine):
+    def names():
+        return {c.qualified_name for c in _get_command_index(red)._values}
+
+    grp = red.group(name="fuzzygroup")(coroutine)
+    assert "fuzzygroup" in names()
+    grp.command(name="sub")(coroutine)
+    assert "fuzzygroup sub" in names()
+    index = _get_command_index(red)
+    assert _get_command_index(red) is index
+    grp.remove_command("sub")
+    assert "fuzzygroup sub" not in names()
+
+
+async def test_tunnel_spool_attachments(monkeypatch):
+    status = [0, 0]  # num_running, max_running
+
+    def make_attachment(name):
+        async def read(*, use_cached=False):
+            status[0] += 1
+            status[1] = max(status)
+            await asyncio.sleep(0.01)
+            status[0] -= 1
+            return name.encode() * 1000
+
+        return SimpleNamespace(
+            read=read,
+            filename=f"{name}.txt",
+            description=None,
+            size=len(name) * 1000,
+            height=None,
+            is_spoiler=lambda: False,
+        )
+
+    monkeypatch.setattr(tunnel, "_SPOOL_MAX_MEMORY", 2000)
+    attachments = [make_attachment(name) for name in ("a", "bbb", "cc", "d", "e", "f")]
+    spooled = await tunnel.Tunnel.spool_attachments(SimpleNamespace(attachments=attachments))
+
+    with spooled:
+        assert len(spooled) == 6
+        assert status[1] == tunnel._DOWNLOAD_CONCURRENCY
+        # the big attachment was moved out of memory
+        assert [isinstance(fp, io.BytesIO) for fp in spooled._fps] == [
+            True,
+            False,
+            True,
+            True,
+            True,
+            True,
+        ]
+        for _ in range(2):
+            files = spooled.to_files()
+            assert [f.filename for f in files] == [a.filename for a in attachments]
+            assert files[1].fp.read() == b"bbb" * 1000
+            for f in files:
+                f.close()
+    assert not spooled
+
+
+async def test_tunnel_spool_attachments_streamed(mocker, monkeypatch):
+    chunks = [b"a" * 1500, b"b" * 1500]
+
+    @contextlib.asynccontextmanager
+    async def get(self, url):
+        assert url == "https://cdn/a.txt"
+
+        async def iter_chunked(size):
+            for chunk in chunks:
+                yield chunk
+
+        yield SimpleNamespace(status=200, content=SimpleNamespace(iter_chunked=iter_chunked))
+
+    async def read(*, use_cached=False):
+        raise AssertionError("the attachment should be streamed")
+
+    monkeypatch.setattr(tunnel, "_SPOOL_MAX_MEMORY", 2000)
+    mocker.patch.object(aiohttp.ClientSession, "get", get)
+    async with aiohttp.ClientSession() as session:
+        attachment = SimpleNamespace(
+            _http=SimpleNamespace(_HTTPClient__session=session),
+            read=read,
+            url="https://cdn/a.txt",
+            filename="a.txt",
+            description=None,
+            size=3000,
+            height=None,
+            is_spoiler=lambda: False,
+        )
+        spooled = await tunnel.Tunnel.spool_attachments(SimpleNamespace(attachments=[attachment]))
+
+    with spooled:
+        # rolled over to a temporary file, which discord.File accepts as a file object
+        assert not isinstance(spooled._fps[0], io.BytesIO)
+        (file,) = spooled.to_files()
+        assert isinstance(file.fp, io.IOBase)
+        assert file.fp.read() == b"".join(chunks)
+        file.close()
+
+
+async def test_tunnel_spool_attachments_too_large():
+    attachment = SimpleNamespace(size=tunnel._MAX_ATTACHMENTS_SIZE + 1, height=None)
+    spooled = await tunnel.Tunnel.spool_attachments(SimpleNamespace(attachments=[attachment]))
+    assert not spooled
+    assert await tunnel.Tunnel.files_from_attach(SimpleNamespace(attachments=[])) == []
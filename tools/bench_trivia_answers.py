@@ -0,0 +1,74 @@
+#!/usr/bin/env python3.8
+"""Benchmark for the trivia answer predicate.
+
+Simulates a busy trivia channel: every question gets a burst of guesses
+which are all run through the predicate returned by `TriviaSession.check_answer`,
+the same way ``bot.wait_for("message", check=...)`` would run them.
+
+Usage::
+
+    python tools/bench_trivia_answers.py [--guesses N] [--questions N]
+"""
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+from redbot.cogs.trivia import get_core_lists, get_list
+from redbot.cogs.trivia.session import TriviaSession, _parse_answers
+
+WORDS = (
+    "the of and a to in is you that it he was for on are as with his they I at be this "
+    "have from or one had by word but not what all were we when your can said there"
+).split()
+
+
+def make_guesses(answers, count):
+    guesses = []
+    for _ in range(count):
+        guess = " ".join(random.choices(WORDS, k=random.randint(1, 8)))
+        if random.random() < 0.01:
+            guess += " " + random.choice(answers)
+        guesses.append(SimpleNamespace(content=guess, channel=CHANNEL, author=AUTHOR))
+    return guesses
+
+
+CHANNEL = SimpleNamespace(id=1)
+AUTHOR = object()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--guesses", type=int, default=500, help="guesses per question")
+    parser.add_argument("--questions", type=int, default=200, help="number of questions")
+    args = parser.parse_args()
+
+    questions = []
+    for path in get_core_lists():
+        questions.extend(
+            (question, _parse_answers(answers))
+            for question, answers in get_list(path).items()
+            if question not in ("AUTHOR", "CONFIG", "DESCRIPTION")
+        )
+    questions = random.sample(questions, min(args.questions, len(questions)))
+
+    ctx = SimpleNamespace(channel=CHANNEL, guild=SimpleNamespace(me=object()))
+    session = TriviaSession(ctx, {}, {})
+    workload = [(answers, make_guesses(answers, args.guesses)) for __, answers in questions]
+
+    start = time.perf_counter()
+    matched = 0
+    for answers, guesses in workload:
+        predicate = session.check_answer(answers)
+        matched += sum(map(predicate, guesses))
+    elapsed = time.perf_counter() - start
+
+    total = len(workload) * args.guesses
+    print(
+        f"{total} guesses over {len(workload)} questions in {elapsed:.3f}s"
+        f" ({total / elapsed:,.0f} guesses/s, {matched} matched)"
+    )
+
+
+if __name__ == "__main__":
+    main()